@@ -0,0 +1,100 @@
+import os
+import sys
+import json
+import time
+import statistics
+import tracemalloc
+import django
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_api.settings')
+django.setup()
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from portfolio.datagen import PortfolioGenerator
+from portfolio.fast_serializers import serialize_values
+from portfolio.models import Profile, Skill, Project
+from portfolio.serializers import SkillSerializer, ProjectSerializer
+from rest_framework.utils.encoders import JSONEncoder
+
+SIZES = [100, 1000, 10000]
+RUNS = 5
+ACTIONS = ['/api/skills/top/', '/api/projects/featured/', '/api/projects/technologies/']
+
+
+def legacy_top(profile):
+    """skills/top before pagination: every advanced/expert skill serialized"""
+    return serialize_values(SkillSerializer, Skill.objects.filter(profile=profile, proficiency__in=['advanced', 'expert']))
+
+
+def legacy_featured(profile):
+    """projects/featured before pagination: every project with achievements serialized"""
+    return serialize_values(ProjectSerializer, Project.objects.filter(profile=profile).exclude(achievements=''))
+
+
+LEGACY = {
+    '/api/skills/top/': legacy_top,
+    '/api/projects/featured/': legacy_featured,
+}
+
+
+def seed_profile(size):
+    """One generated profile with ``size`` projects and ``size`` skills"""
+    generator = PortfolioGenerator(seed=42, counts={'projects': (size, size), 'skills': (size, size)})
+    generator.generate(1)
+    return Profile.objects.latest('id')
+
+
+def measure(func):
+    """(queries, median ms, peak KiB, result) over RUNS calls of ``func``"""
+    cache = caches[getattr(settings, 'PORTFOLIO_CACHE_ALIAS', 'default')]
+    timings = []
+    peaks = []
+    for _ in range(RUNS):
+        cache.clear()
+        tracemalloc.start()
+        with CaptureQueriesContext(connection) as ctx:
+            started = time.perf_counter()
+            result = func()
+            timings.append((time.perf_counter() - started) * 1000)
+        peaks.append(tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+    return len(ctx), statistics.median(timings), max(peaks), result
+
+
+def run_benchmark(sizes):
+    client = Client()
+    print(f"{'size':>7} {'action':<30} {'impl':>10} {'queries':>8} {'median ms':>10} {'peak KiB':>10} {'bytes':>9}")
+    for size in sizes:
+        profile = seed_profile(size)
+        try:
+            for path in ACTIONS:
+                url = f'{path}?profile={profile.slug}'
+                cases = [('paginated', lambda: client.get(url, secure=True, HTTP_ACCEPT='application/json'))]
+                if path in LEGACY:
+                    cases.insert(0, ('legacy', lambda: LEGACY[path](profile)))
+                for label, func in cases:
+                    queries, median_ms, peak, result = measure(func)
+                    body = result.content if hasattr(result, 'content') else json.dumps(result, cls=JSONEncoder)
+                    size_bytes = len(body)
+                    print(f"{size:>7} {path:<30} {label:>10} {queries:>8} {median_ms:>10.2f} "
+                          f"{peak:>10.0f} {size_bytes:>9}")
+        finally:
+            profile.delete()
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    # Seeds and measures in a throwaway test database, never the real one
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        print(f"Database: {connection.vendor}")
+        run_benchmark(sizes)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
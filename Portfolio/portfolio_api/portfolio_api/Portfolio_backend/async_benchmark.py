@@ -0,0 +1,128 @@
+import os
+import json
+import time
+import asyncio
+import argparse
+import statistics
+import django
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_api.settings')
+django.setup()
+
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+from django.core.cache import caches
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.test.utils import setup_test_environment, teardown_test_environment
+from portfolio.datagen import PortfolioGenerator
+from portfolio.search import get_search_backend
+
+# (label, sequential path, concurrent path, query string)
+CASES = [
+    ('search', '/api/search/', '/api/search/async/', 'q=python'),
+    ('stats', '/api/stats/', '/api/stats/async/', ''),
+]
+
+
+class SlowDatabase:
+    """execute_wrapper adding a fixed delay to every statement, like a remote database"""
+
+    def __init__(self, delay):
+        self.delay = delay
+
+    def __call__(self, execute, sql, params, many, context):
+        time.sleep(self.delay)
+        return execute(sql, params, many, context)
+
+    def install(self):
+        # Worker threads open their own connections, so hook each new one
+        connection.execute_wrappers.append(self)
+        connection_created.connect(self.on_connection_created, weak=False)
+
+    def on_connection_created(self, sender, connection, **kwargs):
+        if self not in connection.execute_wrappers:
+            connection.execute_wrappers.append(self)
+
+
+async def asgi_get(app, path, query_string):
+    """Call the ASGI application with the scope uvicorn would build for a GET"""
+    scope = {
+        'type': 'http',
+        'asgi': {'version': '3.0', 'spec_version': '2.3'},
+        'http_version': '1.1',
+        'method': 'GET',
+        'scheme': 'https',
+        'path': path,
+        'raw_path': path.encode(),
+        'query_string': query_string.encode(),
+        'root_path': '',
+        'headers': [(b'host', b'localhost'), (b'accept', b'application/json')],
+        'client': ('127.0.0.1', 50000),
+        'server': ('localhost', 443),
+    }
+    messages = []
+
+    async def receive():
+        return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+    async def send(message):
+        messages.append(message)
+
+    await app(scope, receive, send)
+    status = next(message['status'] for message in messages if message['type'] == 'http.response.start')
+    body = b''.join(message.get('body', b'') for message in messages if message['type'] == 'http.response.body')
+    return status, body
+
+
+async def measure(app, path, query_string, runs):
+    cache = caches[getattr(settings, 'PORTFOLIO_CACHE_ALIAS', 'default')]
+    timings = []
+    body = b''
+    for _ in range(runs):
+        cache.clear()
+        started = time.perf_counter()
+        status, body = await asgi_get(app, path, query_string)
+        timings.append((time.perf_counter() - started) * 1000)
+        if status != 200:
+            raise RuntimeError(f'{path}?{query_string} returned {status}: {body[:200]!r}')
+    return statistics.median(timings), max(timings), json.loads(body)
+
+
+async def run_benchmark(app, runs):
+    print(f"{'endpoint':<10} {'mode':<12} {'median ms':>10} {'max ms':>9} {'partial':>8}")
+    for label, sequential, concurrent, query_string in CASES:
+        for mode, path in [('sequential', sequential), ('concurrent', concurrent)]:
+            median_ms, max_ms, payload = await measure(app, path, query_string, runs)
+            partial = ','.join(payload.get('timed_out', [])) or '-'
+            print(f"{label:<10} {mode:<12} {median_ms:>10.1f} {max_ms:>9.1f} {partial:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Sequential vs concurrent search/stats over ASGI with a slow database')
+    parser.add_argument('--profiles', type=int, default=200)
+    parser.add_argument('--delay-ms', type=float, default=20.0, help='Latency added to every SQL statement')
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--timeout', type=float, help='Override PORTFOLIO_ASYNC_SOURCE_TIMEOUT (seconds)')
+    args = parser.parse_args()
+
+    if args.timeout is not None:
+        settings.PORTFOLIO_ASYNC_SOURCE_TIMEOUT = args.timeout
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        PortfolioGenerator(seed=42).generate(args.profiles)
+        get_search_backend().rebuild()
+        SlowDatabase(args.delay_ms / 1000).install()
+        print(f"Database: {connection.vendor}, {args.profiles} profiles, +{args.delay_ms:.0f}ms per query, "
+              f"source timeout {settings.PORTFOLIO_ASYNC_SOURCE_TIMEOUT}s")
+        asyncio.run(run_benchmark(get_asgi_application(), args.runs))
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+if __name__ == '__main__':
+    main()
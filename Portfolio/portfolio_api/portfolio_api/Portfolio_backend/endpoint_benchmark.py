@@ -0,0 +1,238 @@
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+from datetime import datetime, timezone
+import django
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_api.settings')
+django.setup()
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.db.backends.utils import CursorDebugWrapper
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from django.urls import URLPattern, reverse
+from portfolio import urls as portfolio_urls
+from portfolio.datagen import PortfolioGenerator
+from portfolio.models import Profile
+from portfolio.search import get_search_backend
+
+# Query strings for routes that need one, and extra variants worth tracking
+ROUTE_PARAMS = {
+    'search': '?q=python',
+    'search_async': '?q=python',
+    'autocomplete': '?q=py',
+}
+# JSON bodies for POST-only routes, which are benchmarked with a POST of that body
+ROUTE_BODIES = {
+    'match': {'description': 'Backend engineer: Python, Django, PostgreSQL, Redis and Kafka, '
+                             'building REST APIs and data pipelines on AWS'},
+}
+EXTRA_CASES = [
+    ('project-list', '?skill=Python'),
+    ('project-list', '?pagination=cursor'),
+    ('skill-list', '?category=programming'),
+]
+
+
+class RowCounter:
+    """Counts rows handed back by fetchone/fetchmany/fetchall on debug cursors"""
+
+    def __init__(self):
+        self.rows = 0
+
+
+row_counter = RowCounter()
+
+
+class RowCountingCursor(CursorDebugWrapper):
+    def fetchone(self):
+        row = self.cursor.fetchone()
+        if row is not None:
+            row_counter.rows += 1
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self.cursor.fetchmany(*args, **kwargs)
+        row_counter.rows += len(rows)
+        return rows
+
+    def fetchall(self):
+        rows = self.cursor.fetchall()
+        row_counter.rows += len(rows)
+        return rows
+
+
+def sample_pk(viewset):
+    model = viewset.queryset.model
+    return model.objects.order_by('pk').values_list('pk', flat=True).first()
+
+
+def discover_routes():
+    """Every read route in porfolio/urls.py as (name, url); see send() for POST-only ones"""
+    routes = []
+    for pattern in portfolio_urls.router.urls:
+        if 'format' in pattern.pattern.regex.groupindex:
+            continue
+        actions = getattr(pattern.callback, 'actions', None) or {'get': 'root'}
+        if 'get' not in actions:
+            continue
+        kwargs = {}
+        if 'pk' in pattern.pattern.regex.groupindex:
+            pk = sample_pk(pattern.callback.cls)
+            if pk is None:
+                continue
+            kwargs['pk'] = pk
+        routes.append((pattern.name, reverse(pattern.name, kwargs=kwargs)))
+    for pattern in portfolio_urls.urlpatterns:
+        if isinstance(pattern, URLPattern) and pattern.name:
+            routes.append((pattern.name, reverse(pattern.name) + ROUTE_PARAMS.get(pattern.name, '')))
+    for name, query in EXTRA_CASES:
+        routes.append((f'{name}{query}', reverse(name) + query))
+    return routes
+
+
+def send(client, name, url):
+    """Request ``url`` the way route ``name`` is served: a POST of its ROUTE_BODIES entry, else a GET"""
+    if name in ROUTE_BODIES:
+        return client.post(url, json.dumps(ROUTE_BODIES[name]), content_type='application/json',
+                           secure=True, HTTP_ACCEPT='application/json')
+    return client.get(url, secure=True, HTTP_ACCEPT='application/json')
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure(client, name, url, runs, warm_cache, warmup=2):
+    cache = caches[getattr(settings, 'PORTFOLIO_CACHE_ALIAS', 'default')]
+    # Untimed requests first so import and first-call costs do not skew p99
+    for _ in range(warmup):
+        send(client, name, url)
+    timings = []
+    queries = rows = size = status = None
+    for _ in range(runs):
+        if not warm_cache:
+            cache.clear()
+        row_counter.rows = 0
+        with CaptureQueriesContext(connection) as ctx:
+            started = time.perf_counter()
+            response = send(client, name, url)
+            # Streamed bodies (exports) only run their queries as they are consumed
+            body = b''.join(response.streaming_content) if response.streaming else response.content
+            timings.append((time.perf_counter() - started) * 1000)
+        queries, rows, size, status = len(ctx), row_counter.rows, len(body), response.status_code
+    return {
+        'status': status,
+        'p50_ms': round(statistics.median(timings), 3),
+        'p95_ms': round(percentile(timings, 95), 3),
+        'p99_ms': round(percentile(timings, 99), 3),
+        'mean_ms': round(statistics.fmean(timings), 3),
+        'queries': queries,
+        'rows': rows,
+        'bytes': size,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(sizes, runs, seed, warm_cache):
+    # Count rows on every cursor the ORM opens while benchmarking
+    connection.make_debug_cursor = lambda cursor: RowCountingCursor(cursor, connection)
+    client = Client()
+    results = {}
+    for size in sorted(sizes):
+        existing = Profile.objects.count()
+        if size > existing:
+            PortfolioGenerator(seed=seed + existing).generate(size - existing)
+            get_search_backend().rebuild()
+        print(f"\nDataset: {size} profiles")
+        print(f"{'route':<42} {'status':>6} {'p50 ms':>9} {'p95 ms':>9} {'queries':>8} {'rows':>8} {'bytes':>9}")
+        results[str(size)] = {}
+        for name, url in discover_routes():
+            result = measure(client, name, url, runs, warm_cache)
+            result['url'] = url
+            results[str(size)][name] = result
+            print(f"{name:<42} {result['status']:>6} {result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} "
+                  f"{result['queries']:>8} {result['rows']:>8} {result['bytes']:>9}")
+    return results
+
+
+def compare(baseline, current, threshold, min_delta_ms):
+    """Return regressions: more queries, or p50 slower by both ``threshold`` and ``min_delta_ms``"""
+    regressions = []
+    for size, routes in current['results'].items():
+        for name, result in routes.items():
+            before = baseline.get('results', {}).get(size, {}).get(name)
+            if not before:
+                continue
+            if result['queries'] > before['queries']:
+                regressions.append(f"{size}/{name}: queries {before['queries']} -> {result['queries']}")
+            slower = result['p50_ms'] - before['p50_ms']
+            if slower > min_delta_ms and slower > before['p50_ms'] * threshold:
+                regressions.append(f"{size}/{name}: p50 {before['p50_ms']}ms -> {result['p50_ms']}ms")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark every read endpoint in porfolio/urls.py in-process')
+    parser.add_argument('--sizes', default='1,100,1000', help='Comma-separated dataset sizes (profiles)')
+    parser.add_argument('--runs', type=int, default=20, help='Requests per endpoint per dataset')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--warm-cache', action='store_true', help='Keep the response cache between runs')
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--compare', help='Baseline results JSON to diff against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Allowed p50 slowdown before failing (0.2 = 20%%)')
+    parser.add_argument('--min-delta-ms', type=float, default=2.0,
+                        help='Ignore p50 slowdowns smaller than this, whatever the ratio')
+    args = parser.parse_args()
+
+    # Benchmark against a throwaway test database, never the real one
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        results = run_suite([int(size) for size in args.sizes.split(',')], args.runs, args.seed, args.warm_cache)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+    report = {
+        'commit': git_commit(),
+        'database': connection.vendor,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'runs': args.runs,
+        'warm_cache': args.warm_cache,
+        'results': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) against {args.compare}:")
+            for regression in regressions:
+                print(f"   {regression}")
+            sys.exit(1)
+        print(f"✅ No regressions against {args.compare}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,230 @@
+import os
+import re
+import sys
+import json
+import argparse
+from urllib.parse import urlsplit
+import django
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_api.settings')
+django.setup()
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from django.urls import reverse
+from portfolio.datagen import PortfolioGenerator
+from portfolio.search import get_search_backend
+from endpoint_benchmark import discover_routes, send
+
+# Filtered reads whose access paths the indexes in models.py are built for.
+# List routes use keyset pagination: page-number COUNT(*)s are full scans by design.
+PLAN_CASES = [
+    ('skill-list', '?pagination=cursor&category=soft_skills'),
+    ('skill-list', '?pagination=cursor&proficiency=expert'),
+    ('skill-list', '?pagination=cursor&min_proficiency=advanced&ordering=-proficiency'),
+    ('project-list', '?pagination=cursor&status=paused'),
+    ('project-list', '?pagination=cursor&technology=kafka'),
+    ('skill-top', '?profile=synthetic-user-1'),
+    ('skill-top', '?profile=synthetic-user-1&limit=5'),
+    ('skill-top', '?profile=synthetic-user-1&per_category=2'),
+    ('stats', '?profile=synthetic-user-1'),
+    ('timeline', '?profile=synthetic-user-1&year_from=2018&year_to=2021'),
+    ('timeline', '?profile=synthetic-user-1&type=work,certification'),
+]
+
+# Keyset-paginated reads checked a few pages in, through their ``next`` links:
+# a ?cursor= page must start an index range at the cursor, not filter up to it
+CURSOR_CASES = [
+    ('skill-list', '?pagination=cursor'),
+    ('skill-list', '?pagination=cursor&category=programming'),
+    ('project-list', '?pagination=cursor'),
+    ('certification-list', '?pagination=cursor'),
+    ('skill-list', '?pagination=cursor&ordering=-proficiency'),
+    ('timeline', '?profile=synthetic-user-1&page_size=5'),
+]
+CURSOR_DEPTH = 3
+
+# Queries expected to scan, as (route name pattern, SQL pattern, reason): only
+# a query matching both is exempt, so anything else a route runs is still checked
+PAGE_COUNT_SCAN = 'page-number pagination counts the whole unfiltered collection; ?pagination=cursor does not'
+EXPORT_SCAN = 'exports stream every row of the collection in id order by design'
+PK_PAGE_SCAN = 'rows in primary-key order are read in key order, stopping at the LIMIT'
+KNOWN_SCANS = [
+    (r'-list$', r'^SELECT COUNT\(\*\) AS "__count" FROM "\w+"$', PAGE_COUNT_SCAN),
+    (r'-export$', r'^SELECT .+ FROM "(\w+)" ORDER BY "\1"\."id" ASC$', EXPORT_SCAN),
+    (r'', r'^SELECT .+ FROM "(\w+)" ORDER BY "\1"\."id" ASC LIMIT \d+( OFFSET \d+)?$', PK_PAGE_SCAN),
+]
+
+SQLITE_SCAN = re.compile(r'^SCAN (\w+)(?! USING)')
+
+
+def large_tables(min_rows):
+    """Model tables holding at least ``min_rows`` rows"""
+    tables = set()
+    for model in apps.get_app_config('portfolio').get_models():
+        if model.objects.count() >= min_rows:
+            tables.add(model._meta.db_table)
+    return tables
+
+
+def explain(sql, max_filter_ratio, min_removed):
+    """
+    Return (plan text, tables read with a sequential scan, tables read through
+    a filter that discards ``max_filter_ratio`` rows or more per row kept).
+
+    The filter check needs the actual row counts of EXPLAIN ANALYZE, so it
+    only runs on PostgreSQL; SQLite plans report scans alone.
+    """
+    with connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            cursor.execute('EXPLAIN (ANALYZE, FORMAT JSON) ' + sql)
+            plan = cursor.fetchone()[0]
+            plan = json.loads(plan) if isinstance(plan, str) else plan
+            scanned = set()
+            filtered = set()
+            nodes = [plan[0]['Plan']]
+            while nodes:
+                node = nodes.pop()
+                if node['Node Type'] == 'Seq Scan':
+                    scanned.add(node['Relation Name'])
+                # Per-loop averages, so scale by loops for the node's totals
+                loops = node.get('Actual Loops', 1)
+                removed = (node.get('Rows Removed by Filter', 0) + node.get('Rows Removed by Index Recheck', 0)) * loops
+                kept = node.get('Actual Rows', 0) * loops
+                if 'Relation Name' in node and removed >= min_removed and removed >= max_filter_ratio * max(kept, 1):
+                    filtered.add(node['Relation Name'])
+                nodes.extend(node.get('Plans', []))
+            return json.dumps(plan, indent=1), scanned, filtered
+        cursor.execute('EXPLAIN QUERY PLAN ' + sql)
+        details = [row[-1] for row in cursor.fetchall()]
+    scanned = {match.group(1) for match in map(SQLITE_SCAN.match, details) if match}
+    return '\n'.join(details), scanned, set()
+
+
+def known_scan(name, sql):
+    """The reason ``sql`` may scan when route ``name`` runs it, or None"""
+    for route, query, reason in KNOWN_SCANS:
+        if re.search(route, name) and re.match(query, sql):
+            return reason
+    return None
+
+
+def cursor_pages(client, cases, depth):
+    """(name, url) of the page ``depth`` next-links past the first page of each case"""
+    routes = []
+    for name, query in cases:
+        url = reverse(name) + query
+        for _ in range(depth):
+            next_url = client.get(url, secure=True, HTTP_ACCEPT='application/json').json().get('next')
+            if not next_url:
+                break
+            url = urlsplit(next_url)._replace(scheme='', netloc='').geturl()
+        else:
+            routes.append((f'{name}{query} (page {depth + 1})', url))
+    return routes
+
+
+def check_route(client, name, url, tables, max_filter_ratio, min_removed):
+    """
+    EXPLAIN every SELECT route ``name`` runs at ``url``; returns
+    [(sql, plan, problems)] where problems lists each scanned large table
+    and each over-filtered table
+    """
+    caches[getattr(settings, 'PORTFOLIO_CACHE_ALIAS', 'default')].clear()
+    with CaptureQueriesContext(connection) as ctx:
+        response = send(client, name, url)
+        if response.streaming:
+            # Streamed bodies only run their queries as they are consumed
+            b''.join(response.streaming_content)
+    results = []
+    seen = set()
+    for query in ctx.captured_queries:
+        sql = query['sql']
+        if sql in seen or not sql.lstrip().upper().startswith('SELECT'):
+            continue
+        seen.add(sql)
+        plan, scanned, filtered = explain(sql, max_filter_ratio, min_removed)
+        problems = [f'{table} (scan)' for table in sorted(scanned & tables)]
+        problems += [f'{table} (filter)' for table in sorted(filtered)]
+        results.append((sql, plan, problems))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='EXPLAIN every endpoint query on a seeded database and fail on sequential scans of '
+                    'large tables or filters that discard most of the rows they read')
+    parser.add_argument('--profiles', type=int, default=2000, help='Profiles to generate before planning')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--min-rows', type=int, default=1000, help='Tables with fewer rows may be scanned')
+    parser.add_argument('--max-filter-ratio', type=float, default=10,
+                        help='Rows a filter may discard per row it keeps (PostgreSQL only)')
+    parser.add_argument('--min-removed', type=int, default=1000,
+                        help='Filters discarding fewer rows than this in total are not flagged')
+    parser.add_argument('--output', help='Write every query and its plan to this JSON file')
+    parser.add_argument('--verbose', action='store_true', help='Print the plan of every query')
+    args = parser.parse_args()
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        PortfolioGenerator(seed=args.seed).generate(args.profiles)
+        get_search_backend().rebuild()
+        with connection.cursor() as cursor:
+            # Fresh statistics, so the planner sees the seeded row counts
+            cursor.execute('ANALYZE')
+        tables = large_tables(args.min_rows)
+        print(f"Database: {connection.vendor}, {args.profiles} profiles, large tables: {', '.join(sorted(tables))}")
+        if connection.vendor != 'postgresql':
+            print('Rows-removed-by-filter checks need EXPLAIN ANALYZE on PostgreSQL; checking scans only')
+
+        client = Client()
+        routes = discover_routes() + [(f'{name}{query}', reverse(name) + query) for name, query in PLAN_CASES]
+        routes += cursor_pages(client, CURSOR_CASES, CURSOR_DEPTH)
+        report = {}
+        failures = []
+        for name, url in routes:
+            results = check_route(client, name, url, tables, args.max_filter_ratio, args.min_removed)
+            report[name] = [{'sql': sql, 'plan': plan, 'problems': problems} for sql, plan, problems in results]
+            flagged = [(sql, plan, problems) for sql, plan, problems in results if problems]
+            unexpected = [(sql, plan) for sql, plan, _ in flagged if not known_scan(name, sql)]
+            reasons = sorted({known_scan(name, sql) for sql, _, _ in flagged} - {None})
+            if unexpected:
+                marker = 'FAIL'
+                failures.append((name, url, unexpected))
+            elif flagged:
+                marker = 'known'
+            else:
+                marker = 'ok'
+            problems = sorted({problem for _, _, problems in flagged for problem in problems})
+            reason = f"  ({'; '.join(reasons)})" if reasons else ''
+            print(f"{name:<52} {len(results):>3} queries  {marker:<5} {', '.join(problems)}{reason}")
+            if args.verbose:
+                for sql, plan, _ in results:
+                    print(f"    {sql}\n      " + plan.replace('\n', '\n      '))
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nPlans written to {args.output}")
+
+    if failures:
+        print(f"\n❌ {len(failures)} route(s) scan a large table or filter out most rows read:")
+        for name, url, queries in failures:
+            print(f"\n{name} ({url})")
+            for sql, plan in queries:
+                print(f"    {sql}\n      " + plan.replace('\n', '\n      '))
+        sys.exit(1)
+    print("\n✅ No unexpected sequential scans or wasteful filters")
+
+
+if __name__ == '__main__':
+    main()
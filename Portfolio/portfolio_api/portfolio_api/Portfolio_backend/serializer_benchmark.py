@@ -0,0 +1,70 @@
+import os
+import sys
+import time
+import statistics
+import django
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_api.settings')
+django.setup()
+
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+from rest_framework.renderers import JSONRenderer
+from portfolio.datagen import PortfolioGenerator
+from portfolio.fast_serializers import values_serializer
+from portfolio.renderers import FastJSONRenderer, orjson
+from portfolio.serializers import (
+    EducationSerializer, SkillSerializer, ProjectSerializer, WorkExperienceSerializer,
+    CertificationSerializer, AchievementSerializer
+)
+
+SERIALIZERS = [EducationSerializer, SkillSerializer, ProjectSerializer, WorkExperienceSerializer,
+               CertificationSerializer, AchievementSerializer]
+PROFILES = 200
+RUNS = 5
+
+
+def best_of(func):
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - started)
+    return min(timings), result
+
+
+def run_benchmark():
+    print(f"{'serializer':<26} {'rows':>6} {'drf us/row':>11} {'values us/row':>14} {'speedup':>8} "
+          f"{'render us/row':>14} {'fast render':>12} {'identical':>10}")
+    for serializer_class in SERIALIZERS:
+        queryset = serializer_class.Meta.model.objects.order_by('pk')
+        fast = values_serializer(serializer_class)
+        # Fetch + serialize, as a list endpoint does
+        drf_time, drf_data = best_of(lambda: serializer_class(list(queryset), many=True).data)
+        fast_time, fast_data = best_of(lambda: fast.many(list(fast.values(queryset))))
+
+        render_time, expected = best_of(lambda: JSONRenderer().render(drf_data))
+        fast_render_time, rendered = best_of(lambda: FastJSONRenderer().render(fast_data))
+        identical = expected == rendered
+
+        rows = len(drf_data)
+        per_row = lambda seconds: seconds / rows * 1e6
+        print(f"{serializer_class.__name__:<26} {rows:>6} {per_row(drf_time):>11.2f} {per_row(fast_time):>14.2f} "
+              f"{drf_time / fast_time:>7.1f}x {per_row(render_time):>14.2f} {per_row(fast_render_time):>12.2f} "
+              f"{str(identical):>10}")
+        if not identical:
+            sys.exit(f"{serializer_class.__name__}: fast path output differs from the DRF serializer")
+
+
+if __name__ == '__main__':
+    profiles = int(sys.argv[1]) if len(sys.argv) > 1 else PROFILES
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        PortfolioGenerator(seed=42).generate(profiles)
+        print(f"Database: {connection.vendor}, {profiles} profiles, orjson: {'yes' if orjson else 'no'}")
+        run_benchmark()
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
@@ -0,0 +1,89 @@
+import os
+import sys
+import time
+import statistics
+from types import SimpleNamespace
+import django
+
+# Setup Django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'portfolio_api.settings')
+django.setup()
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from portfolio.models import Profile, Skill, Project
+from portfolio.aggregates import stats_counts, build_stats
+from portfolio.datagen import PortfolioGenerator
+
+SIZES = [10, 1000, 100000]
+RUNS = 5
+
+
+def legacy_stats(profile):
+    """The per-choice .count() implementation /api/stats/ used before aggregation"""
+    data = {
+        'total_skills': profile.skills.count(),
+        'total_projects': profile.projects.count(),
+        'total_certifications': profile.certifications.count(),
+        'total_achievements': profile.achievements.count(),
+    }
+    for category_key, _ in Skill.CATEGORY_CHOICES:
+        profile.skills.filter(category=category_key).count()
+    for status_key, _ in Project.STATUS_CHOICES:
+        profile.projects.filter(status=status_key).count()
+    tech_counts = {}
+    for project in profile.projects.all():
+        for tech in project.technologies:
+            tech_counts[tech] = tech_counts.get(tech, 0) + 1
+    data['top_technologies'] = sorted(tech_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+    return data
+
+
+def aggregated_stats(profile):
+    """The grouped conditional aggregation (one pass per child table) the counters replaced"""
+    return build_stats(SimpleNamespace(pk=profile.pk, **stats_counts([profile.pk])[profile.pk]))
+
+
+def counter_stats(profile):
+    return build_stats(Profile.objects.get(pk=profile.pk))
+
+
+def seed_profile(project_count):
+    """One generated profile with exactly ``project_count`` projects"""
+    generator = PortfolioGenerator(seed=42, counts={'projects': (project_count, project_count)})
+    generator.generate(1)
+    return Profile.objects.latest('id')
+
+
+def measure(func, profile):
+    timings = []
+    for _ in range(RUNS):
+        with CaptureQueriesContext(connection) as ctx:
+            started = time.perf_counter()
+            func(profile)
+            timings.append((time.perf_counter() - started) * 1000)
+    return len(ctx), statistics.median(timings)
+
+
+def run_benchmark(sizes):
+    print(f"{'projects':>10} {'impl':>12} {'queries':>8} {'median ms':>10}")
+    for size in sizes:
+        # Profiles are left in place: the test database is dropped afterwards
+        profile = seed_profile(size)
+        for label, func in [('legacy', legacy_stats), ('aggregated', aggregated_stats),
+                            ('counters', counter_stats)]:
+            queries, median_ms = measure(func, profile)
+            print(f"{size:>10} {label:>12} {queries:>8} {median_ms:>10.2f}")
+
+
+if __name__ == '__main__':
+    sizes = [int(arg) for arg in sys.argv[1:]] or SIZES
+    print(f"Database: {connection.vendor}")
+    # Benchmark against a throwaway test database, never the real one
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        run_benchmark(sizes)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
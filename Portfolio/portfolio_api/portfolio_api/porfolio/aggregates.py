@@ -0,0 +1,144 @@
+from django.db.models import Count, F, Q, Sum, Window
+from django.db.models.functions import RowNumber
+from .models import Skill, Project, Certification, Achievement, ProfileTechnology
+
+
+def stats_aggregates():
+    """
+    {child model: {Profile counter column: aggregate}} for every counter.
+
+    Each table's counters are conditional COUNTs over the same rows, so
+    grouping one table by profile_id computes all of them in a single pass.
+    """
+    skills = {'total_skills': Count('pk')}
+    for category_key, _ in Skill.CATEGORY_CHOICES:
+        skills[f'skills_{category_key}'] = Count('pk', filter=Q(category=category_key))
+    projects = {'total_projects': Count('pk')}
+    for status_key, _ in Project.STATUS_CHOICES:
+        projects[f'projects_{status_key}'] = Count('pk', filter=Q(status=status_key))
+    return {
+        Skill: skills,
+        Project: projects,
+        Certification: {'total_certifications': Count('pk')},
+        Achievement: {'total_achievements': Count('pk')},
+    }
+
+
+def stats_counts(profile_ids):
+    """
+    Count every Profile counter column from the child rows of ``profile_ids``.
+
+    One grouped aggregate per child table (four queries however many
+    profiles), returning {profile_id: {column: count}} with zeros for
+    profiles without rows. The columns themselves are kept current by
+    counters.py; these are what reconciliation checks them against.
+    """
+    aggregates = stats_aggregates()
+    counts = {
+        profile_id: {name: 0 for columns in aggregates.values() for name in columns}
+        for profile_id in profile_ids
+    }
+    for model, columns in aggregates.items():
+        rows = (
+            model.objects.filter(profile_id__in=counts)
+            .order_by()
+            .values('profile_id')
+            .annotate(**columns)
+        )
+        for row in rows:
+            counts[row.pop('profile_id')].update(row)
+    return counts
+
+
+# Most used first; ties by name
+PROFILE_TECHNOLOGY_ORDERING = ['-project_count', 'technology__name']
+
+
+def profile_technologies(profile_id):
+    """The profile's ProfileTechnology rows in PROFILE_TECHNOLOGY_ORDERING"""
+    return (
+        ProfileTechnology.objects.filter(profile_id=profile_id, project_count__gt=0)
+        .order_by(*PROFILE_TECHNOLOGY_ORDERING)
+    )
+
+
+def technology_counts(profile_id=None, limit=None):
+    """
+    Return [(technology, count), ...] ordered by usage.
+
+    Reads the per-profile ProfileTechnology counts kept current from the
+    project signals, so a profile's list is one read of its
+    (profile, -project_count) index; without ``profile_id`` the counts are
+    summed across profiles.
+    """
+    if profile_id is not None:
+        rows = profile_technologies(profile_id).values_list('technology__name', 'project_count')
+    else:
+        rows = (
+            ProfileTechnology.objects.values_list('technology__name')
+            .annotate(total=Sum('project_count'))
+            .filter(total__gt=0)
+            .order_by('-total', 'technology__name')
+        )
+    if limit is not None:
+        rows = rows[:limit]
+    return list(rows)
+
+
+def build_stats(profile, top_technologies=None):
+    """
+    Shape a Profile's counter columns into the /api/stats/ payload.
+
+    ``top_technologies`` takes precomputed technology_counts(profile.pk, limit=10).
+    """
+    stats_data = {
+        'total_skills': profile.total_skills,
+        'total_projects': profile.total_projects,
+        'total_certifications': profile.total_certifications,
+        'total_achievements': profile.total_achievements,
+        'skills_by_category': {},
+        'projects_by_status': {},
+        'top_technologies': []
+    }
+
+    for category_key, category_name in Skill.CATEGORY_CHOICES:
+        count = getattr(profile, f'skills_{category_key}')
+        if count > 0:
+            stats_data['skills_by_category'][category_key] = {
+                'name': category_name,
+                'count': count
+            }
+
+    for status_key, status_name in Project.STATUS_CHOICES:
+        count = getattr(profile, f'projects_{status_key}')
+        if count > 0:
+            stats_data['projects_by_status'][status_key] = {
+                'name': status_name,
+                'count': count
+            }
+
+    if top_technologies is None:
+        top_technologies = technology_counts(profile.pk, limit=10)
+    stats_data['top_technologies'] = [{"name": tech, "count": count} for tech, count in top_technologies]
+    return stats_data
+
+
+def top_skills_per_category(queryset, limit, with_totals=False):
+    """
+    The best ``limit`` skills of every (profile, category) in the Skill
+    ``queryset``, by proficiency then name.
+
+    One ROW_NUMBER() window over the filtered rows replaces a query per
+    category; rows come back grouped by profile and category, best first.
+    ``with_totals`` also annotates ``category_total``, the size of the
+    (profile, category) group before the cut, from a COUNT() window.
+    """
+    partition = [F('profile_id'), F('category')]
+    ranked = queryset.annotate(position=Window(
+        RowNumber(),
+        partition_by=partition,
+        order_by=[F('proficiency_rank').desc(), F('name').asc()],
+    ))
+    if with_totals:
+        ranked = ranked.annotate(category_total=Window(Count('pk'), partition_by=partition))
+    return ranked.filter(position__lte=limit).order_by('profile_id', 'category', 'position')
@@ -2,4 +2,10 @@ from django.apps import AppConfig
 
 class PortfolioConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'portfolio'
\ No newline at end of file
+    name = 'portfolio'
+
+    def ready(self):
+        from django.core import checks
+        from . import signals  # noqa: F401
+        from .cache import check_shared_cache
+        checks.register(check_shared_cache, checks.Tags.caches)
@@ -0,0 +1,165 @@
+import asyncio
+import logging
+from contextlib import contextmanager
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.http import HttpResponseNotAllowed, JsonResponse
+from .models import Profile
+from .aggregates import technology_counts, build_stats
+from .cache import response_cache, cache_header
+from .conditional import aconditional_response, cache_version
+from .resolver import profile_resolver
+from .views import SEARCH_SERIALIZERS, search_params, search_source
+
+logger = logging.getLogger(__name__)
+
+
+def source_timeout():
+    return getattr(settings, 'PORTFOLIO_ASYNC_SOURCE_TIMEOUT', 2.0)
+
+
+@contextmanager
+def statement_timeout(seconds):
+    """
+    Have the database cancel any statement running longer than ``seconds``
+    (PostgreSQL; elsewhere a no-op). Scoped to a transaction with SET LOCAL,
+    so pooled connections keep their default.
+
+    The limit applies to each statement, not to the block: a source running
+    two queries may keep its connection for up to twice the budget after the
+    view stopped waiting (the view itself never waits longer than one).
+    """
+    if connection.vendor != 'postgresql':
+        yield
+        return
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL statement_timeout = %s', [max(1, int(seconds * 1000))])
+        yield
+
+
+def _in_worker(func):
+    # Django's async ORM runs every query on one shared thread, so sources
+    # that must overlap run in their own worker thread (and connection).
+    # A source the view stops waiting for is cancelled by the database just
+    # after, so its thread and connection are released instead of running on
+    def run(*args):
+        close_old_connections()
+        try:
+            with statement_timeout(source_timeout()):
+                return func(*args)
+        finally:
+            close_old_connections()
+    return sync_to_async(run, thread_sensitive=False)
+
+
+async def gather_sources(sources, timeout):
+    """
+    Await {key: awaitable} concurrently for at most ``timeout`` seconds.
+
+    Returns (results, timed_out) where timed_out lists the keys that did not
+    finish or raised; their results are ignored (failures are logged), and
+    sources run with _in_worker() have their query cancelled by the
+    database's statement timeout.
+    """
+    tasks = {key: asyncio.ensure_future(awaitable) for key, awaitable in sources.items()}
+    done, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+    for task in pending:
+        task.cancel()
+    results = {}
+    timed_out = []
+    for key, task in tasks.items():
+        if task in pending:
+            timed_out.append(key)
+        elif task.exception() is not None:
+            logger.error('Source %r failed', key, exc_info=task.exception())
+            timed_out.append(key)
+        else:
+            results[key] = task.result()
+    return results, timed_out
+
+
+async def search(request):
+    """Ranked full-text search with every source queried concurrently"""
+    # require_GET only learns to wrap coroutines in Django 5.0
+    if request.method not in ('GET', 'HEAD'):
+        return HttpResponseNotAllowed(['GET', 'HEAD'])
+
+    query = request.GET.get('q', '').strip()
+
+    if not query:
+        return JsonResponse({"error": "Query parameter 'q' is required"}, status=400)
+
+    try:
+        page, page_size = search_params(request)
+    except ValueError:
+        return JsonResponse({"error": "'page' and 'page_size' (or 'limit') must be integers"}, status=400)
+
+    profile_id = await sync_to_async(profile_resolver.resolve)(request)
+    if profile_id is None:
+        return JsonResponse({"error": "Profile not found"}, status=404)
+
+    async def build():
+        offset = (page - 1) * page_size
+        sources = {
+            key: _in_worker(search_source)(query, key, offset, page_size, profile_id)
+            for key in SEARCH_SERIALIZERS
+        }
+        finished, timed_out = await gather_sources(sources, source_timeout())
+        counts = {key: total for key, (total, _) in finished.items()}
+        results = {key: serialized for key, (_, serialized) in finished.items()}
+
+        return JsonResponse({
+            'query': query,
+            'total_results': sum(counts.values()),
+            'page': page,
+            'page_size': page_size,
+            'counts': counts,
+            'results': results,
+            'partial': bool(timed_out),
+            'timed_out': timed_out,
+        })
+
+    version = await sync_to_async(cache_version)(profile_id)
+    return await aconditional_response(request, version, build)
+
+
+async def stats(request):
+    """Get overall profile statistics, with counters and technologies fetched concurrently"""
+    if request.method not in ('GET', 'HEAD'):
+        return HttpResponseNotAllowed(['GET', 'HEAD'])
+
+    try:
+        profile_id = await sync_to_async(profile_resolver.resolve)(request)
+        if profile_id is None:
+            return JsonResponse({"error": "Profile not found"}, status=404)
+
+        async def build():
+            key, stats_data, hit = await sync_to_async(response_cache.lookup)('stats', profile_id)
+            if hit:
+                return JsonResponse(stats_data, headers=cache_header(True))
+
+            finished, timed_out = await gather_sources({
+                'counts': Profile.objects.aget(pk=profile_id),
+                'technologies': _in_worker(technology_counts)(profile_id, 10),
+            }, source_timeout())
+
+            if 'counts' in finished:
+                stats_data = build_stats(finished['counts'], finished.get('technologies', []))
+            else:
+                stats_data = {'top_technologies': [
+                    {"name": tech, "count": count} for tech, count in finished.get('technologies', [])
+                ]}
+            if timed_out:
+                # Partial payloads are never cached
+                stats_data.update({'partial': True, 'timed_out': timed_out})
+            else:
+                await sync_to_async(response_cache.store)('stats', key, stats_data)
+            return JsonResponse(stats_data, headers=cache_header(False))
+
+        version = await sync_to_async(cache_version)(profile_id)
+        return await aconditional_response(request, version, build)
+
+    except Exception as e:
+        return JsonResponse({"error": str(e)}, status=500)
@@ -0,0 +1,152 @@
+from bisect import bisect_left, insort
+from collections import Counter
+from .indexes import ProfileIndexCache
+from .models import Skill, Project, WorkExperience, Education
+
+# Model -> {field: suggestion type}; list fields contribute one term per item
+AUTOCOMPLETE_FIELDS = {
+    Skill: {'name': 'skill'},
+    Project: {'title': 'project', 'technologies': 'technology'},
+    WorkExperience: {'company': 'company'},
+    Education: {'institution': 'institution'},
+}
+SUGGESTION_TYPES = [kind for fields in AUTOCOMPLETE_FIELDS.values() for kind in fields.values()]
+
+
+def normalize(text):
+    return ' '.join(text.split()).casefold()
+
+
+def row_terms(model, values):
+    """[(type, display text)] contributed by one row, given {field: value}"""
+    terms = []
+    for field, kind in AUTOCOMPLETE_FIELDS[model].items():
+        value = values.get(field)
+        for item in (value if isinstance(value, (list, tuple)) else [value]):
+            display = ' '.join((item or '').split())
+            if display:
+                terms.append((kind, display))
+    return terms
+
+
+class PrefixIndex:
+    """
+    One profile's suggestions as a sorted array of (key, type, display),
+    searched with bisect.
+
+    Every word start of a term is a key, so "learn" finds "Machine
+    Learning". Terms are reference counted: a technology used by several
+    projects stays until the last of them drops it.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+        self.entries = []
+
+    @staticmethod
+    def keys(display):
+        words = normalize(display).split(' ')
+        return [' '.join(words[start:]) for start in range(len(words))]
+
+    def add(self, kind, display):
+        self.counts[(kind, display)] += 1
+        if self.counts[(kind, display)] == 1:
+            for key in self.keys(display):
+                insort(self.entries, (key, kind, display))
+
+    def discard(self, kind, display):
+        if self.counts[(kind, display)] <= 0:
+            return
+        self.counts[(kind, display)] -= 1
+        if self.counts[(kind, display)] == 0:
+            del self.counts[(kind, display)]
+            for key in self.keys(display):
+                position = bisect_left(self.entries, (key, kind, display))
+                if position < len(self.entries) and self.entries[position] == (key, kind, display):
+                    del self.entries[position]
+
+    def search(self, prefix, limit, kinds=None):
+        prefix = normalize(prefix)
+        results = []
+        seen = set()
+        for key, kind, display in self.entries[bisect_left(self.entries, (prefix,)):]:
+            if not key.startswith(prefix):
+                break
+            if (kind, display) in seen or (kinds is not None and kind not in kinds):
+                continue
+            seen.add((kind, display))
+            results.append({'value': display, 'type': kind})
+            if len(results) >= limit:
+                break
+        return results
+
+
+class AutocompleteIndex(ProfileIndexCache):
+    """
+    Per-process PrefixIndexes, one per profile, patched from model signals
+    (see ProfileIndexCache). PORTFOLIO_AUTOCOMPLETE_TTL and
+    PORTFOLIO_AUTOCOMPLETE_PROFILES bound staleness and memory.
+    """
+
+    max_profiles_setting = 'PORTFOLIO_AUTOCOMPLETE_PROFILES'
+    ttl_setting = 'PORTFOLIO_AUTOCOMPLETE_TTL'
+
+    def load(self, profile_id):
+        index = PrefixIndex()
+        for model, fields in AUTOCOMPLETE_FIELDS.items():
+            for values in model.objects.filter(profile_id=profile_id).values(*fields):
+                for kind, display in row_terms(model, values):
+                    index.add(kind, display)
+        return index
+
+    def search(self, profile_id, prefix, limit=10, kinds=None):
+        return self.read(profile_id, lambda index: index.search(prefix, limit, kinds))
+
+    def update(self, profile_id, removed=(), added=()):
+        """Apply a row change to a loaded index once the write commits"""
+        def patch(index):
+            for kind, display in removed:
+                index.discard(kind, display)
+            for kind, display in added:
+                index.add(kind, display)
+        self.apply_on_commit(profile_id, patch)
+
+
+autocomplete_index = AutocompleteIndex()
+
+
+def remember_terms(sender, instance, raw=False, **kwargs):
+    """pre_save: note the terms an existing row contributed, if its profile's index is loaded"""
+    instance._autocomplete_terms = None
+    # No query unless there is an index to patch (a row moved in from another
+    # profile's loaded index leaves that index to its TTL)
+    if raw or instance._state.adding or not autocomplete_index.is_loaded(instance.profile_id):
+        return
+    previous = sender.objects.filter(pk=instance.pk).values('profile_id', *AUTOCOMPLETE_FIELDS[sender]).first()
+    if previous is not None:
+        instance._autocomplete_terms = (previous['profile_id'], row_terms(sender, previous))
+
+
+def terms_saved(sender, instance, raw=False, **kwargs):
+    """post_save: swap the row's old terms for its new ones"""
+    if raw:
+        return
+    added = row_terms(sender, {field: getattr(instance, field) for field in AUTOCOMPLETE_FIELDS[sender]})
+    previous = getattr(instance, '_autocomplete_terms', None)
+    if previous is not None:
+        old_profile_id, removed = previous
+        if old_profile_id != instance.profile_id:
+            autocomplete_index.update(old_profile_id, removed=removed)
+            removed = ()
+        autocomplete_index.update(instance.profile_id, removed=removed, added=added)
+    elif kwargs.get('created'):
+        autocomplete_index.update(instance.profile_id, added=added)
+    else:
+        # Saved without a snapshot of its old terms: reload on next use
+        autocomplete_index.invalidate([instance.profile_id])
+
+
+def terms_deleted(sender, instance, **kwargs):
+    """post_delete: take the row's terms out"""
+    removed = row_terms(sender, {field: getattr(instance, field) for field in AUTOCOMPLETE_FIELDS[sender]})
+    autocomplete_index.update(instance.profile_id, removed=removed)
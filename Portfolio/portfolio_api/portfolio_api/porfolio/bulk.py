@@ -0,0 +1,165 @@
+from django.db import transaction
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from .models import Profile
+from .signals import sync_bulk_write
+
+
+class BulkUpsertMixin:
+    """
+    Adds ``POST <collection>/bulk/`` accepting a list of objects.
+
+    The batch is validated as a whole: field validation runs through one
+    ListSerializer, profile ids are resolved with one query, and uniqueness is
+    checked with one query against the model's natural key (its first
+    unique_together) or, for models without one, against the ``id`` of items
+    that carry one. Valid batches are written with bulk_create() inside a
+    single transaction, together with the side effects save signals would
+    have had (sync_bulk_write); existing rows are updated in place. Any
+    invalid item rejects the whole batch and the response lists errors by
+    item index.
+    """
+
+    bulk_max_items = 5000
+    bulk_batch_size = 500
+
+    def get_bulk_natural_key(self, model):
+        unique_together = model._meta.unique_together
+        return list(unique_together[0]) if unique_together else None
+
+    def get_bulk_update_fields(self, model, natural_key):
+        skip = set(natural_key or [])
+        return [
+            field.name for field in model._meta.concrete_fields
+            if not field.primary_key and field.name not in skip
+            and (field.editable or getattr(field, 'auto_now', False))
+        ]
+
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """Create or update many rows in one transaction"""
+        items = request.data
+        if not isinstance(items, list) or not items:
+            return Response({"error": "Expected a non-empty list of objects"}, status=400)
+        if len(items) > self.bulk_max_items:
+            return Response({"error": f"At most {self.bulk_max_items} items per request"}, status=400)
+        if not all(isinstance(item, dict) for item in items):
+            return Response({"error": "Every item must be an object"}, status=400)
+
+        model = self.get_queryset().model
+        natural_key = self.get_bulk_natural_key(model)
+
+        # One query resolves every referenced profile for the whole batch
+        profile_ids = {str(item.get('profile')) for item in items}
+        profiles = Profile.objects.in_bulk([int(pk) for pk in profile_ids if pk.isdigit()])
+        context = {**self.get_serializer_context(), 'related_instances': {Profile: profiles}}
+
+        serializer = self.get_serializer_class()(data=items, many=True, context=context)
+        # Uniqueness is checked once for the batch below, not per item
+        serializer.child.validators = []
+        serializer.is_valid()
+        errors = {}
+        if serializer.errors:
+            errors = {index: item_errors for index, item_errors in enumerate(serializer.errors) if item_errors}
+        if errors:
+            return self._bulk_error_response(errors)
+
+        instances = [model(**data) for data in serializer.validated_data]
+        if natural_key:
+            # The natural key includes the profile, so no row changes profile
+            errors, existing = self._check_natural_keys(model, natural_key, instances)
+            previous_profile_ids = set()
+        else:
+            errors, previous = self._check_ids(model, items, instances)
+            existing = len(previous)
+            previous_profile_ids = set(previous.values())
+        if errors:
+            return self._bulk_error_response(errors)
+
+        update_fields = self.get_bulk_update_fields(model, natural_key)
+        with transaction.atomic():
+            if natural_key:
+                model.objects.bulk_create(
+                    instances, batch_size=self.bulk_batch_size, update_conflicts=True,
+                    unique_fields=natural_key, update_fields=update_fields,
+                )
+            else:
+                new = [instance for instance in instances if instance.pk is None]
+                updated = [instance for instance in instances if instance.pk is not None]
+                model.objects.bulk_create(new, batch_size=self.bulk_batch_size)
+                if updated:
+                    model.objects.bulk_create(
+                        updated, batch_size=self.bulk_batch_size, update_conflicts=True,
+                        unique_fields=['id'], update_fields=update_fields,
+                    )
+
+            # In the same transaction: a failure here rolls the rows back too,
+            # rather than leaving them committed with stale derived tables
+            written = self._reload(model, natural_key, instances)
+            # Rows moved to another profile leave their old profile stale too
+            sync_bulk_write(model, [row.pk for row in written],
+                            {row.profile_id for row in written} | previous_profile_ids)
+
+        return Response({
+            'created': len(instances) - existing,
+            'updated': existing,
+            'results': self.get_serializer(written, many=True).data,
+        }, status=status.HTTP_201_CREATED)
+
+    def _key_attnames(self, model, natural_key):
+        return [model._meta.get_field(name).attname for name in natural_key]
+
+    def _check_natural_keys(self, model, natural_key, instances):
+        attnames = self._key_attnames(model, natural_key)
+        errors = {}
+        seen = set()
+        for index, instance in enumerate(instances):
+            key = tuple(getattr(instance, attname) for attname in attnames)
+            if key in seen:
+                errors[index] = {'non_field_errors': [f"Duplicate {', '.join(natural_key)} within the batch"]}
+            seen.add(key)
+
+        # Superset filter per key column, narrowed to exact tuples in Python
+        lookup = {f'{attname}__in': {key[i] for key in seen} for i, attname in enumerate(attnames)}
+        existing = set(model.objects.filter(**lookup).values_list(*attnames)) & seen
+        return errors, len(existing)
+
+    def _check_ids(self, model, items, instances):
+        errors = {}
+        ids = {}
+        for index, (item, instance) in enumerate(zip(items, instances)):
+            if item.get('id') is None:
+                continue
+            try:
+                instance.pk = int(item['id'])
+            except (TypeError, ValueError):
+                errors[index] = {'id': ['A valid integer is required.']}
+                continue
+            if instance.pk in ids:
+                errors[index] = {'id': ['Duplicate id within the batch']}
+            ids[instance.pk] = index
+
+        # {pk: profile_id} of the existing rows, as they are before the update
+        known = dict(model.objects.filter(pk__in=list(ids)).values_list('pk', 'profile_id'))
+        for pk, index in ids.items():
+            if pk not in known:
+                errors.setdefault(index, {'id': [f'Object with id={pk} does not exist.']})
+        return errors, known
+
+    def _reload(self, model, natural_key, instances):
+        """Fetch the written rows back (conflict updates do not return primary keys)"""
+        if natural_key:
+            attnames = self._key_attnames(model, natural_key)
+            keys = {tuple(getattr(instance, attname) for attname in attnames) for instance in instances}
+            lookup = {f'{attname}__in': {key[i] for key in keys} for i, attname in enumerate(attnames)}
+            return [
+                row for row in model.objects.filter(**lookup)
+                if tuple(getattr(row, attname) for attname in attnames) in keys
+            ]
+        return list(model.objects.filter(pk__in=[instance.pk for instance in instances]))
+
+    def _bulk_error_response(self, errors):
+        return Response({
+            'errors': [{'index': index, 'errors': item_errors} for index, item_errors in sorted(errors.items())]
+        }, status=400)
@@ -0,0 +1,186 @@
+import hashlib
+import os
+import threading
+import time
+from django.conf import settings
+from django.core import checks
+from django.core.cache import caches
+
+_MISSING = object()
+
+# Backends private to one process: versions bumped by one worker (or a
+# management command) would never reach the others
+PROCESS_LOCAL_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+DEFAULT_TIMEOUTS = {
+    'profile_me': 300,
+    'stats': 300,
+    'skills_top': 300,
+    'skills_categories': 300,
+    'project_technologies': 300,
+}
+
+
+class ResponseCache:
+    """
+    Versioned cache for read-heavy endpoint payloads.
+
+    Keys embed a version that is bumped from model signals, so a write
+    never has to find and delete individual entries: the next read simply
+    looks under a new key. Payloads scoped to a profile use that profile's
+    version; everything else uses the global version, which is bumped on
+    every write. A version is the time (ns) of the last bump, which is also
+    what ETag/Last-Modified are derived from, so the cache must be shared by
+    every process that serves or writes (see check_shared_cache).
+
+    Concurrent misses for the same key are collapsed with a short-lived lock
+    taken via cache.add(), so only one request rebuilds a payload while the
+    others wait for it to appear.
+    """
+
+    prefix = 'portfolio'
+
+    def __init__(self):
+        self._counters = {}
+        self._counters_lock = threading.Lock()
+
+    @property
+    def cache(self):
+        return caches[getattr(settings, 'PORTFOLIO_CACHE_ALIAS', 'default')]
+
+    def timeout(self, name):
+        timeouts = {**DEFAULT_TIMEOUTS, **getattr(settings, 'PORTFOLIO_CACHE_TIMEOUTS', {})}
+        return timeouts.get(name, 300)
+
+    @property
+    def lock_timeout(self):
+        return getattr(settings, 'PORTFOLIO_CACHE_LOCK_TIMEOUT', 10)
+
+    @property
+    def negative_timeout(self):
+        return getattr(settings, 'PORTFOLIO_CACHE_NEGATIVE_TIMEOUT', 10)
+
+    def _version_key(self, profile_id):
+        scope = 'global' if profile_id is None else f'profile:{profile_id}'
+        return f'{self.prefix}:version:{scope}'
+
+    def version(self, profile_id=None):
+        version_key = self._version_key(profile_id)
+        version = self.cache.get(version_key)
+        if version is None:
+            # Seed from the clock so a culled or evicted counter can never
+            # restart at a version whose payloads are still cached
+            self.cache.add(version_key, time.time_ns(), timeout=None)
+            version = self.cache.get(version_key)
+        return version
+
+    def bump(self, profile_id=None):
+        """Invalidate everything cached for a profile (and all global payloads)"""
+        keys = [self._version_key(None)]
+        if profile_id is not None:
+            keys.append(self._version_key(profile_id))
+        for version_key in keys:
+            # Clock-based rather than incr(), which shared backends such as the
+            # file cache do not make atomic: two racing bumps still both move
+            # the version to a value never used before
+            current = self.cache.get(version_key) or 0
+            self.cache.set(version_key, max(time.time_ns(), current + 1), timeout=None)
+
+    def make_key(self, name, profile_id=None, params=None):
+        scope = 'global' if profile_id is None else profile_id
+        key = f'{self.prefix}:{name}:{scope}:v{self.version(profile_id)}'
+        if params:
+            encoded = '&'.join(f'{k}={v}' for k, v in sorted(params.items()))
+            key += ':' + hashlib.md5(encoded.encode()).hexdigest()
+        return key
+
+    def _record(self, name, outcome):
+        with self._counters_lock:
+            counters = self._counters.setdefault(name, {'hits': 0, 'misses': 0, 'waits': 0})
+            counters[outcome] += 1
+
+    def get_or_build(self, name, builder, profile_id=None, params=None):
+        """
+        Return (data, hit) for ``name``, calling ``builder()`` on a miss.
+
+        A builder returning None (e.g. a 404) is cached for only
+        PORTFOLIO_CACHE_NEGATIVE_TIMEOUT seconds, so requests waiting on the
+        lock get the None back at once instead of polling until it expires.
+        """
+        key = self.make_key(name, profile_id, params)
+        data = self.cache.get(key, _MISSING)
+        if data is not _MISSING:
+            self._record(name, 'hits')
+            return data, True
+
+        lock_key = key + ':lock'
+        owns_lock = self.cache.add(lock_key, os.getpid(), timeout=self.lock_timeout)
+        if not owns_lock:
+            # Another request is rebuilding this payload; wait for its result
+            deadline = time.monotonic() + self.lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                data = self.cache.get(key, _MISSING)
+                if data is not _MISSING:
+                    self._record(name, 'waits')
+                    return data, True
+            # The builder holding the lock died or overran; rebuild without it
+
+        try:
+            data = builder()
+            timeout = self.timeout(name) if data is not None else self.negative_timeout
+            self.cache.set(key, data, timeout=timeout)
+        finally:
+            if owns_lock:
+                self.cache.delete(lock_key)
+        self._record(name, 'misses')
+        return data, False
+
+    def lookup(self, name, profile_id=None, params=None):
+        """
+        Return (key, data, hit) without building, for async views that build
+        outside get_or_build(); pass ``key`` back to store() afterwards so a
+        payload built before a version bump lands under the old version.
+        """
+        key = self.make_key(name, profile_id, params)
+        data = self.cache.get(key, _MISSING)
+        if data is _MISSING or data is None:
+            return key, None, False
+        self._record(name, 'hits')
+        return key, data, True
+
+    def store(self, name, key, data):
+        self.cache.set(key, data, timeout=self.timeout(name))
+        self._record(name, 'misses')
+
+    def metrics(self):
+        with self._counters_lock:
+            endpoints = {name: dict(counters) for name, counters in self._counters.items()}
+        for counters in endpoints.values():
+            served = counters['hits'] + counters['waits'] + counters['misses']
+            counters['hit_ratio'] = round((counters['hits'] + counters['waits']) / served, 4) if served else None
+        return {'pid': os.getpid(), 'endpoints': endpoints}
+
+
+response_cache = ResponseCache()
+
+
+def check_shared_cache(app_configs=None, **kwargs):
+    """System check: outside DEBUG, the response cache must be shared between processes"""
+    alias = getattr(settings, 'PORTFOLIO_CACHE_ALIAS', 'default')
+    backend = settings.CACHES.get(alias, {}).get('BACKEND')
+    if settings.DEBUG or backend not in PROCESS_LOCAL_BACKENDS:
+        return []
+    return [checks.Error(
+        f"The '{alias}' cache ({backend}) is private to each process, so ETags and cached "
+        "responses would go stale in workers that did not make the write.",
+        hint='Point CACHE_BACKEND at a shared backend (file-based, Redis, Memcached or the database).',
+        id='portfolio.E001',
+    )]
+
+
+def cache_header(hit):
+    return {'X-Cache': 'HIT' if hit else 'MISS'}
@@ -0,0 +1,125 @@
+import datetime
+import hashlib
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from .cache import response_cache
+from .resolver import profile_resolver
+
+
+class Version:
+    """A cheap fingerprint of some rows: when they last changed (if known) plus counters"""
+
+    def __init__(self, last_modified, counts):
+        self.last_modified = last_modified
+        self.counts = counts
+
+    def etag(self, request):
+        # The same rows render differently per URL and media type
+        parts = [request.get_full_path(), request.META.get('HTTP_ACCEPT', '')]
+        parts.append(self.last_modified.isoformat() if self.last_modified else '')
+        parts.extend(str(count) for count in self.counts)
+        return quote_etag(hashlib.md5('|'.join(parts).encode()).hexdigest())
+
+
+def cache_version(profile_id=None):
+    """
+    Version from the response cache version the write signals bump: the
+    profile's, or the global one (bumped by every write) when ``profile_id``
+    is None. It is the time of the last write, so it also gives
+    Last-Modified. A cache read, never a query.
+    """
+    version = response_cache.version(profile_id)
+    return Version(datetime.datetime.fromtimestamp(version / 1e9, tz=datetime.timezone.utc), [version])
+
+
+def _validators(request, version):
+    etag = version.etag(request)
+    # HTTP dates have one-second resolution, so compare on whole seconds
+    last_modified = int(version.last_modified.timestamp()) if version.last_modified else None
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    return etag, last_modified, not_modified
+
+
+def _stamp(response, etag, last_modified):
+    if response.status_code in (200, 304):
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+    return response
+
+
+def conditional_response(request, version, build):
+    """
+    Return 304 Not Modified when the client's validators still match ``version``,
+    otherwise call ``build()`` and stamp ETag/Last-Modified on its response.
+    """
+    if request.method not in ('GET', 'HEAD'):
+        return build()
+
+    etag, last_modified, not_modified = _validators(request, version)
+    response = not_modified if not_modified is not None else build()
+    return _stamp(response, etag, last_modified)
+
+
+async def aconditional_response(request, version, build):
+    """conditional_response() for async views, where ``build`` is a coroutine function"""
+    if request.method not in ('GET', 'HEAD'):
+        return await build()
+
+    etag, last_modified, not_modified = _validators(request, version)
+    response = not_modified if not_modified is not None else await build()
+    return _stamp(response, etag, last_modified)
+
+
+class ConditionalGetMixin:
+    """
+    Answer conditional GETs on a viewset from a version check, before the
+    queryset is materialized or serialized.
+
+    ``profile_actions`` are versioned by the addressed profile's response
+    cache counter, everything else (lists, details, other actions) by the
+    global one; both are bumped on every write, so no request pays for an
+    aggregate over the table it is about to page through. Actions in
+    ``unversioned_actions`` (streaming exports) skip the check. Override
+    get_version() for anything else.
+    """
+
+    profile_actions = ()
+    unversioned_actions = ('export',)
+
+    def get_version(self, request, *args, **kwargs):
+        if self.action in self.profile_actions:
+            return cache_version(profile_resolver.resolve(request))
+        return cache_version()
+
+    def call_handler(self, handler, request, *args, **kwargs):
+        """Run the action once the version check let the request through"""
+        return handler(request, *args, **kwargs)
+
+    def dispatch(self, request, *args, **kwargs):
+        # Mirrors APIView.dispatch, with the version check between the
+        # permission checks in initial() and the handler call
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            self.initial(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            if request.method in ('GET', 'HEAD') and self.action not in self.unversioned_actions:
+                version = self.get_version(request, *args, **kwargs)
+                response = conditional_response(request, version,
+                                                lambda: self.call_handler(handler, request, *args, **kwargs))
+            else:
+                response = self.call_handler(handler, request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
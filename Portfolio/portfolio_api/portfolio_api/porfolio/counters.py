@@ -0,0 +1,167 @@
+from collections import Counter, defaultdict
+from django.db import transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+from .aggregates import stats_counts
+from .models import Profile, Skill, Project, Certification, Achievement
+
+# Child model -> (Profile total column, field tallied per choice, per-choice column prefix)
+COUNTED_MODELS = {
+    Skill: ('total_skills', 'category', 'skills_'),
+    Project: ('total_projects', 'status', 'projects_'),
+    Certification: ('total_certifications', None, None),
+    Achievement: ('total_achievements', None, None),
+}
+COUNTER_FIELDS = [name for name in Profile.DENORMALIZED_FIELDS if name != 'top_skills']
+TOP_SKILL_LEVELS = ['advanced', 'expert']
+TOP_SKILL_LIMIT = 5
+CHUNK_SIZE = 500
+
+
+def row_counters(model, row):
+    """(profile_id, [Profile columns]) that one child row counts towards"""
+    total, choice_field, prefix = COUNTED_MODELS[model]
+    fields = [total]
+    if choice_field is not None:
+        column = prefix + getattr(row, choice_field)
+        if column in COUNTER_FIELDS:
+            fields.append(column)
+    return row.profile_id, fields
+
+
+def apply(deltas):
+    """Apply {(profile_id, column): delta} with one F() UPDATE per profile"""
+    by_profile = defaultdict(dict)
+    for (profile_id, field), delta in deltas.items():
+        if delta:
+            by_profile[profile_id][field] = F(field) + delta
+    for profile_id, updates in by_profile.items():
+        Profile.objects.filter(pk=profile_id).update(**updates)
+
+
+def top_skills_of(profile_ids):
+    """
+    {profile_id: top skill names} for ``profile_ids``, in Skill's default
+    ordering, from one ROW_NUMBER() window however many profiles
+    """
+    ranked = (
+        Skill.objects.filter(profile_id__in=profile_ids, proficiency__in=TOP_SKILL_LEVELS)
+        .annotate(position=Window(
+            RowNumber(),
+            partition_by=[F('profile_id')],
+            order_by=[F(field).asc() for field in [*Skill._meta.ordering, 'pk']],
+        ))
+        .filter(position__lte=TOP_SKILL_LIMIT)
+        .order_by('profile_id', 'position')
+        .values_list('profile_id', 'name')
+    )
+    names = {profile_id: [] for profile_id in profile_ids}
+    for profile_id, name in ranked:
+        names[profile_id].append(name)
+    return names
+
+
+def top_skills(profile_id):
+    return top_skills_of([profile_id])[profile_id]
+
+
+def refresh_top_skills(profile_id):
+    Profile.objects.filter(pk=profile_id).update(top_skills=top_skills(profile_id))
+
+
+def remember(sender, instance, raw=False, **kwargs):
+    """pre_save: note what an existing row counted towards before it changes"""
+    instance._counted = None
+    if raw or instance._state.adding:
+        return
+    _, choice_field, _ = COUNTED_MODELS[sender]
+    fields = ['profile_id']
+    if choice_field is not None:
+        fields.append(choice_field)
+    if sender is Skill:
+        fields.append('proficiency')
+    previous = sender.objects.filter(pk=instance.pk).values(*fields).first()
+    if previous is not None:
+        instance._counted = sender(**previous)
+
+
+def child_saved(sender, instance, created, raw=False, **kwargs):
+    """post_save: move the counters from the row's old values to its new ones"""
+    if raw:
+        return
+    previous = getattr(instance, '_counted', None)
+    if not created and previous is None:
+        return
+    deltas = Counter()
+    if previous is not None:
+        profile_id, fields = row_counters(sender, previous)
+        for field in fields:
+            deltas[(profile_id, field)] -= 1
+    profile_id, fields = row_counters(sender, instance)
+    for field in fields:
+        deltas[(profile_id, field)] += 1
+    apply(deltas)
+
+    if sender is Skill:
+        # Only skills that are (or were) top skills can change the list
+        affected = set()
+        if instance.proficiency in TOP_SKILL_LEVELS:
+            affected.add(instance.profile_id)
+        if previous is not None and previous.proficiency in TOP_SKILL_LEVELS:
+            affected.add(previous.profile_id)
+        for profile_id in affected:
+            refresh_top_skills(profile_id)
+
+
+def child_deleted(sender, instance, origin=None, **kwargs):
+    """post_delete: take the row out of its profile's counters"""
+    # Cascades from deleting the profile itself have nothing left to update
+    if isinstance(origin, Profile) or getattr(origin, 'model', None) is Profile:
+        return
+    deltas = Counter()
+    profile_id, fields = row_counters(sender, instance)
+    for field in fields:
+        deltas[(profile_id, field)] -= 1
+    apply(deltas)
+    if sender is Skill and instance.proficiency in TOP_SKILL_LEVELS:
+        refresh_top_skills(profile_id)
+
+
+def reconcile(profiles=None, fix=True):
+    """
+    Compare the stored counters and top skills of ``profiles`` (a Profile
+    queryset, default all) with the child rows.
+
+    Returns {profile_id: {column: (stored, actual)}} for every profile that
+    drifted. Each chunk is read with its Profile rows locked (SELECT ... FOR
+    UPDATE), and with ``fix`` the counted values are written back before the
+    lock is released. A child write updates its profile's counters in the
+    same transaction as the row, so it is either committed (and counted)
+    before the lock is taken or waits for it and applies its delta on top.
+    """
+    profiles = Profile.objects.all() if profiles is None else profiles
+    ids = list(profiles.order_by('pk').values_list('pk', flat=True))
+    drift = {}
+    for start in range(0, len(ids), CHUNK_SIZE):
+        chunk = ids[start:start + CHUNK_SIZE]
+        with transaction.atomic():
+            rows = list(
+                Profile.objects.select_for_update().filter(pk__in=chunk)
+                .order_by('pk').values('pk', *Profile.DENORMALIZED_FIELDS)
+            )
+            actual = stats_counts(chunk)
+            top = top_skills_of(chunk)
+            for row in rows:
+                changed = {}
+                for field in COUNTER_FIELDS:
+                    stored, counted = row[field], actual[row['pk']][field]
+                    if stored != counted:
+                        changed[field] = (stored, counted)
+                if row['top_skills'] != top[row['pk']]:
+                    changed['top_skills'] = (row['top_skills'], top[row['pk']])
+                if changed:
+                    drift[row['pk']] = changed
+                    if fix:
+                        Profile.objects.filter(pk=row['pk']).update(
+                            **{field: counted for field, (_, counted) in changed.items()})
+    return drift
@@ -0,0 +1,210 @@
+import random
+from datetime import date, timedelta
+from django.db.models.functions import Length
+from .models import Profile, Education, Skill, Project, WorkExperience, Certification, Achievement
+from . import counters, technologies
+
+# Vocabulary drawn from Portfolio_backend/data_seeding.py, widened so that
+# large profiles still get distinct, realistic-looking rows
+SKILLS_BY_CATEGORY = {
+    'programming': ['Python', 'Java', 'C', 'C++', 'SQL', 'Go', 'Rust', 'TypeScript', 'Kotlin', 'Scala', 'R', 'Bash'],
+    'data_ml': ['Pandas', 'NumPy', 'Matplotlib', 'Seaborn', 'scikit-learn', 'TensorFlow', 'NLTK', 'PyTorch', 'XGBoost', 'spaCy'],
+    'data_engineering': ['ETL Pipelines', 'Data Cleaning', 'Data Warehousing', 'PySpark', 'Power BI', 'Streamlit',
+                         'MySQL', 'MongoDB', 'Airflow', 'Kafka', 'dbt', 'Snowflake'],
+    'cloud': ['Google Cloud Platform', 'AWS', 'Azure', 'Docker', 'Kubernetes', 'Terraform'],
+    'ml_ai': ['Regression', 'Classification', 'Clustering', 'Random Forest', 'Gradient Boosted Trees', 'ANN', 'CNN',
+              'Transformers', 'NLP', 'Tokenization', 'TF-IDF', 'Reinforcement Learning'],
+    'web_dev': ['HTML', 'CSS', 'JavaScript', 'REST APIs', 'Django', 'React.js', 'Bootstrap', 'Flask', 'FastAPI', 'GraphQL'],
+    'tools': ['Git', 'GitHub', 'VS Code', 'Jira', 'Postman', 'Linux'],
+    'soft_skills': ['Problem-Solving', 'Analytical Thinking', 'Collaboration', 'Communication', 'Leadership', 'Mentoring'],
+}
+TECHNOLOGIES = [
+    'Python', 'Django', 'React', 'MySQL', 'AI', 'NLP', 'REST APIs', 'scikit-learn', 'NLTK', 'TF-IDF', 'SVM',
+    'Logistic Regression', 'ANN', 'Random Forest', 'Machine Learning', 'PostgreSQL', 'Docker', 'AWS', 'PySpark',
+    'TensorFlow', 'PyTorch', 'Pandas', 'Redis', 'Kubernetes', 'Go', 'TypeScript', 'FastAPI', 'Kafka', 'Airflow',
+]
+PROJECT_SUBJECTS = ['Legal Research', 'Sentiment Analysis', 'Diabetes Prediction', 'Fraud Detection', 'Recommendation',
+                    'Churn Forecasting', 'Document Search', 'Image Classification', 'Chatbot', 'Inventory Tracking']
+PROJECT_KINDS = ['Engine', 'Pipeline', 'Dashboard', 'API', 'Platform', 'Model', 'Assistant', 'Toolkit']
+INSTITUTIONS = ['Manipal University Jaipur', 'IIT Delhi', 'BITS Pilani', 'NIT Trichy', 'Delhi University', 'VIT Vellore']
+DEGREES = [('Bachelor of Technology', 'Information Technology'), ('Bachelor of Technology', 'Computer Science'),
+           ('Master of Technology', 'Data Science'), ('Bachelor of Science', 'Mathematics'), ('Senior Secondary', 'Science')]
+COMPANIES = ['LearnIT - Manipal University Jaipur', 'Infosys', 'TCS', 'Razorpay', 'Zomato', 'Flipkart', 'Atlassian',
+             'Google', 'Microsoft', 'Freshworks']
+ROLES = ['President', 'Software Engineer Intern', 'Data Analyst', 'Backend Developer', 'ML Engineer', 'Team Lead']
+LOCATIONS = ['Jaipur, India', 'Bengaluru, India', 'Pune, India', 'Hyderabad, India', 'Remote']
+CERTIFICATIONS = [('Getting Started with Git and GitHub', 'IBM'), ('Tools for Data Science', 'IBM'),
+                  ('Django Web Framework', 'IBM'), ('Data Analysis Using PySpark', 'Coursera Project Network'),
+                  ('AWS Cloud Practitioner', 'Amazon Web Services'), ('TensorFlow Developer', 'Google')]
+ACHIEVEMENTS = [('Smart India Hackathon Selection', 'Government of India'),
+                ('Academic Excellence Recognition', 'Manipal University Jaipur'),
+                ('Startup Conclave Runner-Up', 'Manipal University Jaipur'),
+                ('Atal Incubation Center Selection', 'Atal Incubation Center, MUJ'),
+                ('Best Paper Award', 'IEEE Student Chapter')]
+
+SYNTHETIC_SLUG_PREFIX = 'synthetic-user-'
+DEFAULT_PROFICIENCY_WEIGHTS = {'beginner': 2, 'intermediate': 4, 'advanced': 3, 'expert': 1}
+DEFAULT_STATUS_WEIGHTS = {'completed': 6, 'ongoing': 3, 'paused': 1}
+DEFAULT_COUNTS = {
+    'skills': (10, 45),
+    'projects': (2, 20),
+    'education': (1, 3),
+    'work_experience': (0, 6),
+    'certifications': (0, 8),
+    'achievements': (0, 6),
+}
+
+
+class PortfolioGenerator:
+    """
+    Reproducible synthetic portfolios written with batched bulk_create().
+
+    ``counts`` maps each child collection to an inclusive (min, max) range
+    sampled uniformly per profile. The same seed always yields the same data.
+    """
+
+    def __init__(self, seed=42, counts=None, proficiency_weights=None, status_weights=None, batch_size=5000):
+        self.rng = random.Random(seed)
+        self.counts = {**DEFAULT_COUNTS, **(counts or {})}
+        self.proficiency_weights = proficiency_weights or DEFAULT_PROFICIENCY_WEIGHTS
+        self.status_weights = status_weights or DEFAULT_STATUS_WEIGHTS
+        self.batch_size = batch_size
+        self.skill_pool = [(name, category) for category, names in SKILLS_BY_CATEGORY.items() for name in names]
+        self.pending = {}
+        self.created = {}
+
+    def _count(self, key):
+        low, high = self.counts[key]
+        return self.rng.randint(low, high)
+
+    def _date(self, start_year=2015, end_year=2025):
+        start = date(start_year, 1, 1)
+        return start + timedelta(days=self.rng.randrange((date(end_year, 12, 31) - start).days))
+
+    def _weighted(self, weights):
+        return self.rng.choices(list(weights), weights=list(weights.values()))[0]
+
+    def _add(self, instance):
+        model = type(instance)
+        batch = self.pending.setdefault(model, [])
+        batch.append(instance)
+        if len(batch) >= self.batch_size:
+            self._flush(model)
+
+    def _flush(self, model):
+        batch = self.pending.get(model)
+        if batch:
+            model.objects.bulk_create(batch, batch_size=self.batch_size)
+            self.created[model.__name__] = self.created.get(model.__name__, 0) + len(batch)
+            self.pending[model] = []
+
+    @staticmethod
+    def next_number():
+        """One past the highest existing synthetic-user-<n> slug, so reruns never reuse a slug"""
+        # Longest first, then descending: the numeric maximum without casting in SQL
+        slug = (
+            Profile.objects.filter(slug__regex=rf'^{SYNTHETIC_SLUG_PREFIX}[0-9]+$')
+            .order_by(Length('slug').desc(), '-slug')
+            .values_list('slug', flat=True)
+            .first()
+        )
+        return int(slug[len(SYNTHETIC_SLUG_PREFIX):]) + 1 if slug else 0
+
+    def make_profiles(self, count, offset=0):
+        profiles = []
+        for i in range(offset, offset + count):
+            profiles.append(Profile(
+                name=f'Synthetic User {i}',
+                slug=f'{SYNTHETIC_SLUG_PREFIX}{i}',
+                email=f'user{i}@example.com',
+                phone=f'900-{i % 1000:03d}-{self.rng.randrange(10000):04d}',
+                linkedin=f'https://linkedin.com/in/synthetic-{i}',
+                github=f'https://github.com/synthetic-{i}',
+                summary='Generated profile for load testing the portfolio API.',
+                cgpa=round(self.rng.uniform(6.0, 10.0), 2),
+            ))
+        created = Profile.objects.bulk_create(profiles, batch_size=self.batch_size)
+        self.created['Profile'] = self.created.get('Profile', 0) + len(created)
+        return created
+
+    def add_children(self, profile):
+        skill_count = self._count('skills')
+        for name, category in self.rng.sample(self.skill_pool, min(skill_count, len(self.skill_pool))):
+            self._add(Skill(profile=profile, name=name, category=category,
+                            proficiency=self._weighted(self.proficiency_weights)))
+        # Profiles asking for more skills than the vocabulary get numbered variants
+        for extra in range(len(self.skill_pool), skill_count):
+            name, category = self.skill_pool[extra % len(self.skill_pool)]
+            self._add(Skill(profile=profile, name=f'{name} {extra // len(self.skill_pool) + 1}', category=category,
+                            proficiency=self._weighted(self.proficiency_weights)))
+
+        for _ in range(self._count('projects')):
+            start = self._date()
+            status = self._weighted(self.status_weights)
+            subject = self.rng.choice(PROJECT_SUBJECTS)
+            technologies = self.rng.sample(TECHNOLOGIES, self.rng.randint(2, 7))
+            self._add(Project(
+                profile=profile,
+                title=f'{subject} {self.rng.choice(PROJECT_KINDS)}',
+                description=f'Built a {subject.lower()} system using {", ".join(technologies)}.',
+                technologies=technologies,
+                start_date=start,
+                end_date=None if status == 'ongoing' else start + timedelta(days=self.rng.randint(30, 400)),
+                status=status,
+                github_link=f'https://github.com/synthetic-{profile.pk}/{subject.lower().replace(" ", "-")}',
+                achievements='' if self.rng.random() < 0.6 else f'Recognised for the {subject.lower()} results',
+            ))
+
+        for _ in range(self._count('education')):
+            degree, field = self.rng.choice(DEGREES)
+            start = self._date(2010, 2023)
+            self._add(Education(
+                profile=profile, institution=self.rng.choice(INSTITUTIONS), degree=degree, field_of_study=field,
+                start_date=start, end_date=start + timedelta(days=365 * self.rng.randint(2, 4)),
+                cgpa=round(self.rng.uniform(6.0, 10.0), 2), is_current=self.rng.random() < 0.2,
+            ))
+
+        for _ in range(self._count('work_experience')):
+            start = self._date()
+            is_current = self.rng.random() < 0.2
+            self._add(WorkExperience(
+                profile=profile, company=self.rng.choice(COMPANIES), role=self.rng.choice(ROLES),
+                description='Delivered features, reviewed code and mentored peers.',
+                start_date=start, end_date=None if is_current else start + timedelta(days=self.rng.randint(60, 900)),
+                is_current=is_current, location=self.rng.choice(LOCATIONS),
+            ))
+
+        for _ in range(self._count('certifications')):
+            name, issuer = self.rng.choice(CERTIFICATIONS)
+            self._add(Certification(
+                profile=profile, name=name, issuer=issuer,
+                issue_date=None if self.rng.random() < 0.1 else self._date(),
+            ))
+
+        for _ in range(self._count('achievements')):
+            title, organization = self.rng.choice(ACHIEVEMENTS)
+            self._add(Achievement(
+                profile=profile, title=title, organization=organization,
+                description=f'{title} awarded by {organization}',
+                date_achieved=None if self.rng.random() < 0.1 else self._date(),
+            ))
+
+    def generate(self, profiles, chunk=1000, progress=None):
+        """Create ``profiles`` profiles and their children; returns per-model row counts"""
+        offset = self.next_number()
+        first_id = None
+        for start in range(0, profiles, chunk):
+            for profile in self.make_profiles(min(chunk, profiles - start), offset + start):
+                first_id = profile.pk if first_id is None else first_id
+                self.add_children(profile)
+            if progress:
+                progress(start + min(chunk, profiles - start), dict(self.created))
+        for model in list(self.pending):
+            self._flush(model)
+        if first_id is not None:
+            # bulk_create skips the save hooks that link technologies, rank skills and count rows
+            technologies.sync_projects(Project.objects.filter(profile_id__gte=first_id))
+            technologies.link_skills(Skill.objects.filter(profile_id__gte=first_id))
+            Skill.objects.filter(profile_id__gte=first_id).update(proficiency_rank=Skill.rank_expression())
+            counters.reconcile(Profile.objects.filter(pk__gte=first_id))
+        return dict(self.created)
@@ -0,0 +1,133 @@
+import operator
+from functools import lru_cache
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+# Fields whose to_representation() returns database values unchanged
+PASSTHROUGH_FIELDS = (serializers.IntegerField, serializers.CharField, serializers.BooleanField)
+
+
+class PerCallConverter:
+    """A converter depending on request state (the active time zone), bound once per many() call"""
+
+    def __init__(self, bind):
+        self.bind = bind
+
+
+def datetime_converter(field):
+    """DateTimeField.to_representation() with the time zone lookup hoisted out of the row loop"""
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    if not output_format or output_format.lower() != 'iso-8601':
+        return field.to_representation
+    field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+    if field_timezone is None:
+        return field.to_representation
+
+    def convert(value):
+        if value.tzinfo is None:
+            return field.to_representation(value)
+        text = value.astimezone(field_timezone).isoformat()
+        return text[:-6] + 'Z' if text.endswith('+00:00') else text
+    return convert
+
+
+def compile_converter(field):
+    """
+    Return a callable turning a non-None column value into what ``field``
+    would render, or None when the value is already JSON-ready.
+    """
+    if isinstance(field, serializers.ChoiceField):
+        return None if all(isinstance(key, str) for key in field.choices) else field.to_representation
+    if isinstance(field, PASSTHROUGH_FIELDS):
+        return None
+    if isinstance(field, serializers.DateField) and not isinstance(field, serializers.DateTimeField):
+        output_format = getattr(field, 'format', api_settings.DATE_FORMAT)
+        if output_format and output_format.lower() == 'iso-8601':
+            return operator.methodcaller('isoformat')
+    if isinstance(field, serializers.DateTimeField):
+        return PerCallConverter(lambda: datetime_converter(field))
+    if isinstance(field, serializers.ListField):
+        child = compile_converter(field.child)
+        if isinstance(child, PerCallConverter):
+            return field.to_representation
+        if child is None:
+            return list
+        return lambda items: [None if item is None else child(item) for item in items]
+    # Decimals, datetimes and anything unusual keep DRF's exact formatting
+    return field.to_representation
+
+
+class ValuesSerializer:
+    """
+    Read-only fast path producing the same output as a ModelSerializer.
+
+    The serializer's readable fields are compiled once into (name, column,
+    converter) steps, so rows from ``.values()`` (or model instances) are
+    rendered without per-row field binding, get_attribute() lookups or
+    to_representation() dispatch.
+    """
+
+    def __init__(self, serializer_class):
+        steps = []
+        for field in serializer_class().fields.values():
+            if field.write_only:
+                continue
+            if field.source == '*' or '.' in field.source or isinstance(
+                    field, (serializers.SerializerMethodField, serializers.BaseSerializer)):
+                raise ImproperlyConfigured(
+                    f'{serializer_class.__name__}.{field.field_name} cannot be read from .values()')
+            steps.append((field.field_name, field.source, compile_converter(field)))
+        self.steps = steps
+        self.columns = [column for _, column, _ in steps]
+
+    def values(self, queryset):
+        return queryset.values(*self.columns)
+
+    def bound_steps(self):
+        return [
+            (name, column, convert.bind() if isinstance(convert, PerCallConverter) else convert)
+            for name, column, convert in self.steps
+        ]
+
+    def to_representation(self, row, steps=None):
+        steps = steps or self.bound_steps()
+        data = {}
+        if isinstance(row, dict):
+            for name, column, convert in steps:
+                value = row[column]
+                data[name] = value if value is None or convert is None else convert(value)
+        else:
+            for name, column, convert in steps:
+                value = getattr(row, column)
+                data[name] = value if value is None or convert is None else convert(value)
+        return data
+
+    def many(self, rows):
+        steps = self.bound_steps()
+        return [self.to_representation(row, steps) for row in rows]
+
+
+@lru_cache(maxsize=None)
+def values_serializer(serializer_class):
+    return ValuesSerializer(serializer_class)
+
+
+def serialize_values(serializer_class, queryset):
+    """Render ``queryset`` like ``serializer_class(queryset, many=True).data`` via .values()"""
+    serializer = values_serializer(serializer_class)
+    return serializer.many(serializer.values(queryset))
+
+
+class ValuesListMixin:
+    """Serve the list action from .values() rows through a ValuesSerializer"""
+
+    def list(self, request, *args, **kwargs):
+        serializer = values_serializer(self.get_serializer_class())
+        queryset = serializer.values(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer.many(page))
+        return Response(serializer.many(queryset))
@@ -0,0 +1,98 @@
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.db import transaction
+from .cache import response_cache
+
+
+class ProfileIndexCache:
+    """
+    Per-process, per-profile in-memory indexes, built on first use.
+
+    Subclasses implement load(profile_id) and keep loaded indexes current
+    from model signals through apply(). Writes made by other processes are
+    noticed through the profile's response cache version (a cache read,
+    not a query) and the index is reloaded; ``ttl_setting`` bounds how long
+    anything missed can linger. At most ``max_profiles_setting`` indexes
+    are kept, least recently used first out.
+    """
+
+    max_profiles_setting = None
+    ttl_setting = None
+    default_max_profiles = 100
+    default_ttl = 300
+
+    def __init__(self):
+        self._indexes = OrderedDict()
+        self._lock = threading.RLock()
+
+    @property
+    def max_profiles(self):
+        return getattr(settings, self.max_profiles_setting, self.default_max_profiles)
+
+    @property
+    def ttl(self):
+        return getattr(settings, self.ttl_setting, self.default_ttl)
+
+    def load(self, profile_id):
+        raise NotImplementedError
+
+    def get(self, profile_id):
+        """The profile's current index, (re)loading it if it is missing or stale"""
+        version = response_cache.version(profile_id)
+        with self._lock:
+            entry = self._indexes.get(profile_id)
+            if entry is not None:
+                index, index_version, loaded_at = entry
+                if index_version == version and time.monotonic() - loaded_at < self.ttl:
+                    self._indexes.move_to_end(profile_id)
+                    return index
+        index = self.load(profile_id)
+        with self._lock:
+            self._indexes[profile_id] = (index, version, time.monotonic())
+            self._indexes.move_to_end(profile_id)
+            while len(self._indexes) > self.max_profiles:
+                self._indexes.popitem(last=False)
+        return index
+
+    def read(self, profile_id, func):
+        """Call func(index) on the profile's current index, under the lock writers take"""
+        index = self.get(profile_id)
+        with self._lock:
+            return func(index)
+
+    def is_loaded(self, profile_id):
+        return profile_id in self._indexes
+
+    def apply(self, profile_id, func):
+        """
+        Call func(index) on a loaded index to apply a row change in place.
+
+        Run after the change's response cache bump, so the index adopts the
+        bumped version instead of reloading; from a signal, use
+        apply_on_commit().
+        """
+        with self._lock:
+            entry = self._indexes.get(profile_id)
+            if entry is None:
+                return
+            index, _, loaded_at = entry
+            func(index)
+            self._indexes[profile_id] = (index, response_cache.version(profile_id), loaded_at)
+
+    def apply_on_commit(self, profile_id, func):
+        """
+        apply() once the write commits. Bumps are deferred to the commit too
+        and registered first, so they have happened by then; a rolled-back
+        write never reaches the index.
+        """
+        transaction.on_commit(lambda: self.apply(profile_id, func))
+
+    def invalidate(self, profile_ids=None):
+        """Drop the indexes of ``profile_ids`` (default all); they reload on next use"""
+        with self._lock:
+            if profile_ids is None:
+                self._indexes.clear()
+            for profile_id in profile_ids or ():
+                self._indexes.pop(profile_id, None)
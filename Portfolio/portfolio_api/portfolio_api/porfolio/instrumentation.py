@@ -0,0 +1,182 @@
+import logging
+import random
+import time
+from contextlib import ExitStack
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger('portfolio.performance')
+
+
+def view_name(request):
+    """Readable name of the resolved view, e.g. ``ProfileViewSet.me`` or ``views.search``"""
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return None
+    func = match.func
+    cls = getattr(func, 'cls', None)
+    actions = getattr(func, 'actions', None)
+    if cls is not None and actions:
+        return f'{cls.__name__}.{actions.get(request.method.lower(), request.method.lower())}'
+    # @api_view functions are wrapped in a generated APIView named after them
+    owner = cls or func
+    return f'{owner.__module__.rsplit(".", 1)[-1]}.{owner.__name__}'
+
+
+def get_metrics(request):
+    """The RequestMetrics for a sampled request, else None (accepts DRF requests too)"""
+    return getattr(request, '_portfolio_metrics', None)
+
+
+class RequestMetrics:
+    """Per-request timings, in seconds"""
+
+    def __init__(self):
+        self.view_name = None
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.view_started = None
+        self.view_sql_time = 0.0
+        self.serialize_time = None
+        self.render_started = None
+        self.render_time = None
+
+    def start_view(self):
+        self.view_started = time.perf_counter()
+        self.view_sql_time = self.sql_time
+        self.serialize_time = None
+
+    def end_view(self):
+        # Time spent in the view outside SQL is serialization and view logic
+        if self.view_started is not None and self.serialize_time is None:
+            elapsed = time.perf_counter() - self.view_started
+            self.serialize_time = max(elapsed - (self.sql_time - self.view_sql_time), 0.0)
+
+    def start_render(self):
+        self.render_started = time.perf_counter()
+
+    def end_render(self, response):
+        self.render_time = time.perf_counter() - self.render_started
+
+    def server_timing(self, total):
+        entries = [f'db;dur={self.sql_time * 1000:.2f};desc="{self.sql_count} queries"']
+        if self.serialize_time is not None:
+            entries.append(f'serialize;dur={self.serialize_time * 1000:.2f}')
+        if self.render_time is not None:
+            entries.append(f'render;dur={self.render_time * 1000:.2f}')
+        entries.append(f'total;dur={total * 1000:.2f}')
+        return ', '.join(entries)
+
+    def summary(self):
+        parts = [f'{self.sql_count} queries', f'db {self.sql_time * 1000:.1f}ms']
+        if self.serialize_time is not None:
+            parts.append(f'serialize {self.serialize_time * 1000:.1f}ms')
+        if self.render_time is not None:
+            parts.append(f'render {self.render_time * 1000:.1f}ms')
+        return ', '.join(parts)
+
+
+class QueryTimer:
+    """execute_wrapper that accumulates SQL time and logs slow statements"""
+
+    def __init__(self, metrics, slow_query_ms):
+        self.metrics = metrics
+        self.slow_query_ms = slow_query_ms
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            self.metrics.sql_count += 1
+            self.metrics.sql_time += duration
+            if duration * 1000 >= self.slow_query_ms:
+                logger.warning('Slow query %.1fms in %s: %s', duration * 1000,
+                               self.metrics.view_name or '-', sql[:2000])
+
+
+class InstrumentationMiddleware:
+    """
+    Times every request and logs those slower than PORTFOLIO_SLOW_REQUEST_MS.
+
+    A PORTFOLIO_TIMING_SAMPLE_RATE fraction of requests is instrumented in
+    full: SQL count and time (logging statements slower than
+    PORTFOLIO_SLOW_QUERY_MS), serializer and render time, reported in a
+    ``Server-Timing`` header. Unsampled requests pay for two clock reads.
+    Keep it last in MIDDLEWARE so the render window covers only rendering.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'PORTFOLIO_TIMING_SAMPLE_RATE', 1.0)
+        self.slow_request_ms = getattr(settings, 'PORTFOLIO_SLOW_REQUEST_MS', 500)
+        self.slow_query_ms = getattr(settings, 'PORTFOLIO_SLOW_QUERY_MS', 100)
+
+    def __call__(self, request):
+        started = time.perf_counter()
+        if self.sample_rate < 1 and random.random() >= self.sample_rate:
+            response = self.get_response(request)
+            self.log_slow_request(request, time.perf_counter() - started)
+            return response
+
+        metrics = RequestMetrics()
+        request._portfolio_metrics = metrics
+        with ExitStack() as stack:
+            timer = QueryTimer(metrics, self.slow_query_ms)
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timer))
+            response = self.get_response(request)
+        metrics.end_view()
+
+        total = time.perf_counter() - started
+        response['Server-Timing'] = metrics.server_timing(total)
+        self.log_slow_request(request, total, metrics)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = get_metrics(request)
+        if metrics is not None:
+            metrics.view_name = view_name(request)
+            metrics.start_view()
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered right after this hook runs
+        metrics = get_metrics(request)
+        if metrics is not None:
+            metrics.end_view()
+            metrics.start_render()
+            response.add_post_render_callback(metrics.end_render)
+        return response
+
+    def log_slow_request(self, request, total, metrics=None):
+        if total * 1000 < self.slow_request_ms:
+            return
+        name = metrics.view_name if metrics else view_name(request)
+        details = f' ({metrics.summary()})' if metrics else ''
+        logger.warning('Slow request %s %s in %s: %.1fms%s', request.method, request.get_full_path(),
+                       name or '-', total * 1000, details)
+
+
+class ServerTimingMixin:
+    """
+    Narrows the middleware's serialize timing to the handler itself, leaving
+    out authentication, content negotiation and conditional-GET checks.
+    Hooks ConditionalGetMixin.call_handler(), so list it before that mixin.
+    """
+
+    def call_handler(self, handler, request, *args, **kwargs):
+        self._handler_started = True
+        metrics = get_metrics(request)
+        if metrics is not None:
+            metrics.start_view()
+        return super().call_handler(handler, request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        metrics = get_metrics(request)
+        if metrics is not None:
+            if not getattr(self, '_handler_started', False):
+                # Answered before the handler (a 304, a denied request): nothing was serialized
+                metrics.start_view()
+            metrics.end_view()
+        return super().finalize_response(request, response, *args, **kwargs)
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from portfolio.snapshots import export_snapshots, snapshot_dir
+
+
+class Command(BaseCommand):
+    help = 'Render the read-only GET endpoints to precompressed JSON snapshots under STATIC_ROOT'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profile', type=int, action='append', dest='profiles', metavar='ID',
+                            help='Only export per-profile routes for this profile (repeatable)')
+
+    def handle(self, *args, **options):
+        manifest = export_snapshots(options['profiles'])
+        for path, name in manifest['files'].items():
+            self.stdout.write(f'  {path} -> {name}')
+        self.stdout.write(self.style.SUCCESS(
+            f"Exported {len(manifest['files'])} snapshots to {snapshot_dir()}"
+        ))
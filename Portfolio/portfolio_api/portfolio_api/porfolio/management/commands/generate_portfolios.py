@@ -0,0 +1,78 @@
+import time
+from django.core.management.base import BaseCommand, CommandError
+from portfolio.cache import response_cache
+from portfolio.datagen import DEFAULT_COUNTS, PortfolioGenerator
+from portfolio.models import Profile
+from portfolio.resolver import profile_resolver
+from portfolio.search import get_search_backend
+from portfolio.signals import invalidate_snapshots
+
+
+def count_range(value):
+    """Parse 'min:max' (or a single number) into an inclusive range"""
+    try:
+        low, _, high = value.partition(':')
+        low, high = int(low), int(high or low)
+    except ValueError:
+        raise CommandError(f"Expected MIN:MAX, got '{value}'")
+    if low < 0 or high < low:
+        raise CommandError(f"Invalid range '{value}'")
+    return low, high
+
+
+def weights(value):
+    """Parse 'key=weight,key=weight' into a dict"""
+    try:
+        return {key: float(weight) for key, weight in (pair.split('=') for pair in value.split(','))}
+    except ValueError:
+        raise CommandError(f"Expected key=weight pairs, got '{value}'")
+
+
+class Command(BaseCommand):
+    help = 'Generate synthetic portfolios at scale with batched bulk_create and a seeded RNG'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profiles', type=int, default=100, help='Number of profiles to create')
+        parser.add_argument('--seed', type=int, default=42, help='RNG seed; the same seed yields the same data')
+        parser.add_argument('--batch-size', type=int, default=5000)
+        for key, (low, high) in DEFAULT_COUNTS.items():
+            parser.add_argument(
+                f"--{key.replace('_', '-')}", type=count_range, default=(low, high), metavar='MIN:MAX',
+                help=f'Rows per profile (default {low}:{high})',
+            )
+        parser.add_argument('--proficiency-weights', type=weights, help='e.g. beginner=2,intermediate=4,advanced=3,expert=1')
+        parser.add_argument('--status-weights', type=weights, help='e.g. completed=6,ongoing=3,paused=1')
+        parser.add_argument('--clear', action='store_true', help='Delete all existing profiles first')
+        parser.add_argument('--skip-index', action='store_true', help='Do not rebuild the search index afterwards')
+
+    def handle(self, *args, **options):
+        if options['clear']:
+            Profile.objects.all().delete()
+
+        generator = PortfolioGenerator(
+            seed=options['seed'],
+            counts={key: options[key] for key in DEFAULT_COUNTS},
+            proficiency_weights=options['proficiency_weights'],
+            status_weights=options['status_weights'],
+            batch_size=options['batch_size'],
+        )
+        started = time.perf_counter()
+
+        def progress(done, created):
+            rows = sum(created.values())
+            self.stdout.write(f'  {done}/{options["profiles"]} profiles, {rows} rows ({time.perf_counter() - started:.1f}s)')
+
+        created = generator.generate(options['profiles'], progress=progress)
+
+        # bulk_create skips the post_save hooks that keep these current
+        if not options['skip_index']:
+            get_search_backend().rebuild()
+        response_cache.bump()
+        profile_resolver.invalidate()
+        invalidate_snapshots()
+
+        for model_name, count in created.items():
+            self.stdout.write(f'{model_name}: {count}')
+        self.stdout.write(self.style.SUCCESS(
+            f'Generated {sum(created.values())} rows in {time.perf_counter() - started:.1f}s'
+        ))
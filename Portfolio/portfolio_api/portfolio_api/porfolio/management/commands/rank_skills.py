@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+from portfolio.models import Skill
+from portfolio.signals import profiles_rewritten
+
+
+class Command(BaseCommand):
+    help = 'Recompute Skill.proficiency_rank from proficiency (after upgrading an existing database or raw SQL writes)'
+
+    def handle(self, *args, **options):
+        stale = Skill.objects.exclude(proficiency_rank=Skill.rank_expression())
+        profile_ids = set(stale.values_list('profile_id', flat=True))
+        updated = stale.update(proficiency_rank=Skill.rank_expression())
+        profiles_rewritten(profile_ids)
+        self.stdout.write(self.style.SUCCESS(f'Re-ranked {updated} skills'))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+from portfolio.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the full-text search index for skills, projects, education and work experience'
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        backend.rebuild()
+        self.stdout.write(self.style.SUCCESS(f'Search index rebuilt with {type(backend).__name__}'))
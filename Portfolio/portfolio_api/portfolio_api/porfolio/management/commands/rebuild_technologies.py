@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from portfolio import technologies
+from portfolio.models import Profile
+from portfolio.signals import profiles_rewritten
+
+
+class Command(BaseCommand):
+    help = 'Rebuild technology links, per-profile technology counts and skill links from Project.technologies'
+
+    def handle(self, *args, **options):
+        links, skills, pruned = technologies.rebuild()
+        # Every profile's technology counts were rewritten with bulk writes
+        profiles_rewritten(Profile.objects.values_list('pk', flat=True))
+        self.stdout.write(self.style.SUCCESS(f'Linked {links} project technologies and {skills} skills, '
+                                             f'removed {pruned} unused technologies'))
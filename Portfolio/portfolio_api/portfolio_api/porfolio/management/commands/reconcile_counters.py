@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+from portfolio import counters
+from portfolio.models import Profile
+from portfolio.signals import profiles_rewritten
+
+
+class Command(BaseCommand):
+    help = 'Check the denormalized Profile counters and top skills against the child rows and fix any drift'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profile', type=int, action='append', dest='profiles',
+                            help='Only check this profile id (repeatable)')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Report drift without fixing it; exits non-zero if any is found')
+
+    def handle(self, *args, **options):
+        profiles = Profile.objects.all()
+        if options['profiles']:
+            profiles = profiles.filter(pk__in=options['profiles'])
+        drift = counters.reconcile(profiles, fix=not options['dry_run'])
+        if drift and not options['dry_run']:
+            # Counters were fixed with .update(): stale payloads and ETags must go too
+            profiles_rewritten(drift)
+        for profile_id, fields in sorted(drift.items()):
+            changes = ', '.join(f'{field} {stored} -> {actual}' for field, (stored, actual) in fields.items())
+            self.stdout.write(f'Profile {profile_id}: {changes}')
+        if not drift:
+            self.stdout.write(self.style.SUCCESS('No drift'))
+        elif options['dry_run']:
+            raise CommandError(f'{len(drift)} profile(s) drifted')
+        else:
+            self.stdout.write(self.style.SUCCESS(f'Fixed {len(drift)} profile(s)'))
@@ -0,0 +1,249 @@
+import math
+import re
+from collections import Counter
+from django.db import transaction
+from .indexes import ProfileIndexCache
+from .models import Skill, Project, WorkExperience
+
+try:
+    import numpy as np
+except ImportError:  # optional: /api/match/ answers 503 without it
+    np = None
+
+TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*')
+STOP_WORDS = frozenset("""
+    a about across all also an and any are as at be been being both but by can could do does
+    each either etc for from had has have help helps how i if in into is it its join looking
+    may more most must nice not of on or other our ours plus should so such than that the
+    their them then there these they this those through to us using very via was we well
+    were what when where which while who will with within would you your
+    ability candidate experience familiarity hiring junior knowledge preferred required
+    requirements responsibilities role seeking senior skills strong team work years
+""".split())
+
+
+def tokenize(text):
+    """Lowercased word tokens of ``text``, keeping names like c++, c# and node.js whole"""
+    return [token for token in TOKEN_RE.findall(text.casefold()) if token not in STOP_WORDS]
+
+
+class MatchSource:
+    """
+    A matched model: ``fields`` maps each field to how many times its terms
+    count, ``payload`` lists the fields returned with a match.
+    """
+
+    def __init__(self, model, fields, payload, boost=None):
+        self.model = model
+        self.fields = fields
+        self.payload = payload
+        self.boost = boost
+
+    @property
+    def columns(self):
+        columns = ['id', *self.fields, *self.payload]
+        if self.model is Skill:
+            columns.append('proficiency_rank')
+        return list(dict.fromkeys(columns))
+
+    def document(self, values):
+        """(term counts, row weight, payload) of one row given {column: value}"""
+        terms = Counter()
+        for field, weight in self.fields.items():
+            value = values.get(field) or ''
+            for token in tokenize(' '.join(value) if isinstance(value, (list, tuple)) else str(value)):
+                terms[token] += weight
+        boost = self.boost(values) if self.boost else 1.0
+        return terms, boost, {field: values.get(field) for field in ['id', *self.payload]}
+
+
+def proficiency_boost(values):
+    # expert skills score as found; beginner ones at a quarter
+    return values['proficiency_rank'] / max(Skill.PROFICIENCY_RANKS.values())
+
+
+MATCH_SOURCES = {
+    'skills': MatchSource(Skill, fields={'name': 1}, payload=['name', 'category', 'proficiency'],
+                          boost=proficiency_boost),
+    'projects': MatchSource(Project, fields={'title': 1, 'description': 1, 'technologies': 2},
+                            payload=['title', 'technologies']),
+    'work_experience': MatchSource(WorkExperience, fields={'role': 2, 'description': 1},
+                                   payload=['company', 'role']),
+}
+MATCH_MODELS = {source.model: key for key, source in MATCH_SOURCES.items()}
+
+
+class TermMatrix:
+    """
+    One profile's skills, projects and work experience as a dense TF-IDF
+    matrix, one row per row of those tables and one column per term.
+
+    Raw weighted term counts and document frequencies are kept so a
+    changed row only rewrites its own counts; the IDF-weighted,
+    L2-normalised matrix is recomputed with a few array operations on the
+    next score() rather than by re-reading the profile.
+    """
+
+    def __init__(self):
+        self.vocabulary = {}
+        self.rows = {}
+        self.free = []
+        self.meta = []
+        self.counts = np.zeros((16, 256), dtype=np.float32)
+        self.document_frequency = np.zeros(256, dtype=np.float32)
+        self.boosts = np.zeros(16, dtype=np.float32)
+        self._weighted = None
+        self._idf = None
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _column(self, term):
+        column = self.vocabulary.get(term)
+        if column is None:
+            column = self.vocabulary[term] = len(self.vocabulary)
+            if column >= self.counts.shape[1]:
+                width = self.counts.shape[1] * 2
+                self.counts = np.pad(self.counts, ((0, 0), (0, width - self.counts.shape[1])))
+                self.document_frequency = np.pad(self.document_frequency, (0, width - len(self.document_frequency)))
+        return column
+
+    def _row(self):
+        if self.free:
+            return self.free.pop()
+        row = len(self.meta)
+        self.meta.append(None)
+        if row >= self.counts.shape[0]:
+            height = self.counts.shape[0] * 2
+            self.counts = np.pad(self.counts, ((0, height - self.counts.shape[0]), (0, 0)))
+            self.boosts = np.pad(self.boosts, (0, height - len(self.boosts)))
+        return row
+
+    def set_document(self, key, terms, boost, payload):
+        """Add or replace the document ``key`` (a (source, id) pair)"""
+        self.remove_document(key)
+        columns = [self._column(term) for term in terms]
+        row = self._row()
+        if columns:
+            self.counts[row, columns] = list(terms.values())
+            self.document_frequency[columns] += 1
+        self.boosts[row] = boost
+        self.meta[row] = (key[0], payload)
+        self.rows[key] = row
+        self._weighted = None
+
+    def remove_document(self, key):
+        row = self.rows.pop(key, None)
+        if row is None:
+            return
+        self.document_frequency -= self.counts[row] > 0
+        self.counts[row] = 0
+        self.boosts[row] = 0
+        self.meta[row] = None
+        self.free.append(row)
+        self._weighted = None
+
+    def has_term(self, term):
+        # Terms only deleted rows had keep their column, with no documents
+        column = self.vocabulary.get(term)
+        return column is not None and self.document_frequency[column] > 0
+
+    def _refresh(self):
+        if self._weighted is not None:
+            return
+        width = len(self.vocabulary)
+        live = len(self.rows)
+        self._idf = np.log((1 + live) / (1 + self.document_frequency[:width])) + 1
+        weighted = self.counts[:len(self.meta), :width] * self._idf
+        norms = np.linalg.norm(weighted, axis=1, keepdims=True)
+        self._weighted = weighted / np.where(norms > 0, norms, 1)
+
+    def score(self, tokens, limit, term_limit=20):
+        """
+        Cosine similarity of every row to ``tokens`` as one product of the
+        matrix's query-term columns with the query's TF-IDF weights.
+        """
+        self._refresh()
+        query = Counter(tokens)
+        unknown_idf = math.log(1 + len(self.rows)) + 1
+        known = [term for term in query if self.has_term(term)]
+        columns = [self.vocabulary[term] for term in known]
+        weights = np.array([query[term] for term in known], dtype=np.float32) * self._idf[columns]
+        missing = {term: query[term] * unknown_idf for term in query if term not in known}
+
+        total = float(weights.sum()) + sum(missing.values())
+        norm = math.sqrt(float(weights @ weights) + sum(weight * weight for weight in missing.values()))
+        result = {
+            'score': round(float(weights.sum()) / total, 4) if total else 0.0,
+            'matched_terms': [term for _, term in sorted(zip(weights.tolist(), known), reverse=True)][:term_limit],
+            'missing_terms': sorted(missing, key=missing.get, reverse=True)[:term_limit],
+        }
+        for key in MATCH_SOURCES:
+            result[key] = []
+        if not columns or not norm:
+            return result
+
+        scores = (self._weighted[:, columns] @ weights) / norm * self.boosts[:len(self.meta)]
+        for row in np.argsort(-scores, kind='stable'):
+            if scores[row] <= 0:
+                break
+            key, payload = self.meta[row]
+            if len(result[key]) < limit:
+                result[key].append({**payload, 'score': round(float(scores[row]), 4)})
+        return result
+
+
+class MatchIndex(ProfileIndexCache):
+    """
+    Per-process TermMatrix per profile behind /api/match/, patched from
+    model signals (see ProfileIndexCache). PORTFOLIO_MATCH_TTL and
+    PORTFOLIO_MATCH_PROFILES bound staleness and memory.
+    """
+
+    max_profiles_setting = 'PORTFOLIO_MATCH_PROFILES'
+    ttl_setting = 'PORTFOLIO_MATCH_TTL'
+    default_max_profiles = 20
+
+    def load(self, profile_id):
+        matrix = TermMatrix()
+        for key, source in MATCH_SOURCES.items():
+            for values in source.model.objects.filter(profile_id=profile_id).values(*source.columns):
+                matrix.set_document((key, values['id']), *source.document(values))
+        return matrix
+
+    def match(self, profile_id, description, limit=5):
+        tokens = tokenize(description)
+        return self.read(profile_id, lambda matrix: matrix.score(tokens, limit))
+
+    def document_saved(self, key, profile_id, document):
+        """Add or replace a saved row's document once the write commits (see apply_on_commit())"""
+        def save():
+            with self._lock:
+                # A row moved to another profile leaves its old profile's matrix
+                for other_id, (matrix, _, _) in list(self._indexes.items()):
+                    if other_id != profile_id and key in matrix.rows:
+                        self.apply(other_id, lambda matrix: matrix.remove_document(key))
+                self.apply(profile_id, lambda matrix: matrix.set_document(key, *document))
+        transaction.on_commit(save)
+
+    def document_deleted(self, key, profile_id):
+        self.apply_on_commit(profile_id, lambda matrix: matrix.remove_document(key))
+
+
+match_index = MatchIndex()
+
+
+def match_row_saved(sender, instance, raw=False, **kwargs):
+    """post_save: re-tokenize the saved row into its profile's matrix"""
+    if raw:
+        match_index.invalidate([instance.profile_id])
+        return
+    key = MATCH_MODELS[sender]
+    source = MATCH_SOURCES[key]
+    values = {column: getattr(instance, column) for column in source.columns}
+    match_index.document_saved((key, instance.pk), instance.profile_id, source.document(values))
+
+
+def match_row_deleted(sender, instance, **kwargs):
+    """post_delete: take the row out of its profile's matrix"""
+    match_index.document_deleted((MATCH_MODELS[sender], instance.pk), instance.profile_id)
@@ -1,8 +1,14 @@
-from django.db import models
+from django.db import models, transaction
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.utils.text import slugify
 
 class Profile(models.Model):
     name = models.CharField(max_length=100)
+    slug = models.SlugField(max_length=120, unique=True, null=True, blank=True)
+    host = models.CharField(max_length=255, unique=True, null=True, blank=True,
+                            help_text='Domain serving this profile, e.g. jane.example.com')
     email = models.EmailField()
     phone = models.CharField(max_length=20, blank=True)
     linkedin = models.URLField(blank=True)
@@ -12,9 +18,56 @@ class Profile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Denormalized tallies of the child rows, kept current by portfolio.counters
+    # (one column per Skill category and Project status)
+    total_skills = models.IntegerField(default=0, editable=False)
+    total_projects = models.IntegerField(default=0, editable=False)
+    total_certifications = models.IntegerField(default=0, editable=False)
+    total_achievements = models.IntegerField(default=0, editable=False)
+    skills_programming = models.IntegerField(default=0, editable=False)
+    skills_data_ml = models.IntegerField(default=0, editable=False)
+    skills_data_engineering = models.IntegerField(default=0, editable=False)
+    skills_cloud = models.IntegerField(default=0, editable=False)
+    skills_ml_ai = models.IntegerField(default=0, editable=False)
+    skills_web_dev = models.IntegerField(default=0, editable=False)
+    skills_tools = models.IntegerField(default=0, editable=False)
+    skills_soft_skills = models.IntegerField(default=0, editable=False)
+    projects_completed = models.IntegerField(default=0, editable=False)
+    projects_ongoing = models.IntegerField(default=0, editable=False)
+    projects_paused = models.IntegerField(default=0, editable=False)
+    # Names of the first five advanced/expert skills
+    top_skills = models.JSONField(default=list, editable=False)
+
+    DENORMALIZED_FIELDS = (
+        'total_skills', 'total_projects', 'total_certifications', 'total_achievements',
+        'skills_programming', 'skills_data_ml', 'skills_data_engineering', 'skills_cloud',
+        'skills_ml_ai', 'skills_web_dev', 'skills_tools', 'skills_soft_skills',
+        'projects_completed', 'projects_ongoing', 'projects_paused', 'top_skills',
+    )
+
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        if not self.slug:
+            self.slug = self.unique_slug()
+        # Hosts are matched case-insensitively; blank means "no custom domain"
+        self.host = (self.host or '').strip().lower() or None
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            # Never write back counters read before a concurrent child write
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.DENORMALIZED_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
+    def unique_slug(self):
+        base = slugify(self.name)[:100] or 'profile'
+        slug, suffix = base, 2
+        while Profile.objects.filter(slug=slug).exclude(pk=self.pk).exists():
+            slug, suffix = f'{base}-{suffix}', suffix + 1
+        return slug
+
 class Education(models.Model):
     profile = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='education')
     institution = models.CharField(max_length=200)
@@ -24,13 +77,53 @@ class Education(models.Model):
     end_date = models.DateField(null=True, blank=True)
     cgpa = models.DecimalField(max_digits=4, decimal_places=2, null=True, blank=True)
     is_current = models.BooleanField(default=False)
+    search_vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-start_date']
+        indexes = [
+            GinIndex(fields=['search_vector']),
+            models.Index(fields=['-start_date', 'id'], name='education_keyset_idx'),
+            models.Index(fields=['profile', '-start_date', 'id'], name='education_profile_idx'),
+        ]
 
     def __str__(self):
         return f"{self.degree} at {self.institution}"
 
+class Technology(models.Model):
+    """A technology name shared by projects and skills, matched case-insensitively"""
+    name = models.CharField(max_length=50)
+    key = models.CharField(max_length=50, unique=True, help_text='Canonical (lowercased) name')
+    projects = models.ManyToManyField('Project', through='ProjectTechnology', related_name='technology_set')
+
+    class Meta:
+        verbose_name_plural = 'technologies'
+
+    def __str__(self):
+        return self.name
+
+    @staticmethod
+    def canonical(name):
+        return ' '.join(name.split()).lower()
+
+    @classmethod
+    def for_name(cls, name):
+        """
+        The Technology for ``name``, created on first use; None for blank
+        names. Runs in the caller's transaction, so a write that rolls back
+        leaves no Technology behind.
+        """
+        key = cls.canonical(name)
+        if not key:
+            return None
+        technology = cls.objects.filter(key=key).first()
+        if technology is None:
+            # A concurrent writer may create the same key; re-read rather than trust our object
+            cls.objects.bulk_create([cls(key=key, name=' '.join(name.split()))], ignore_conflicts=True)
+            technology = cls.objects.get(key=key)
+        return technology
+
 class Skill(models.Model):
     PROFICIENCY_CHOICES = [
         ('beginner', 'Beginner'),
@@ -38,6 +131,10 @@ class Skill(models.Model):
         ('advanced', 'Advanced'),
         ('expert', 'Expert'),
     ]
+    # Ordinal rank of each level (beginner=1 .. expert=4), stored for range filters and sorting
+    PROFICIENCY_RANKS = {key: rank for rank, (key, _) in enumerate(PROFICIENCY_CHOICES, start=1)}
+    # skills/top lists skills at or above this level
+    TOP_PROFICIENCY = 'advanced'
     
     CATEGORY_CHOICES = [
         ('programming', 'Programming Languages'),
@@ -49,19 +146,66 @@ class Skill(models.Model):
         ('tools', 'Developer Tools'),
         ('soft_skills', 'Soft Skills'),
     ]
+    # Categories whose skills are not technologies and get no Technology link
+    NON_TECHNICAL_CATEGORIES = {'soft_skills'}
 
     profile = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='skills')
     name = models.CharField(max_length=100)
     category = models.CharField(max_length=20, choices=CATEGORY_CHOICES)
     proficiency = models.CharField(max_length=20, choices=PROFICIENCY_CHOICES, default='intermediate')
+    proficiency_rank = models.PositiveSmallIntegerField(default=2, editable=False)
+    # The technology this skill names, so projects using it are found by id
+    technology = models.ForeignKey(Technology, on_delete=models.SET_NULL, null=True, blank=True,
+                                   editable=False, related_name='skills')
+    search_vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         unique_together = ['profile', 'name']
         ordering = ['category', 'name']
+        indexes = [
+            GinIndex(fields=['search_vector']),
+            models.Index(fields=['category', 'name', 'id'], name='skill_keyset_idx'),
+            models.Index(fields=['profile', 'category', 'name'], name='skill_profile_idx'),
+            # Proficiency filters and best-first sorts, globally and per profile (skills/top)
+            models.Index(fields=['-proficiency_rank', 'category', 'name', 'id'], name='skill_rank_idx'),
+            models.Index(fields=['profile', '-proficiency_rank', 'category', 'name'], name='skill_profile_rank_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.proficiency})"
 
+    def save(self, *args, **kwargs):
+        self.proficiency_rank = self.PROFICIENCY_RANKS.get(self.proficiency, 0)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'proficiency' in update_fields:
+            kwargs['update_fields'] = update_fields = {*update_fields, 'proficiency_rank'}
+        relink = update_fields is None or not {'name', 'category'}.isdisjoint(update_fields)
+        if relink and update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'technology'}
+        with transaction.atomic():
+            if relink:
+                self.technology = self.resolve_technology(self.name, self.category)
+            super().save(*args, **kwargs)
+
+    @classmethod
+    def names_technology(cls, category):
+        return category not in cls.NON_TECHNICAL_CATEGORIES
+
+    @classmethod
+    def resolve_technology(cls, name, category):
+        """The Technology a skill links to, or None for non-technical categories"""
+        return Technology.for_name(name) if cls.names_technology(category) else None
+
+    @classmethod
+    def rank_expression(cls):
+        """proficiency_rank computed in SQL, for rows written without save() (bulk writes, backfills)"""
+        return models.Case(
+            *[models.When(proficiency=key, then=models.Value(rank)) for key, rank in cls.PROFICIENCY_RANKS.items()],
+            default=models.Value(0),
+            output_field=models.PositiveSmallIntegerField(),
+        )
+
 class Project(models.Model):
     STATUS_CHOICES = [
         ('completed', 'Completed'),
@@ -79,13 +223,50 @@ class Project(models.Model):
     github_link = models.URLField(blank=True)
     demo_link = models.URLField(blank=True)
     achievements = models.TextField(blank=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-start_date']
+        indexes = [
+            GinIndex(fields=['search_vector']),
+            models.Index(fields=['-start_date', 'id'], name='project_keyset_idx'),
+            models.Index(fields=['profile', '-start_date', 'id'], name='project_profile_idx'),
+            models.Index(fields=['status', '-start_date', 'id'], name='project_status_idx'),
+            # projects/featured reads only projects with achievements
+            models.Index(fields=['profile', '-start_date', 'id'], name='project_featured_idx',
+                         condition=~models.Q(achievements='')),
+            GinIndex(fields=['technologies'], name='project_technologies_idx'),
+        ]
 
     def __str__(self):
         return self.title
 
+class ProjectTechnology(models.Model):
+    """Project membership of a technology, kept in sync with Project.technologies"""
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='technology_links')
+    technology = models.ForeignKey(Technology, on_delete=models.CASCADE, related_name='project_links')
+    # Copied from the project so per-profile lookups stay on this table's index
+    profile = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='+', db_index=False)
+
+    class Meta:
+        unique_together = ['project', 'technology']
+        indexes = [
+            models.Index(fields=['technology', 'profile', 'project'], name='project_tech_reverse_idx'),
+        ]
+
+class ProfileTechnology(models.Model):
+    """How many of a profile's projects use a technology, maintained incrementally"""
+    profile = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='technology_counts', db_index=False)
+    technology = models.ForeignKey(Technology, on_delete=models.CASCADE, related_name='+')
+    project_count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ['profile', 'technology']
+        indexes = [
+            models.Index(fields=['profile', '-project_count'], name='profile_tech_count_idx'),
+        ]
+
 class WorkExperience(models.Model):
     profile = models.ForeignKey(Profile, on_delete=models.CASCADE, related_name='work_experience')
     company = models.CharField(max_length=200)
@@ -95,9 +276,16 @@ class WorkExperience(models.Model):
     end_date = models.DateField(null=True, blank=True)
     is_current = models.BooleanField(default=False)
     location = models.CharField(max_length=100, blank=True)
+    search_vector = SearchVectorField(null=True, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-start_date']
+        indexes = [
+            GinIndex(fields=['search_vector']),
+            models.Index(fields=['-start_date', 'id'], name='work_keyset_idx'),
+            models.Index(fields=['profile', '-start_date', 'id'], name='work_profile_idx'),
+        ]
 
     def __str__(self):
         return f"{self.role} at {self.company}"
@@ -109,9 +297,14 @@ class Certification(models.Model):
     issue_date = models.DateField(null=True, blank=True)
     expiry_date = models.DateField(null=True, blank=True)
     credential_url = models.URLField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-issue_date']
+        indexes = [
+            models.Index(fields=['-issue_date', 'id'], name='certification_keyset_idx'),
+            models.Index(fields=['profile', '-issue_date', 'id'], name='certification_profile_idx'),
+        ]
 
     def __str__(self):
         return self.name
@@ -122,9 +315,14 @@ class Achievement(models.Model):
     description = models.TextField()
     date_achieved = models.DateField(null=True, blank=True)
     organization = models.CharField(max_length=200, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         ordering = ['-date_achieved']
+        indexes = [
+            models.Index(fields=['-date_achieved', 'id'], name='achievement_keyset_idx'),
+            models.Index(fields=['profile', '-date_achieved', 'id'], name='achievement_profile_idx'),
+        ]
 
     def __str__(self):
         return self.title
\ No newline at end of file
@@ -0,0 +1,267 @@
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from django.db.models.query import ValuesIterable
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from .cache import response_cache, cache_header
+
+
+def requested_page_size(request, default, maximum):
+    """?page_size= (or its alias ?limit=) capped at ``maximum``, else ``default``"""
+    for param in ('page_size', 'limit'):
+        try:
+            requested = int(request.query_params[param])
+        except (KeyError, ValueError):
+            continue
+        if requested > 0:
+            return min(requested, maximum)
+    return default
+
+
+def ordering_field(model, name):
+    """The model field an ordering name refers to, following ``__`` relations"""
+    *path, last = name.split('__')
+    for part in path:
+        model = model._meta.get_field(part).related_model
+    return model._meta.get_field('id' if last == 'pk' else last)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination keyed on the model's Meta.ordering plus ``id``.
+
+    Unlike DRF's CursorPagination, the cursor stores the full ordering key of
+    the boundary row, so the next page is a single index range scan
+    (``WHERE (start_date, id) < (...)``-style) and page N costs the same as
+    page 1. NULLs in nullable ordering fields sort as the largest value,
+    matching PostgreSQL's default so plain DESC indexes still apply.
+    """
+
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+    def get_page_size(self, request):
+        return requested_page_size(request, settings.REST_FRAMEWORK.get('PAGE_SIZE', 20), self.max_page_size)
+
+    def get_ordering(self, queryset, view):
+        """Return [(field_name, descending, nullable)] ending in the id tiebreaker"""
+        model = queryset.model
+        names = list(getattr(view, 'action_ordering', None) or getattr(view, 'keyset_ordering', None)
+                     or model._meta.ordering)
+        if not any(name.lstrip('-') in ('id', 'pk') for name in names):
+            names.append('id')
+        ordering = []
+        for name in names:
+            path = name.lstrip('-')
+            field = ordering_field(model, path)
+            # Related lookups (technology__name) keep their path; local fields their name
+            ordering.append((path if '__' in path else field.name, name.startswith('-'), field.null))
+        return ordering
+
+    def order_by(self, ordering, reverse):
+        expressions = []
+        for name, descending, nullable in ordering:
+            if descending != reverse:
+                expressions.append(F(name).desc(nulls_first=True) if nullable else F(name).desc())
+            else:
+                expressions.append(F(name).asc(nulls_last=True) if nullable else F(name).asc())
+        return expressions
+
+    def after(self, ordering, values, reverse):
+        """Q matching rows strictly after ``values`` in the (possibly reversed) ordering"""
+        condition = Q(pk__in=[])
+        equal = Q()
+        for (name, descending, nullable), value in zip(ordering, values):
+            # NULL sorts above every value, as PostgreSQL orders it by default
+            if descending != reverse:
+                if value is None:
+                    later = Q(**{f'{name}__isnull': False})
+                else:
+                    later = Q(**{f'{name}__lt': value})
+            else:
+                if value is None:
+                    later = Q(pk__in=[])
+                else:
+                    later = Q(**{f'{name}__gt': value})
+                    if nullable:
+                        later |= Q(**{f'{name}__isnull': True})
+            same = Q(**{f'{name}__isnull': True}) if value is None else Q(**{name: value})
+            condition |= equal & later
+            equal &= same
+        # Implied by the OR above, but only a plain bound on the leading
+        # column lets the database start the index scan at the cursor
+        return condition & self.leading_bound(ordering[0], values[0], reverse)
+
+    def leading_bound(self, column, value, reverse):
+        """Q of rows at or after ``value`` in the leading ordering column"""
+        name, descending, nullable = column
+        if descending != reverse:
+            # NULLs (the largest values) come first, so they are all behind us
+            return Q() if value is None else Q(**{f'{name}__lte': value})
+        if value is None:
+            return Q(**{f'{name}__isnull': True})
+        bound = Q(**{f'{name}__gte': value})
+        return bound | Q(**{f'{name}__isnull': True}) if nullable else bound
+
+    def encode_cursor(self, values, reverse):
+        payload = json.dumps({'v': values, 'r': reverse}, default=str, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, encoded, model, ordering):
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            raw_values = payload['v']
+            reverse = bool(payload['r'])
+            if len(raw_values) != len(ordering):
+                raise ValueError
+            values = [
+                None if raw is None else ordering_field(model, name).to_python(raw)
+                for (name, _, _), raw in zip(ordering, raw_values)
+            ]
+        except (TypeError, ValueError, KeyError, binascii.Error, ValidationError):
+            raise NotFound('Invalid cursor')
+        return values, reverse
+
+    def row_values(self, row, ordering):
+        # Rows are model instances, or dicts when paging a .values() queryset
+        if isinstance(row, dict):
+            return [row[name] for name, _, _ in ordering]
+        values = []
+        for name, _, _ in ordering:
+            value = row
+            for part in name.split('__'):
+                value = getattr(value, part)
+            values.append(value)
+        return values
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        ordering = self.get_ordering(queryset, view)
+        # .values() rows must carry the ordering key the cursors are built from
+        if queryset._iterable_class is ValuesIterable:
+            selected = queryset._fields
+            missing = [name for name, _, _ in ordering if name not in selected]
+            if missing:
+                queryset = queryset.values(*selected, *missing)
+
+        encoded = request.query_params.get(self.cursor_query_param)
+        reverse = False
+        if encoded:
+            values, reverse = self.decode_cursor(encoded, queryset.model, ordering)
+            queryset = queryset.filter(self.after(ordering, values, reverse))
+
+        rows = list(queryset.order_by(*self.order_by(ordering, reverse))[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.next_cursor = None
+        self.previous_cursor = None
+        if rows:
+            has_next = has_more if not reverse else True
+            has_previous = bool(encoded) if not reverse else has_more
+            if has_next:
+                self.next_cursor = self.encode_cursor(self.row_values(rows[-1], ordering), False)
+            if has_previous:
+                self.previous_cursor = self.encode_cursor(self.row_values(rows[0], ordering), True)
+        return rows
+
+    def get_link(self, cursor):
+        if cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, cursor)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_link(self.next_cursor)),
+            ('previous', self.get_link(self.previous_cursor)),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'previous': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+
+class PortfolioPagination(BasePagination):
+    """
+    Page-number pagination by default, keyset pagination on request.
+
+    Clients opt in with ``?pagination=cursor`` (or by following a ``cursor``
+    link); setting PORTFOLIO_PAGINATION_MODE = 'cursor' makes keyset the
+    default and ``?pagination=page`` opts back out.
+    """
+
+    mode_query_param = 'pagination'
+
+    def get_mode(self, request):
+        requested = request.query_params.get(self.mode_query_param)
+        if requested in ('cursor', 'page'):
+            return requested
+        if KeysetPagination.cursor_query_param in request.query_params:
+            return 'cursor'
+        return getattr(settings, 'PORTFOLIO_PAGINATION_MODE', 'page')
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.get_mode(request) == 'cursor':
+            self.paginator = KeysetPagination()
+        else:
+            self.paginator = SizedPageNumberPagination()
+        return self.paginator.paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return self.paginator.get_paginated_response(data)
+
+    def get_paginated_response_schema(self, schema):
+        return SizedPageNumberPagination().get_paginated_response_schema(schema)
+
+
+class SizedPageNumberPagination(PageNumberPagination):
+    """Page-number pagination honouring ?page_size= and ?limit= up to max_page_size"""
+
+    max_page_size = 100
+
+    def get_page_size(self, request):
+        return requested_page_size(request, self.page_size, self.max_page_size)
+
+
+class PaginatedActionMixin:
+    """
+    Serve custom collection actions through the configured paginator, so
+    they are bounded like the list (?page=, ?cursor=, ?page_size=/?limit=)
+    and only one page is ever fetched from the database.
+    """
+
+    def paginated_action(self, name, queryset, ordering, render, profile_id=None):
+        """
+        Paginate ``queryset`` (usually a .values() queryset) in ``ordering``,
+        which the keyset cursors follow too, render the page rows with
+        ``render`` and cache the paginated payload under ``name`` per
+        profile and URL.
+        """
+        def build():
+            self.action_ordering = ordering
+            page = self.paginate_queryset(queryset.order_by(*ordering, 'pk'))
+            return self.get_paginated_response(render(page)).data
+
+        # The payload's next/previous links are absolute URLs of this request
+        params = {'url': self.request.build_absolute_uri()}
+        data, hit = response_cache.get_or_build(name, build, profile_id=profile_id, params=params)
+        return Response(data, headers=cache_header(hit))
@@ -0,0 +1,39 @@
+from functools import lru_cache
+from django.db.models import Prefetch
+from rest_framework import serializers
+
+
+@lru_cache(maxsize=None)
+def _nested_relations(serializer_class, prefix=''):
+    """Walk a serializer class and collect (lookup, model) for every many=True child"""
+    relations = []
+    for field in serializer_class().fields.values():
+        if not isinstance(field, serializers.ListSerializer):
+            continue
+        child = field.child
+        if not isinstance(child, serializers.ModelSerializer):
+            continue
+        lookup = prefix + field.source
+        relations.append((lookup, child.Meta.model))
+        # Recurse so nested serializers get their own lookups
+        relations.extend(_nested_relations(type(child), prefix=lookup + '__'))
+    return tuple(relations)
+
+
+def build_prefetch_plan(serializer_class, fields=None):
+    """
+    Derive prefetch_related lookups from a serializer tree.
+
+    Each nested many=True serializer becomes a Prefetch whose queryset is
+    ordered by the child model's Meta.ordering, so the prefetched rows come
+    back in the same order the lazy related manager would have used.
+    Pass ``fields`` to restrict the plan to a subset of top-level relations.
+    """
+    plan = []
+    for lookup, model in _nested_relations(serializer_class):
+        top_level = lookup.split('__', 1)[0]
+        if fields is not None and top_level not in fields:
+            continue
+        queryset = model._default_manager.order_by(*model._meta.ordering)
+        plan.append(Prefetch(lookup, queryset=queryset))
+    return plan
@@ -0,0 +1,37 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to a reused stdlib encoder
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson else 0
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Drop-in JSONRenderer producing the same bytes for compact output.
+
+    Uses orjson when it is installed (datetimes, decimals and other
+    non-native values still go through DRF's encoder so they format
+    identically), otherwise a single preconfigured stdlib encoder.
+    Pretty-printed (``indent``) and non-default configurations defer to
+    JSONRenderer.
+    """
+
+    _encoder = JSONEncoder(ensure_ascii=False, allow_nan=False, separators=(',', ':'))
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if (self.get_indent(accepted_media_type, renderer_context or {}) is not None
+                or self.ensure_ascii or not self.compact or not self.strict):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        if orjson is not None:
+            ret = orjson.dumps(data, default=self._encoder.default, option=ORJSON_OPTIONS)
+        else:
+            ret = self._encoder.encode(data).encode()
+        # Same \u2028/\u2029 escaping as JSONRenderer, applied to UTF-8 bytes
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
@@ -0,0 +1,102 @@
+import re
+import time
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import DisallowedHost
+from django.http.request import split_domain_port
+from .models import Profile
+
+# Query parameter selecting a profile by slug, e.g. /api/stats/?profile=jane-doe
+PROFILE_PARAM = 'profile'
+
+_SLUG_RE = re.compile(r'^[-a-zA-Z0-9_]{1,120}$')
+# Cached in place of a profile id when nothing matched
+_NO_PROFILE = 0
+
+
+def request_host(request):
+    """The request's host without port, lowercased, or '' if it is not an allowed host"""
+    try:
+        domain, _ = split_domain_port(request.get_host())
+    except DisallowedHost:
+        return ''
+    return domain
+
+
+class ProfileResolver:
+    """
+    Work out which profile a request addresses: ``?profile=<slug>`` first,
+    then a profile whose ``host`` matches the request host, then the default
+    (lowest id) profile.
+
+    Every lookup is cached under a generation counter that is bumped when a
+    profile is saved or deleted, so resolving costs two cache reads and no
+    queries once warm; misses are cached too. The result is memoized on the
+    request, so views and version checks share one resolution.
+    """
+
+    prefix = 'portfolio:resolve'
+
+    @property
+    def cache(self):
+        return caches[getattr(settings, 'PORTFOLIO_CACHE_ALIAS', 'default')]
+
+    @property
+    def timeout(self):
+        return getattr(settings, 'PORTFOLIO_RESOLVER_TIMEOUT', 3600)
+
+    def generation(self):
+        generation_key = f'{self.prefix}:generation'
+        generation = self.cache.get(generation_key)
+        if generation is None:
+            self.cache.add(generation_key, time.time_ns(), timeout=None)
+            generation = self.cache.get(generation_key)
+        return generation
+
+    def invalidate(self):
+        """Forget every cached mapping (profiles were added, removed or renamed)"""
+        generation_key = f'{self.prefix}:generation'
+        try:
+            self.cache.incr(generation_key)
+        except ValueError:
+            self.cache.set(generation_key, time.time_ns(), timeout=None)
+
+    def _lookup(self, kind, value, queryset):
+        key = f'{self.prefix}:{self.generation()}:{kind}:{value}'
+        profile_id = self.cache.get(key)
+        if profile_id is None:
+            profile_id = queryset.values_list('pk', flat=True).first() or _NO_PROFILE
+            self.cache.set(key, profile_id, timeout=self.timeout)
+        return profile_id or None
+
+    def by_slug(self, slug):
+        if not _SLUG_RE.match(slug):
+            return None
+        return self._lookup('slug', slug, Profile.objects.filter(slug=slug))
+
+    def by_host(self, host):
+        if not host:
+            return None
+        return self._lookup('host', host, Profile.objects.filter(host=host))
+
+    def default(self):
+        return self._lookup('default', '', Profile.objects.order_by('id'))
+
+    def resolve(self, request):
+        """Return the id of the profile ``request`` addresses, or None if there is none"""
+        # DRF's Request wraps the HttpRequest; memoize on the one middleware sees
+        request = getattr(request, '_request', request)
+        if not hasattr(request, '_portfolio_profile_id'):
+            request._portfolio_profile_id = self._resolve(request)
+        return request._portfolio_profile_id
+
+    def _resolve(self, request):
+        slug = request.GET.get(PROFILE_PARAM)
+        if slug is not None:
+            # An explicit slug never falls back to another profile
+            return self.by_slug(slug)
+        profile_id = self.by_host(request_host(request))
+        return profile_id if profile_id is not None else self.default()
+
+
+profile_resolver = ProfileResolver()
@@ -0,0 +1,251 @@
+import re
+from django.conf import settings
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank, SearchVector
+from django.db import connection, transaction
+from django.db.models import F, Func, TextField, Value
+from django.utils.module_loading import import_string
+from .models import Skill, Project, Education, WorkExperience
+
+HIGHLIGHT_START = '<mark>'
+HIGHLIGHT_STOP = '</mark>'
+
+
+class SearchSource:
+    """A searchable model: ``title`` fields rank above ``body`` fields"""
+
+    def __init__(self, model, title, body, headline):
+        self.model = model
+        self.title = title
+        self.body = body
+        self.headline = headline
+
+    def field_text(self, instance, fields):
+        parts = []
+        for field in fields:
+            value = getattr(instance, field)
+            if isinstance(value, (list, tuple)):
+                parts.extend(value)
+            elif value:
+                parts.append(str(value))
+        return ' '.join(parts)
+
+
+SEARCH_SOURCES = {
+    'skills': SearchSource(Skill, title=['name'], body=['category'], headline='name'),
+    'projects': SearchSource(Project, title=['title'], body=['description', 'technologies'], headline='description'),
+    'education': SearchSource(Education, title=['institution'], body=['degree', 'field_of_study'], headline='field_of_study'),
+    'work_experience': SearchSource(WorkExperience, title=['company'], body=['role', 'description'], headline='description'),
+}
+
+
+def source_for_model(model):
+    for key, source in SEARCH_SOURCES.items():
+        if source.model is model:
+            return key, source
+    return None, None
+
+
+class SearchHit:
+    def __init__(self, instance, rank, highlight):
+        self.instance = instance
+        self.rank = rank
+        self.highlight = highlight
+
+
+class PostgresSearchBackend:
+    """Ranked search over the stored, GIN-indexed ``search_vector`` columns"""
+
+    def __init__(self):
+        self.config = getattr(settings, 'PORTFOLIO_SEARCH_CONFIG', 'english')
+
+    def _field_expression(self, source, field):
+        if source.model._meta.get_field(field).get_internal_type() == 'ArrayField':
+            return Func(F(field), Value(' '), function='array_to_string', output_field=TextField())
+        return F(field)
+
+    def vector(self, source):
+        title = [self._field_expression(source, field) for field in source.title]
+        body = [self._field_expression(source, field) for field in source.body]
+        return (
+            SearchVector(*title, weight='A', config=self.config) +
+            SearchVector(*body, weight='B', config=self.config)
+        )
+
+    def index(self, instance):
+        key, source = source_for_model(type(instance))
+        if source is None:
+            return
+        source.model.objects.filter(pk=instance.pk).update(search_vector=self.vector(source))
+
+    def index_many(self, model, pks):
+        key, source = source_for_model(model)
+        if source is None:
+            return
+        model.objects.filter(pk__in=pks).update(search_vector=self.vector(source))
+
+    def remove(self, instance):
+        # The vector lives on the row itself and is deleted with it
+        pass
+
+    def rebuild(self):
+        for source in SEARCH_SOURCES.values():
+            source.model.objects.update(search_vector=self.vector(source))
+
+    def search(self, query, key, offset, limit, profile_id=None):
+        source = SEARCH_SOURCES[key]
+        search_query = SearchQuery(query, search_type='websearch', config=self.config)
+        matches = source.model.objects.filter(search_vector=search_query)
+        if profile_id is not None:
+            matches = matches.filter(profile_id=profile_id)
+        total = matches.count()
+        page = (
+            matches
+            .annotate(
+                rank=SearchRank(F('search_vector'), search_query),
+                highlight=SearchHeadline(
+                    source.headline, search_query, config=self.config,
+                    start_sel=HIGHLIGHT_START, stop_sel=HIGHLIGHT_STOP,
+                ),
+            )
+            .order_by('-rank', 'pk')[offset:offset + limit]
+        )
+        return total, [SearchHit(obj, obj.rank, obj.highlight) for obj in page]
+
+
+class SQLiteSearchBackend:
+    """Ranked search over an FTS5 virtual table, for local development"""
+
+    table = 'portfolio_search_fts'
+
+    def __init__(self):
+        self._table_ready = False
+
+    def ensure_table(self):
+        """
+        Create the FTS5 table if it is missing. It is normally created by
+        migrate (see signals.create_search_table); the flag is only set once
+        the creating transaction commits, as a rollback drops the table too.
+        """
+        if self._table_ready:
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} "
+                "USING fts5(source UNINDEXED, object_id UNINDEXED, title, body)"
+            )
+        transaction.on_commit(self._table_created)
+
+    def _table_created(self):
+        self._table_ready = True
+
+    def match_expression(self, query):
+        # Quote every term so user input can never be parsed as FTS5 syntax
+        terms = re.findall(r'\w+', query)
+        return ' '.join(f'"{term}"*' for term in terms)
+
+    def rowid(self, key, pk):
+        # Derive the rowid from (source, pk) so updates and deletes are rowid lookups
+        return pk * len(SEARCH_SOURCES) + list(SEARCH_SOURCES).index(key)
+
+    def _write(self, cursor, key, source, instances):
+        """Replace the FTS rows of ``instances`` with two executemany() calls"""
+        rows = [
+            (self.rowid(key, instance.pk), key, instance.pk,
+             source.field_text(instance, source.title), source.field_text(instance, source.body))
+            for instance in instances
+        ]
+        cursor.executemany(f"DELETE FROM {self.table} WHERE rowid = %s", [(row[0],) for row in rows])
+        cursor.executemany(
+            f"INSERT INTO {self.table} (rowid, source, object_id, title, body) VALUES (%s, %s, %s, %s, %s)", rows
+        )
+
+    def _write_queryset(self, cursor, key, source, queryset, chunk_size=2000):
+        chunk = []
+        for instance in queryset.iterator(chunk_size=chunk_size):
+            chunk.append(instance)
+            if len(chunk) >= chunk_size:
+                self._write(cursor, key, source, chunk)
+                chunk = []
+        if chunk:
+            self._write(cursor, key, source, chunk)
+
+    def index(self, instance):
+        key, source = source_for_model(type(instance))
+        if source is None:
+            return
+        self.ensure_table()
+        with connection.cursor() as cursor:
+            self._write(cursor, key, source, [instance])
+
+    def index_many(self, model, pks):
+        key, source = source_for_model(model)
+        if source is None:
+            return
+        self.ensure_table()
+        # One transaction, or SQLite commits after every executemany() row
+        with transaction.atomic(), connection.cursor() as cursor:
+            self._write_queryset(cursor, key, source, model.objects.filter(pk__in=pks).order_by())
+
+    def remove(self, instance):
+        key, source = source_for_model(type(instance))
+        if source is None:
+            return
+        self.ensure_table()
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [self.rowid(key, instance.pk)])
+
+    def rebuild(self):
+        self.ensure_table()
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+            for key, source in SEARCH_SOURCES.items():
+                self._write_queryset(cursor, key, source, source.model.objects.order_by())
+
+    def search(self, query, key, offset, limit, profile_id=None):
+        source = SEARCH_SOURCES[key]
+        expression = self.match_expression(query)
+        if not expression:
+            return 0, []
+        self.ensure_table()
+        where = f"{self.table} MATCH %s AND source = %s"
+        params = [expression, key]
+        if profile_id is not None:
+            # The FTS table has no profile column; restrict through the model's profile_id index
+            model_table = connection.ops.quote_name(source.model._meta.db_table)
+            profile_column = connection.ops.quote_name(source.model._meta.get_field('profile').column)
+            where += f" AND object_id IN (SELECT id FROM {model_table} WHERE {profile_column} = %s)"
+            params.append(profile_id)
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT COUNT(*) FROM {self.table} WHERE {where}", params)
+            total = cursor.fetchone()[0]
+            cursor.execute(
+                f"SELECT object_id, -bm25({self.table}, 0, 0, 10.0, 1.0) AS rank, "
+                f"snippet({self.table}, -1, %s, %s, '...', 16) "
+                f"FROM {self.table} WHERE {where} "
+                "ORDER BY rank DESC, object_id LIMIT %s OFFSET %s",
+                [HIGHLIGHT_START, HIGHLIGHT_STOP, *params, limit, offset]
+            )
+            rows = cursor.fetchall()
+        instances = source.model.objects.in_bulk([int(object_id) for object_id, _, _ in rows])
+        return total, [
+            SearchHit(instances[int(object_id)], rank, highlight)
+            for object_id, rank, highlight in rows
+            if int(object_id) in instances
+        ]
+
+
+_backend = None
+
+
+def get_search_backend():
+    """Return the configured backend, defaulting to one matching the database vendor"""
+    global _backend
+    if _backend is None:
+        backend_path = getattr(settings, 'PORTFOLIO_SEARCH_BACKEND', None)
+        if backend_path:
+            _backend = import_string(backend_path)()
+        elif connection.vendor == 'postgresql':
+            _backend = PostgresSearchBackend()
+        else:
+            _backend = SQLiteSearchBackend()
+    return _backend
@@ -1,37 +1,55 @@
 from rest_framework import serializers
 from .models import Profile, Education, Skill, Project, WorkExperience, Certification, Achievement
 
-class EducationSerializer(serializers.ModelSerializer):
+class BatchPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """Resolve related ids from a preloaded ``{pk: instance}`` map in the context when present"""
+
+    def to_internal_value(self, data):
+        preloaded = self.context.get('related_instances', {}).get(self.queryset.model)
+        if preloaded is None:
+            return super().to_internal_value(data)
+        try:
+            return preloaded[int(data)]
+        except KeyError:
+            self.fail('does_not_exist', pk_value=data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+class ProfileChildSerializer(serializers.ModelSerializer):
+    """Base for serializers of rows that belong to a Profile"""
+    serializer_related_field = BatchPrimaryKeyRelatedField
+
+class EducationSerializer(ProfileChildSerializer):
     class Meta:
         model = Education
-        fields = '__all__'
+        exclude = ['search_vector']
         extra_kwargs = {'profile': {'write_only': True}}
 
-class SkillSerializer(serializers.ModelSerializer):
+class SkillSerializer(ProfileChildSerializer):
     class Meta:
         model = Skill
-        fields = '__all__'
+        exclude = ['search_vector', 'technology', 'proficiency_rank']
         extra_kwargs = {'profile': {'write_only': True}}
 
-class ProjectSerializer(serializers.ModelSerializer):
+class ProjectSerializer(ProfileChildSerializer):
     class Meta:
         model = Project
-        fields = '__all__'
+        exclude = ['search_vector']
         extra_kwargs = {'profile': {'write_only': True}}
 
-class WorkExperienceSerializer(serializers.ModelSerializer):
+class WorkExperienceSerializer(ProfileChildSerializer):
     class Meta:
         model = WorkExperience
-        fields = '__all__'
+        exclude = ['search_vector']
         extra_kwargs = {'profile': {'write_only': True}}
 
-class CertificationSerializer(serializers.ModelSerializer):
+class CertificationSerializer(ProfileChildSerializer):
     class Meta:
         model = Certification
         fields = '__all__'
         extra_kwargs = {'profile': {'write_only': True}}
 
-class AchievementSerializer(serializers.ModelSerializer):
+class AchievementSerializer(ProfileChildSerializer):
     class Meta:
         model = Achievement
         fields = '__all__'
@@ -47,22 +65,17 @@ class ProfileSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Profile
-        fields = '__all__'
+        exclude = Profile.DENORMALIZED_FIELDS
 
-class ProfileSummarySerializer(serializers.ModelSerializer):
-    total_projects = serializers.SerializerMethodField()
-    total_skills = serializers.SerializerMethodField()
-    top_skills = serializers.SerializerMethodField()
+    def __init__(self, *args, **kwargs):
+        # Optional ResponseShape from ?fields= / ?expand=
+        shape = kwargs.pop('shape', None)
+        super().__init__(*args, **kwargs)
+        if shape is not None:
+            shape.apply(self)
 
+class ProfileSummarySerializer(serializers.ModelSerializer):
+    # Read from the denormalized Profile columns: no child queries
     class Meta:
         model = Profile
-        fields = ['id', 'name', 'email', 'summary', 'total_projects', 'total_skills', 'top_skills']
-
-    def get_total_projects(self, obj):
-        return obj.projects.count()
-
-    def get_total_skills(self, obj):
-        return obj.skills.count()
-
-    def get_top_skills(self, obj):
-        return obj.skills.filter(proficiency__in=['advanced', 'expert'])[:5].values_list('name', flat=True)
\ No newline at end of file
+        fields = ['id', 'name', 'email', 'summary', 'total_projects', 'total_skills', 'top_skills']
\ No newline at end of file
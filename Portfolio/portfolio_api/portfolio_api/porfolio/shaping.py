@@ -0,0 +1,81 @@
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+
+
+def _split(raw):
+    return [name.strip() for name in raw.split(',') if name.strip()]
+
+
+class ResponseShape:
+    """
+    Requested subset of a nested serializer's output.
+
+    ``?fields=`` lists top-level fields to keep; ``relation.field`` entries
+    restrict a nested collection to those fields. ``?expand=`` lists the
+    nested collections to embed. With ``fields`` alone only the named
+    fields (and named collections) are returned; with ``expand`` alone every
+    top-level scalar is kept plus the expanded collections.
+    """
+
+    def __init__(self, scalars, relations, nested, params):
+        self.scalars = scalars
+        self.relations = relations
+        self.nested = nested
+        self.params = params
+
+    @classmethod
+    def from_request(cls, request, serializer_class):
+        """Parse ?fields= / ?expand=; returns None when neither is given"""
+        raw_fields = request.query_params.get('fields')
+        raw_expand = request.query_params.get('expand')
+        if raw_fields is None and raw_expand is None:
+            return None
+
+        declared = serializer_class().fields
+        relations = {
+            name for name, field in declared.items()
+            if isinstance(field, serializers.ListSerializer)
+        }
+        scalars = set(declared) - relations
+        errors = {}
+
+        requested = set()
+        nested = {}
+        for name in _split(raw_fields or ''):
+            relation, _, child = name.partition('.')
+            if child:
+                if relation not in relations:
+                    errors.setdefault('fields', []).append(f"'{relation}' is not an expandable collection")
+                    continue
+                child_fields = declared[relation].child.fields
+                if child not in child_fields or child_fields[child].write_only:
+                    errors.setdefault('fields', []).append(f"Unknown field '{name}'")
+                    continue
+                nested.setdefault(relation, set()).add(child)
+            elif name not in declared:
+                errors.setdefault('fields', []).append(f"Unknown field '{name}'")
+            else:
+                requested.add(name)
+
+        expand = set(_split(raw_expand or ''))
+        unknown = expand - relations
+        if unknown:
+            errors['expand'] = [f"Unknown collection '{name}'" for name in sorted(unknown)]
+        if errors:
+            raise ValidationError(errors)
+
+        kept_scalars = scalars & requested if raw_fields is not None else scalars
+        kept_relations = (relations & requested) | expand | set(nested)
+        params = {'fields': raw_fields or '', 'expand': raw_expand or ''}
+        return cls(kept_scalars, kept_relations, nested, params)
+
+    def apply(self, serializer):
+        """Drop unrequested fields from a bound serializer instance"""
+        for name in list(serializer.fields):
+            if name not in self.scalars and name not in self.relations:
+                serializer.fields.pop(name)
+        for relation, child_names in self.nested.items():
+            child_fields = serializer.fields[relation].child.fields
+            for name in list(child_fields):
+                if name not in child_names:
+                    child_fields.pop(name)
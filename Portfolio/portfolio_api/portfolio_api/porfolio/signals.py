@@ -0,0 +1,139 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_migrate, post_save, post_delete, pre_delete, pre_save
+from .models import Profile, Education, Skill, Project, WorkExperience, Certification, Achievement
+from .search import get_search_backend
+from .cache import response_cache
+from .resolver import profile_resolver
+from .autocomplete import AUTOCOMPLETE_FIELDS, autocomplete_index, remember_terms, terms_saved, terms_deleted
+from .matching import MATCH_MODELS, match_index, match_row_saved, match_row_deleted
+from . import counters, snapshots, technologies
+
+SEARCHABLE_MODELS = (Skill, Project, Education, WorkExperience)
+CACHED_MODELS = (Profile, Education, Skill, Project, WorkExperience, Certification, Achievement)
+
+
+def index_search_document(sender, instance, raw=False, **kwargs):
+    """Keep the search index current whenever a searchable row is saved"""
+    if not raw:
+        get_search_backend().index(instance)
+
+
+def remove_search_document(sender, instance, **kwargs):
+    """Drop a deleted row from the search index"""
+    get_search_backend().remove(instance)
+
+
+def create_search_table(sender, **kwargs):
+    """After migrate (test databases included): create backend tables that live outside the models"""
+    if sender.name != 'portfolio':
+        return
+    ensure_table = getattr(get_search_backend(), 'ensure_table', None)
+    if ensure_table is not None:
+        ensure_table()
+
+
+def sync_project_technologies(sender, instance, raw=False, **kwargs):
+    """Keep technology links and per-profile counts in step with Project.technologies"""
+    if not raw:
+        technologies.sync_project(instance)
+
+
+def remove_project_technologies(sender, instance, **kwargs):
+    """Take a deleted project out of its profile's technology counts"""
+    technologies.remove_project(instance)
+
+
+def bump_on_commit(profile_id):
+    # Bumped only once the write is visible: a reader rebuilding before the
+    # commit then caches pre-write data under the old version, not the new
+    transaction.on_commit(lambda: response_cache.bump(profile_id))
+
+
+def invalidate_response_cache(sender, instance, **kwargs):
+    """Bump the cache version of the profile that owns a changed row, once the write commits"""
+    bump_on_commit(instance.pk if sender is Profile else instance.profile_id)
+
+
+def invalidate_profile_routes(sender, instance, **kwargs):
+    """Drop cached slug/host lookups when a profile is added, changed or removed"""
+    profile_resolver.invalidate()
+
+
+def drop_profile_indexes(sender, instance, **kwargs):
+    """Forget a deleted profile's suggestions and match matrix"""
+    autocomplete_index.invalidate([instance.pk])
+    match_index.invalidate([instance.pk])
+
+
+def invalidate_snapshots(sender=None, instance=None, **kwargs):
+    """Stop serving snapshots once data changes, re-exporting after commit if enabled"""
+    snapshots.mark_stale()
+    if getattr(settings, 'PORTFOLIO_SNAPSHOT_ON_WRITE', False):
+        transaction.on_commit(snapshots.schedule_export)
+
+
+def profiles_rewritten(profile_ids):
+    """
+    Invalidate what is cached for profiles whose rows were rewritten without
+    save signals (.update(), raw SQL): response payloads, ETags, in-process
+    indexes (through the version) and snapshots.
+    """
+    profile_ids = list(profile_ids)
+    if not profile_ids:
+        return
+    for profile_id in profile_ids:
+        bump_on_commit(profile_id)
+    invalidate_snapshots()
+
+
+def sync_bulk_write(model, pks, profile_ids):
+    """Apply the post_save side effects to rows written with bulk_create()"""
+    if model in SEARCHABLE_MODELS:
+        get_search_backend().index_many(model, pks)
+    if model is Project:
+        technologies.sync_projects(Project.objects.filter(pk__in=pks))
+    elif model is Skill:
+        skills = Skill.objects.filter(pk__in=pks)
+        skills.update(proficiency_rank=Skill.rank_expression())
+        technologies.link_skills(skills)
+    if model in counters.COUNTED_MODELS:
+        counters.reconcile(Profile.objects.filter(pk__in=profile_ids))
+    if model in AUTOCOMPLETE_FIELDS:
+        autocomplete_index.invalidate(profile_ids)
+    if model in MATCH_MODELS:
+        match_index.invalidate(profile_ids)
+    profiles_rewritten(profile_ids)
+
+
+post_migrate.connect(create_search_table, dispatch_uid='search_create_table')
+for model in SEARCHABLE_MODELS:
+    post_save.connect(index_search_document, sender=model, dispatch_uid=f'search_index_{model.__name__}')
+    post_delete.connect(remove_search_document, sender=model, dispatch_uid=f'search_remove_{model.__name__}')
+
+post_save.connect(sync_project_technologies, sender=Project, dispatch_uid='technologies_save_Project')
+pre_delete.connect(remove_project_technologies, sender=Project, dispatch_uid='technologies_delete_Project')
+
+for model in counters.COUNTED_MODELS:
+    pre_save.connect(counters.remember, sender=model, dispatch_uid=f'counters_pre_save_{model.__name__}')
+    post_save.connect(counters.child_saved, sender=model, dispatch_uid=f'counters_save_{model.__name__}')
+    post_delete.connect(counters.child_deleted, sender=model, dispatch_uid=f'counters_delete_{model.__name__}')
+
+post_save.connect(invalidate_profile_routes, sender=Profile, dispatch_uid='resolver_save_Profile')
+post_delete.connect(invalidate_profile_routes, sender=Profile, dispatch_uid='resolver_delete_Profile')
+
+for model in CACHED_MODELS:
+    post_save.connect(invalidate_response_cache, sender=model, dispatch_uid=f'cache_save_{model.__name__}')
+    post_delete.connect(invalidate_response_cache, sender=model, dispatch_uid=f'cache_delete_{model.__name__}')
+    post_save.connect(invalidate_snapshots, sender=model, dispatch_uid=f'snapshot_save_{model.__name__}')
+    post_delete.connect(invalidate_snapshots, sender=model, dispatch_uid=f'snapshot_delete_{model.__name__}')
+
+# After the cache bumps above: updated indexes adopt the bumped version
+for model in AUTOCOMPLETE_FIELDS:
+    pre_save.connect(remember_terms, sender=model, dispatch_uid=f'autocomplete_pre_save_{model.__name__}')
+    post_save.connect(terms_saved, sender=model, dispatch_uid=f'autocomplete_save_{model.__name__}')
+    post_delete.connect(terms_deleted, sender=model, dispatch_uid=f'autocomplete_delete_{model.__name__}')
+for model in MATCH_MODELS:
+    post_save.connect(match_row_saved, sender=model, dispatch_uid=f'match_save_{model.__name__}')
+    post_delete.connect(match_row_deleted, sender=model, dispatch_uid=f'match_delete_{model.__name__}')
+post_delete.connect(drop_profile_indexes, sender=Profile, dispatch_uid='indexes_delete_Profile')
@@ -0,0 +1,253 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+from django.conf import settings
+from django.db import close_old_connections
+from django.http import HttpResponseNotFound
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+from django.utils import timezone
+from whitenoise.middleware import WhiteNoiseMiddleware
+from whitenoise.responders import MissingFileError, StaticFile
+from .models import Profile
+from .resolver import profile_resolver, request_host
+
+try:
+    import brotli
+except ImportError:  # optional: only gzip variants are written without it
+    brotli = None
+
+MANIFEST_NAME = 'manifest.json'
+# Names export_snapshots() writes: <route>.<12 hex digits of md5>.json
+SNAPSHOT_NAME_RE = re.compile(r'^[-\w]+\.[0-9a-f]{12}\.json$')
+
+# Collection-level and per-profile GET routes rendered to snapshots
+SNAPSHOT_ROUTES = ['profile-me', 'skill-top', 'skill-categories', 'project-featured', 'project-technologies', 'stats']
+PROFILE_ROUTES = ['profile-detail', 'profile-summary']
+
+
+def snapshot_dir():
+    return Path(settings.STATIC_ROOT) / getattr(settings, 'PORTFOLIO_SNAPSHOT_DIR', 'snapshots')
+
+
+def snapshot_url_prefix():
+    """URL path the snapshot directory is published under, e.g. /static/snapshots/"""
+    return f"{urlparse(settings.STATIC_URL).path.rstrip('/')}/{getattr(settings, 'PORTFOLIO_SNAPSHOT_DIR', 'snapshots')}/"
+
+
+def read_manifest():
+    try:
+        with open(snapshot_dir() / MANIFEST_NAME) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _write_atomic(path, content):
+    # Readers in other workers must never see a half-written file
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    tmp.write_bytes(content)
+    os.replace(tmp, path)
+
+
+def write_manifest(manifest):
+    _write_atomic(snapshot_dir() / MANIFEST_NAME, json.dumps(manifest, indent=2).encode())
+
+
+def snapshot_paths(profile_ids=None):
+    paths = [reverse(name) for name in SNAPSHOT_ROUTES]
+    if profile_ids is None:
+        profile_ids = Profile.objects.order_by('id').values_list('pk', flat=True)
+    for pk in profile_ids:
+        paths.extend(reverse(name, kwargs={'pk': pk}) for name in PROFILE_ROUTES)
+    return paths
+
+
+def render_path(path):
+    """Render a GET route through its view; returns the JSON bytes, or None unless it is a 200"""
+    request = RequestFactory().get(path, HTTP_ACCEPT='application/json', secure=True)
+    match = resolve(path)
+    response = match.func(request, *match.args, **match.kwargs)
+    if hasattr(response, 'render'):
+        response.render()
+    return response.content if response.status_code == 200 else None
+
+
+def _write_snapshot(directory, name, content):
+    target = directory / name
+    if target.exists():
+        return
+    _write_atomic(directory / f'{name}.gz', gzip.compress(content, compresslevel=9, mtime=0))
+    if brotli is not None:
+        _write_atomic(directory / f'{name}.br', brotli.compress(content))
+    _write_atomic(target, content)
+
+
+def export_snapshots(profile_ids=None):
+    """
+    Render every snapshot route to content-hashed JSON files (plus .gz/.br)
+    and publish them in a new manifest; returns the manifest.
+
+    Files from the previous manifest are kept so URLs handed out just
+    before the export keep working; anything older is removed.
+    """
+    started = time.time()
+    directory = snapshot_dir()
+    directory.mkdir(parents=True, exist_ok=True)
+    previous = read_manifest() or {}
+
+    files = {}
+    for path in snapshot_paths(profile_ids):
+        content = render_path(path)
+        if content is None:
+            continue
+        name = f"{path.strip('/').replace('/', '-')}.{hashlib.md5(content).hexdigest()[:12]}.json"
+        _write_snapshot(directory, name, content)
+        files[path] = name
+
+    # A write that landed while we were rendering leaves this export stale too
+    current = read_manifest() or {}
+    stale = bool(current.get('stale')) and current.get('stale_at', 0) >= started
+    manifest = {
+        'generated_at': timezone.now().isoformat(),
+        'stale': stale,
+        'stale_at': current.get('stale_at') if stale else None,
+        'files': files,
+    }
+    write_manifest(manifest)
+
+    keep = {MANIFEST_NAME}
+    for name in list(files.values()) + list(previous.get('files', {}).values()):
+        keep.update({name, f'{name}.gz', f'{name}.br'})
+    for entry in directory.iterdir():
+        if entry.name not in keep and not entry.name.startswith('.'):
+            entry.unlink(missing_ok=True)
+    return manifest
+
+
+def mark_stale():
+    """Send snapshot reads back to the dynamic views until the next export"""
+    manifest = read_manifest()
+    if manifest is None or manifest.get('stale'):
+        return
+    manifest.update({'stale': True, 'stale_at': time.time()})
+    write_manifest(manifest)
+
+
+class _ExportScheduler:
+    """Coalesces bursts of writes into one background export after a short delay"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timer = None
+
+    def schedule(self):
+        with self._lock:
+            if self._timer is not None:
+                return
+            delay = getattr(settings, 'PORTFOLIO_SNAPSHOT_DELAY', 5)
+            self._timer = threading.Timer(delay, self._run)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _run(self):
+        with self._lock:
+            self._timer = None
+        close_old_connections()
+        try:
+            export_snapshots()
+        finally:
+            close_old_connections()
+
+
+schedule_export = _ExportScheduler().schedule
+
+
+class SnapshotMiddleware:
+    """
+    Serve GETs for snapshotted routes from the exported JSON files.
+
+    Snapshots hold the default profile's payloads, so requests for a host
+    mapped to another profile always go to the views.
+
+    Files go out through WhiteNoise's responder, so gzip/brotli negotiation,
+    ETag and If-None-Match handling match the static files. Requests with a
+    query string, asking for HTML (the browsable API), or arriving while the
+    manifest is stale or missing fall through to the views. The manifest is
+    re-read only when its mtime changes, which also picks up exports made
+    by other processes.
+
+    The snapshot directory itself (the manifest and the content-hashed
+    files under STATIC_URL) is served from here too: exports run after
+    startup, and WhiteNoiseMiddleware only indexes STATIC_ROOT when the
+    process starts, so it would 404 new files and serve replaced ones with
+    stale lengths. Install this middleware before WhiteNoise.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.manifest_path = snapshot_dir() / MANIFEST_NAME
+        self.url_prefix = snapshot_url_prefix()
+        self._loaded = (None, {})
+
+    def __call__(self, request):
+        if request.method in ('GET', 'HEAD') and request.path_info.startswith(self.url_prefix):
+            return self.serve_file(request, request.path_info[len(self.url_prefix):])
+        if (request.method in ('GET', 'HEAD') and not request.META.get('QUERY_STRING')
+                and 'text/html' not in request.META.get('HTTP_ACCEPT', '')):
+            static_file = self.lookup(request.path_info)
+            if static_file is not None and profile_resolver.by_host(request_host(request)) is None:
+                response = WhiteNoiseMiddleware.serve(static_file, request)
+                response['X-Snapshot'] = 'HIT'
+                return response
+        return self.get_response(request)
+
+    def serve_file(self, request, name):
+        """A file of the snapshot directory, read from disk on every request"""
+        if name == MANIFEST_NAME:
+            cache_control = 'no-cache'
+        elif SNAPSHOT_NAME_RE.match(name):
+            # Named by content hash: never changes, only disappears
+            cache_control = 'public, max-age=315360000, immutable'
+        else:
+            return HttpResponseNotFound()
+        file_path = str(snapshot_dir() / name)
+        headers = [('Content-Type', 'application/json'), ('Cache-Control', cache_control)]
+        try:
+            static_file = StaticFile(file_path, headers,
+                                     encodings={'gzip': file_path + '.gz', 'br': file_path + '.br'})
+        except MissingFileError:
+            return HttpResponseNotFound()
+        return WhiteNoiseMiddleware.serve(static_file, request)
+
+    def lookup(self, path):
+        try:
+            mtime = os.stat(self.manifest_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        loaded_mtime, files = self._loaded
+        if mtime != loaded_mtime:
+            files = self.load(read_manifest())
+            self._loaded = (mtime, files)
+        return files.get(path)
+
+    def load(self, manifest):
+        if not manifest or manifest.get('stale'):
+            return {}
+        directory = snapshot_dir()
+        headers = [('Content-Type', 'application/json'), ('Cache-Control', 'no-cache')]
+        files = {}
+        for path, name in manifest.get('files', {}).items():
+            file_path = str(directory / name)
+            try:
+                files[path] = StaticFile(file_path, headers,
+                                         encodings={'gzip': file_path + '.gz', 'br': file_path + '.br'})
+            except MissingFileError:
+                continue
+        return files
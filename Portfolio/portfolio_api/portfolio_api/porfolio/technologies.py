@@ -0,0 +1,187 @@
+from collections import Counter, defaultdict
+from django.db import transaction
+from django.db.models import Count, F
+from .models import Project, ProjectTechnology, ProfileTechnology, Skill, Technology
+
+CHUNK_SIZE = 500
+
+
+def _chunks(queryset):
+    batch = []
+    for row in queryset.iterator(chunk_size=CHUNK_SIZE):
+        batch.append(row)
+        if len(batch) >= CHUNK_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def technology_map(names):
+    """{canonical key: Technology} for ``names``, creating any missing ones in one statement"""
+    display = {}
+    for name in names:
+        key = Technology.canonical(name)
+        if key:
+            display.setdefault(key, ' '.join(name.split()))
+    found = {technology.key: technology for technology in Technology.objects.filter(key__in=display)}
+    missing = [Technology(key=key, name=name) for key, name in display.items() if key not in found]
+    if missing:
+        # A concurrent writer may create the same keys; re-read rather than trust our objects
+        Technology.objects.bulk_create(missing, ignore_conflicts=True)
+        found.update(
+            (technology.key, technology)
+            for technology in Technology.objects.filter(key__in=[technology.key for technology in missing])
+        )
+    return found
+
+
+def _plan(projects):
+    """Return (stale link ids, new links, {(profile_id, technology_id): delta}) for ``projects``"""
+    technologies = technology_map(name for project in projects for name in project.technologies)
+    current = defaultdict(dict)
+    links = ProjectTechnology.objects.filter(project_id__in=[project.pk for project in projects])
+    for link_id, project_id, technology_id, profile_id in links.values_list(
+            'id', 'project_id', 'technology_id', 'profile_id'):
+        current[project_id][technology_id] = (link_id, profile_id)
+
+    stale, new, deltas = [], [], Counter()
+    for project in projects:
+        wanted = {technologies[key].pk for key in map(Technology.canonical, project.technologies) if key}
+        kept = set()
+        for technology_id, (link_id, profile_id) in current[project.pk].items():
+            if technology_id in wanted and profile_id == project.profile_id:
+                kept.add(technology_id)
+            else:
+                stale.append(link_id)
+                deltas[(profile_id, technology_id)] -= 1
+        for technology_id in wanted - kept:
+            new.append(ProjectTechnology(project_id=project.pk, technology_id=technology_id,
+                                         profile_id=project.profile_id))
+            deltas[(project.profile_id, technology_id)] += 1
+    return stale, new, deltas
+
+
+def _write_links(stale, new):
+    for start in range(0, len(stale), CHUNK_SIZE):
+        ProjectTechnology.objects.filter(pk__in=stale[start:start + CHUNK_SIZE]).delete()
+    ProjectTechnology.objects.bulk_create(new, batch_size=CHUNK_SIZE, ignore_conflicts=True)
+
+
+def apply_deltas(deltas):
+    """Add {(profile_id, technology_id): delta} to the per-profile counts with F() updates"""
+    groups = defaultdict(list)
+    for (profile_id, technology_id), delta in deltas.items():
+        if delta:
+            groups[(profile_id, delta)].append(technology_id)
+    if not groups:
+        return
+    ProfileTechnology.objects.bulk_create([
+        ProfileTechnology(profile_id=profile_id, technology_id=technology_id)
+        for (profile_id, delta), technology_ids in groups.items() if delta > 0
+        for technology_id in technology_ids
+    ], ignore_conflicts=True)
+    for (profile_id, delta), technology_ids in groups.items():
+        ProfileTechnology.objects.filter(profile_id=profile_id, technology_id__in=technology_ids).update(
+            project_count=F('project_count') + delta
+        )
+    # Technologies none of the profile's projects use any more
+    ProfileTechnology.objects.filter(
+        profile_id__in={profile_id for profile_id, _ in groups}, project_count__lte=0
+    ).delete()
+
+
+def sync_project(project):
+    """Bring one project's links and its profile's counts in line with project.technologies"""
+    with transaction.atomic():
+        stale, new, deltas = _plan([project])
+        _write_links(stale, new)
+        apply_deltas(deltas)
+
+
+def remove_project(project):
+    """Take a project about to be deleted out of its profile's counts (the links cascade)"""
+    deltas = Counter()
+    links = ProjectTechnology.objects.filter(project_id=project.pk)
+    for technology_id, profile_id in links.values_list('technology_id', 'profile_id'):
+        deltas[(profile_id, technology_id)] -= 1
+    apply_deltas(deltas)
+
+
+def recount(profile_ids):
+    """Recompute the counts of ``profile_ids`` from their links in one aggregate per chunk"""
+    profile_ids = sorted(profile_ids)
+    for start in range(0, len(profile_ids), CHUNK_SIZE):
+        chunk = profile_ids[start:start + CHUNK_SIZE]
+        totals = (
+            ProjectTechnology.objects.filter(profile_id__in=chunk)
+            .values('profile_id', 'technology_id')
+            .annotate(total=Count('id'))
+            .order_by()
+        )
+        with transaction.atomic():
+            ProfileTechnology.objects.filter(profile_id__in=chunk).delete()
+            ProfileTechnology.objects.bulk_create([
+                ProfileTechnology(profile_id=row['profile_id'], technology_id=row['technology_id'],
+                                  project_count=row['total'])
+                for row in totals
+            ], batch_size=CHUNK_SIZE)
+
+
+def sync_projects(queryset):
+    """
+    sync_project() for many projects (rows written with bulk_create()):
+    links are diffed a chunk at a time and the touched profiles recounted
+    once at the end. Returns the number of links written.
+    """
+    profile_ids = set()
+    written = 0
+    with transaction.atomic():
+        for batch in _chunks(queryset.only('id', 'profile_id', 'technologies').order_by()):
+            stale, new, deltas = _plan(batch)
+            _write_links(stale, new)
+            profile_ids.update(profile_id for profile_id, _ in deltas)
+            written += len(new)
+        recount(profile_ids)
+    return written
+
+
+def link_skills(queryset):
+    """Point skills at their Technology, for rows that bypassed Skill.save(); returns the number changed"""
+    changed = 0
+    for batch in _chunks(queryset.only('id', 'name', 'category', 'technology_id').order_by()):
+        # Soft skills are unlinked rather than given a Technology
+        technologies = technology_map(skill.name for skill in batch if Skill.names_technology(skill.category))
+        updates = []
+        for skill in batch:
+            technology = None
+            if Skill.names_technology(skill.category):
+                technology = technologies.get(Technology.canonical(skill.name))
+            technology_id = technology.pk if technology else None
+            if skill.technology_id != technology_id:
+                skill.technology_id = technology_id
+                updates.append(skill)
+        Skill.objects.bulk_update(updates, ['technology'], batch_size=CHUNK_SIZE)
+        changed += len(updates)
+    return changed
+
+
+def prune():
+    """Delete technologies no project or skill refers to; returns the number deleted"""
+    orphans = Technology.objects.filter(project_links__isnull=True, skills__isnull=True)
+    deleted, _ = Technology.objects.filter(pk__in=orphans.values('pk')).delete()
+    return deleted
+
+
+def rebuild():
+    """
+    Rebuild every link and count from Project.technologies and skill names,
+    then drop unused technologies; returns (links, skills, pruned)
+    """
+    with transaction.atomic():
+        ProjectTechnology.objects.all().delete()
+        ProfileTechnology.objects.all().delete()
+        links = sync_projects(Project.objects.all())
+        skills = link_skills(Skill.objects.all())
+        pruned = prune()
+    return links, skills, pruned
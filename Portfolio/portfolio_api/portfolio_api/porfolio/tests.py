@@ -0,0 +1,362 @@
+import csv
+import io
+import json
+import unittest
+from datetime import date
+from unittest import mock
+from django.core.cache import cache
+from django.test import TestCase
+from . import counters
+from .autocomplete import AutocompleteIndex
+from .matching import np
+from .models import Profile, Education, Skill, Project, WorkExperience, Certification, Achievement
+
+
+class ProfileQueryCountTests(TestCase):
+    """
+    The nested profile endpoints run a fixed number of queries: one per
+    embedded collection on top of the profile lookup, however many rows
+    the profile has.
+    """
+
+    # COUNT + profiles + one prefetch per child collection
+    LIST_QUERIES = 8
+    # profile + one prefetch per child collection
+    DETAIL_QUERIES = 7
+    # host and default-profile resolution + DETAIL_QUERIES
+    ME_QUERIES = 9
+
+    def setUp(self):
+        cache.clear()
+        self.profile = Profile.objects.create(name='Jane Doe', email='jane@example.com', summary='Engineer')
+
+    def add_children(self, profile, count):
+        for _ in range(count):
+            Education.objects.create(profile=profile, institution='MUJ', degree='B.Tech',
+                                     field_of_study='IT', start_date=date(2020, 1, 1))
+            Skill.objects.create(profile=profile, name=f'Skill {Skill.objects.count()}', category='tools')
+            Project.objects.create(profile=profile, title='Search', description='Search engine',
+                                   technologies=['Python'], start_date=date(2021, 1, 1))
+            WorkExperience.objects.create(profile=profile, company='Acme', role='Engineer',
+                                          start_date=date(2022, 1, 1))
+            Certification.objects.create(profile=profile, name='Django', issuer='IBM', issue_date=date(2023, 1, 1))
+            Achievement.objects.create(profile=profile, title='Hackathon', organization='MUJ',
+                                       date_achieved=date(2023, 6, 1))
+
+    def assert_constant_queries(self, url, expected):
+        """``url`` runs ``expected`` queries (uncached) with 0, 1 and 5 rows per child table"""
+        for added in (0, 1, 4):
+            self.add_children(self.profile, added)
+            cache.clear()
+            with self.subTest(url=url, rows=Skill.objects.filter(profile=self.profile).count()):
+                with self.assertNumQueries(expected):
+                    response = self.client.get(url, HTTP_ACCEPT='application/json')
+                self.assertEqual(response.status_code, 200)
+
+    def test_retrieve(self):
+        self.assert_constant_queries(f'/api/profiles/{self.profile.pk}/', self.DETAIL_QUERIES)
+
+    def test_list(self):
+        other = Profile.objects.create(name='John Roe', email='john@example.com', summary='Analyst')
+        self.add_children(other, 3)
+        self.assert_constant_queries('/api/profiles/', self.LIST_QUERIES)
+
+    def test_me(self):
+        self.assert_constant_queries('/api/profiles/me/', self.ME_QUERIES)
+
+    def test_me_cached(self):
+        self.add_children(self.profile, 2)
+        self.client.get('/api/profiles/me/', HTTP_ACCEPT='application/json')
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/profiles/me/', HTTP_ACCEPT='application/json')
+        self.assertEqual(len(response.json()['skills']), 2)
+
+
+class PortfolioTestCase(TestCase):
+    """A fresh response cache and one profile; requests go over HTTPS as JSON"""
+
+    def setUp(self):
+        cache.clear()
+        self.profile = Profile.objects.create(name='Jane Doe', email='jane@example.com', summary='Engineer')
+
+    def get(self, url):
+        return self.client.get(url, secure=True, HTTP_ACCEPT='application/json')
+
+    def post(self, url, data):
+        return self.client.post(url, json.dumps(data), content_type='application/json',
+                                secure=True, HTTP_ACCEPT='application/json')
+
+    def add_skills(self, *specs):
+        """Create (name, category, proficiency) skills in one commit, running its on_commit hooks"""
+        with self.captureOnCommitCallbacks(execute=True):
+            return [Skill.objects.create(profile=self.profile, name=name, category=category, proficiency=level)
+                    for name, category, level in specs]
+
+    def walk(self, url, link='next'):
+        """(url, ids) of every page from ``url`` on, following ``link``"""
+        pages = []
+        while url:
+            data = self.get(url).json()
+            pages.append((url, [row['id'] for row in data['results']]))
+            url = data[link]
+        return pages
+
+
+class ResponseCacheTests(PortfolioTestCase):
+    """Cached payloads are served until a write commits, then rebuilt"""
+
+    def test_hit_until_write(self):
+        self.add_skills(('Python', 'programming', 'expert'))
+        self.assertEqual(self.get('/api/stats/')['X-Cache'], 'MISS')
+        with self.assertNumQueries(0):
+            response = self.get('/api/stats/')
+        self.assertEqual(response['X-Cache'], 'HIT')
+
+        self.add_skills(('Docker', 'tools', 'advanced'))
+        response = self.get('/api/stats/')
+        self.assertEqual(response['X-Cache'], 'MISS')
+        self.assertEqual(response.json()['total_skills'], 2)
+
+    def test_not_modified_until_write(self):
+        etag = self.get('/api/profiles/me/')['ETag']
+        response = self.client.get('/api/profiles/me/', secure=True, HTTP_ACCEPT='application/json',
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.add_skills(('Python', 'programming', 'expert'))
+        response = self.client.get('/api/profiles/me/', secure=True, HTTP_ACCEPT='application/json',
+                                   HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([skill['name'] for skill in response.json()['skills']], ['Python'])
+
+
+class CursorPaginationTests(PortfolioTestCase):
+    """Keyset pages cover the ordered list exactly once, forwards and back"""
+
+    def test_round_trip(self):
+        self.add_skills(*[(f'Skill {i}', 'tools' if i % 2 else 'programming', 'intermediate') for i in range(7)])
+        expected = list(Skill.objects.values_list('pk', flat=True))
+
+        pages = self.walk('/api/skills/?pagination=cursor&page_size=3')
+        self.assertEqual([len(ids) for _, ids in pages], [3, 3, 1])
+        self.assertEqual([pk for _, ids in pages for pk in ids], expected)
+
+        back = self.walk(pages[-1][0], link='previous')
+        self.assertEqual([pk for _, ids in reversed(back) for pk in ids], expected)
+
+    def test_descending_nullable_column(self):
+        certifications = [
+            Certification.objects.create(profile=self.profile, name='Django', issuer='IBM', issue_date=issued).pk
+            for issued in (date(2023, 1, 1), None, date(2021, 1, 1), date(2023, 1, 1), None)
+        ]
+        # Newest first with undated ones ahead (as on PostgreSQL), ties in id order
+        expected = [certifications[i] for i in (1, 4, 0, 3, 2)]
+        pages = self.walk('/api/certifications/?pagination=cursor&page_size=2')
+        self.assertEqual([pk for _, ids in pages for pk in ids], expected)
+
+
+class BulkWriteTests(PortfolioTestCase):
+    """Bulk endpoints upsert on the natural key and write all items or none"""
+
+    def test_upsert(self):
+        response = self.post('/api/skills/bulk/', [
+            {'profile': self.profile.pk, 'name': 'Python', 'category': 'programming', 'proficiency': 'expert'},
+            {'profile': self.profile.pk, 'name': 'Docker', 'category': 'tools'},
+        ])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.json()['created'], response.json()['updated']), (2, 0))
+
+        response = self.post('/api/skills/bulk/', [
+            {'profile': self.profile.pk, 'name': 'Python', 'category': 'programming', 'proficiency': 'beginner'},
+        ])
+        self.assertEqual((response.json()['created'], response.json()['updated']), (0, 1))
+        self.assertEqual(Skill.objects.get(name='Python').proficiency, 'beginner')
+        self.profile.refresh_from_db()
+        self.assertEqual((self.profile.total_skills, self.profile.skills_tools), (2, 1))
+
+    def test_invalid_item_writes_nothing(self):
+        response = self.post('/api/skills/bulk/', [
+            {'profile': self.profile.pk, 'name': 'Python', 'category': 'programming'},
+            {'profile': self.profile.pk, 'name': 'Docker', 'category': 'not-a-category'},
+        ])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([error['index'] for error in response.json()['errors']], [1])
+        self.assertFalse(Skill.objects.exists())
+
+
+class CounterTests(PortfolioTestCase):
+    """Profile counters, top skills and technology counts follow every save and delete"""
+
+    def assert_reconciled(self):
+        self.assertEqual(counters.reconcile(), {})
+
+    def test_skill_counters(self):
+        python, docker = self.add_skills(('Python', 'programming', 'expert'), ('Docker', 'tools', 'beginner'))
+        self.profile.refresh_from_db()
+        self.assertEqual((self.profile.total_skills, self.profile.skills_programming), (2, 1))
+        self.assertEqual(self.profile.top_skills, ['Python'])
+
+        docker.category, docker.proficiency = 'programming', 'advanced'
+        docker.save()
+        python.delete()
+        self.profile.refresh_from_db()
+        self.assertEqual((self.profile.total_skills, self.profile.skills_programming, self.profile.skills_tools),
+                         (1, 1, 0))
+        self.assertEqual(self.profile.top_skills, ['Docker'])
+        self.assert_reconciled()
+
+    def test_reconcile_fixes_drift(self):
+        self.add_skills(('Python', 'programming', 'expert'))
+        Profile.objects.filter(pk=self.profile.pk).update(total_skills=5, top_skills=[])
+        drift = counters.reconcile()
+        self.assertEqual(drift[self.profile.pk]['total_skills'], (5, 1))
+        self.assertEqual(drift[self.profile.pk]['top_skills'], ([], ['Python']))
+        self.assert_reconciled()
+
+    def test_technology_counts(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            search = Project.objects.create(profile=self.profile, title='Search', description='Search engine',
+                                            technologies=['Python', 'Django'], start_date=date(2021, 1, 1))
+            Project.objects.create(profile=self.profile, title='Chat', description='Chat server',
+                                   technologies=['python'], start_date=date(2022, 1, 1))
+        self.assertEqual(self.get('/api/projects/technologies/').json()['results'],
+                         [{'name': 'Python', 'count': 2}, {'name': 'Django', 'count': 1}])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            search.technologies = ['Kafka']
+            search.save()
+        self.assertEqual(self.get('/api/projects/technologies/').json()['results'],
+                         [{'name': 'Kafka', 'count': 1}, {'name': 'Python', 'count': 1}])
+        self.assertEqual(self.get('/api/projects/?technology=kafka').json()['count'], 1)
+        self.assert_reconciled()
+
+
+class ProficiencyFilterTests(PortfolioTestCase):
+    """Skills filter and sort on their proficiency rank"""
+
+    def setUp(self):
+        super().setUp()
+        self.add_skills(('Python', 'programming', 'expert'), ('Go', 'programming', 'beginner'),
+                        ('Docker', 'tools', 'advanced'), ('Git', 'tools', 'intermediate'))
+
+    def names(self, url):
+        return [row['name'] for row in self.get(url).json()['results']]
+
+    def test_min_proficiency(self):
+        self.assertEqual(sorted(self.names('/api/skills/?min_proficiency=advanced')), ['Docker', 'Python'])
+
+    def test_ordering(self):
+        self.assertEqual(self.names('/api/skills/?ordering=-proficiency'), ['Python', 'Docker', 'Git', 'Go'])
+        self.assertEqual(self.names('/api/skills/?ordering=proficiency'), ['Go', 'Git', 'Docker', 'Python'])
+
+    def test_top(self):
+        self.assertEqual(self.names('/api/skills/top/'), ['Python', 'Docker'])
+        self.assertEqual(self.names('/api/skills/top/?limit=1'), ['Python'])
+        self.assertEqual(self.names('/api/skills/top/?min_proficiency=intermediate'), ['Python', 'Docker', 'Git'])
+
+    def test_unknown_level(self):
+        self.assertEqual(self.get('/api/skills/?min_proficiency=guru').status_code, 400)
+
+
+class ExportTests(PortfolioTestCase):
+    """Exports stream every matching row, as NDJSON or CSV"""
+
+    def setUp(self):
+        super().setUp()
+        self.add_skills(('Python', 'programming', 'expert'), ('Docker', 'tools', 'advanced'))
+
+    def body(self, url):
+        response = self.client.get(url, secure=True)
+        self.assertEqual(response.status_code, 200)
+        return b''.join(response.streaming_content).decode()
+
+    def test_ndjson(self):
+        rows = [json.loads(line) for line in self.body('/api/skills/export/').splitlines()]
+        self.assertEqual([row['name'] for row in rows], ['Python', 'Docker'])
+        self.assertEqual({row['profile'] for row in rows}, {self.profile.pk})
+
+    def test_csv_with_filter(self):
+        rows = list(csv.DictReader(io.StringIO(self.body('/api/skills/export/?output=csv&category=tools'))))
+        self.assertEqual([(row['name'], row['proficiency']) for row in rows], [('Docker', 'advanced')])
+
+
+class AutocompleteTests(PortfolioTestCase):
+    """Suggestions come from the in-process index, patched by writes instead of rebuilt"""
+
+    def suggestions(self, prefix):
+        return [(row['value'], row['type']) for row in self.get(f'/api/autocomplete/?q={prefix}').json()['results']]
+
+    def test_patched_after_save(self):
+        self.add_skills(('Python', 'programming', 'expert'))
+        self.assertEqual(self.suggestions('py'), [('Python', 'skill')])
+
+        with mock.patch.object(AutocompleteIndex, 'load') as load:
+            self.add_skills(('PyTorch', 'frameworks', 'beginner'))
+            self.assertEqual(self.suggestions('py'), [('Python', 'skill'), ('PyTorch', 'skill')])
+            with self.captureOnCommitCallbacks(execute=True):
+                Skill.objects.get(name='Python').delete()
+            self.assertEqual(self.suggestions('py'), [('PyTorch', 'skill')])
+        load.assert_not_called()
+
+    def test_word_prefix(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            WorkExperience.objects.create(profile=self.profile, company='Acme Robotics', role='Engineer',
+                                          start_date=date(2022, 1, 1))
+        self.assertEqual(self.suggestions('rob'), [('Acme Robotics', 'company')])
+
+
+@unittest.skipIf(np is None, 'job matching needs numpy')
+class MatchTests(PortfolioTestCase):
+    """Job descriptions are scored against the profile's skills, projects and experience"""
+
+    def setUp(self):
+        super().setUp()
+        self.add_skills(('Python', 'programming', 'expert'))
+        with self.captureOnCommitCallbacks(execute=True):
+            Project.objects.create(profile=self.profile, title='Search', description='Search engine in Django',
+                                   technologies=['Python', 'Django'], start_date=date(2021, 1, 1))
+
+    def test_match(self):
+        data = self.post('/api/match/', {'description': 'Python and Django developer, Kubernetes a plus'}).json()
+        self.assertIn('python', data['matched_terms'])
+        self.assertIn('kubernetes', data['missing_terms'])
+        self.assertTrue(0 < data['score'] < 1)
+        self.assertEqual([project['title'] for project in data['projects']], ['Search'])
+
+    def test_description_required(self):
+        self.assertEqual(self.post('/api/match/', {}).status_code, 400)
+
+
+class TimelineTests(PortfolioTestCase):
+    """The timeline merges every dated collection into one newest-first feed"""
+
+    def setUp(self):
+        super().setUp()
+        Education.objects.create(profile=self.profile, institution='MUJ', degree='B.Tech',
+                                 field_of_study='IT', start_date=date(2019, 7, 1))
+        WorkExperience.objects.create(profile=self.profile, company='Acme', role='Engineer',
+                                      start_date=date(2022, 1, 1))
+        Project.objects.create(profile=self.profile, title='Search', description='Search engine',
+                               technologies=['Python'], start_date=date(2021, 3, 1))
+        Certification.objects.create(profile=self.profile, name='Django', issuer='IBM', issue_date=date(2023, 1, 1))
+        Certification.objects.create(profile=self.profile, name='Kafka', issuer='Confluent')
+        Achievement.objects.create(profile=self.profile, title='Hackathon', organization='MUJ',
+                                   date_achieved=date(2020, 6, 1))
+
+    def entries(self, url):
+        return [(row['type'], row['title']) for row in self.get(url).json()['results']]
+
+    def test_merge_order(self):
+        self.assertEqual(self.entries('/api/timeline/'), [
+            ('certification', 'Kafka'),
+            ('certification', 'Django'),
+            ('work', 'Engineer'),
+            ('project', 'Search'),
+            ('achievement', 'Hackathon'),
+            ('education', 'B.Tech'),
+        ])
+
+    def test_pages_and_filters(self):
+        pages = self.walk('/api/timeline/?page_size=4')
+        self.assertEqual([len(ids) for _, ids in pages], [4, 2])
+        self.assertEqual(self.entries('/api/timeline/?type=work,education&year_from=2020'), [('work', 'Engineer')])
@@ -0,0 +1,162 @@
+import base64
+import binascii
+import datetime
+import json
+from collections import OrderedDict
+from django.db import connection
+from django.db.models import CharField, DateField, F, Q, Value
+from rest_framework.exceptions import NotFound
+from .models import Education, WorkExperience, Project, Certification, Achievement
+from .pagination import KeysetPagination
+
+
+class TimelineSource:
+    """A model on the timeline: the date it sorts by and the fields shown for it"""
+
+    def __init__(self, model, date, title, subtitle, end_date=None):
+        self.model = model
+        self.date = date
+        self.title = title
+        self.subtitle = subtitle
+        self.end_date = end_date
+
+
+# Entry type -> source; each date is the leading key of a (profile, -date, id) index
+TIMELINE_SOURCES = OrderedDict([
+    ('education', TimelineSource(Education, 'start_date', 'degree', 'institution', end_date='end_date')),
+    ('work', TimelineSource(WorkExperience, 'start_date', 'role', 'company', end_date='end_date')),
+    ('project', TimelineSource(Project, 'start_date', 'title', 'status', end_date='end_date')),
+    ('certification', TimelineSource(Certification, 'issue_date', 'name', 'issuer', end_date='expiry_date')),
+    ('achievement', TimelineSource(Achievement, 'date_achieved', 'title', 'organization')),
+])
+TIMELINE_TYPES = list(TIMELINE_SOURCES)
+
+
+class TimelinePagination(KeysetPagination):
+    """
+    Keyset pagination of the merged timeline, newest first, ties broken by
+    type then id. As in KeysetPagination, an undated entry sorts as the
+    largest date, so the per-model DESC indexes apply as they are.
+
+    The cursor condition and the year range are applied inside every
+    branch of the UNION ALL, on the branch's own date column, so each
+    branch reads its (profile, -date, id) index from the boundary on; where
+    the database allows ordered, limited branches (PostgreSQL) each also
+    stops after a page. The database merges the branches and returns one
+    page of the combined order.
+    """
+
+    def branch(self, kind, profile_id, years=None, cursor=None, reverse=False, limit=None):
+        """One SELECT of the union: ``kind``'s rows of the profile after ``cursor``"""
+        source = TIMELINE_SOURCES[kind]
+        queryset = source.model.objects.filter(profile_id=profile_id)
+        if years is not None:
+            start, end = years
+            if start is not None:
+                queryset = queryset.filter(**{f'{source.date}__gte': datetime.date(start, 1, 1)})
+            if end is not None:
+                queryset = queryset.filter(**{f'{source.date}__lt': datetime.date(end + 1, 1, 1)})
+        if cursor is not None:
+            queryset = queryset.filter(self.after_cursor(source.date, kind, cursor, reverse))
+        end_date = F(source.end_date) if source.end_date else Value(None, output_field=DateField())
+        # Annotated in the same order in every branch, so the columns line up
+        queryset = queryset.annotate(
+            entry_type=Value(kind, output_field=CharField()),
+            entry_id=F('id'),
+            entry_date=F(source.date),
+            entry_end_date=end_date,
+            entry_title=F(source.title),
+            entry_subtitle=F(source.subtitle),
+        ).values('entry_type', 'entry_id', 'entry_date', 'entry_end_date', 'entry_title', 'entry_subtitle')
+        if limit is None:
+            # Meta.ordering is dropped; the union is ordered as a whole
+            return queryset.order_by()
+        return queryset.order_by(*self.order_by(reverse))[:limit]
+
+    def after_cursor(self, date_field, kind, cursor, reverse):
+        """
+        Q of a branch's rows after ``cursor`` = (date, type, id) in the
+        timeline order, or before it when paging backwards. The type is
+        constant within a branch, so only the date and id are compared in SQL.
+        """
+        date, cursor_kind, cursor_id = cursor
+        if kind == cursor_kind:
+            same_date = Q(id__lt=cursor_id) if reverse else Q(id__gt=cursor_id)
+        elif (kind > cursor_kind) != reverse:
+            same_date = Q()
+        else:
+            same_date = Q(pk__in=[])
+        # NULL sorts above every date
+        if date is None:
+            on_date = Q(**{f'{date_field}__isnull': True})
+            later = Q(pk__in=[]) if reverse else Q(**{f'{date_field}__isnull': False})
+            bound = on_date if reverse else Q()
+        else:
+            on_date = Q(**{date_field: date})
+            if reverse:
+                later = Q(**{f'{date_field}__gt': date}) | Q(**{f'{date_field}__isnull': True})
+                bound = Q(**{f'{date_field}__gte': date}) | Q(**{f'{date_field}__isnull': True})
+            else:
+                later = Q(**{f'{date_field}__lt': date})
+                bound = Q(**{f'{date_field}__lte': date})
+        # The plain date bound (implied by the rest) is what the index range starts from
+        return (later | (on_date & same_date)) & bound
+
+    def order_by(self, reverse):
+        if reverse:
+            return [F('entry_date').asc(nulls_last=True), F('entry_type').desc(), F('entry_id').desc()]
+        return [F('entry_date').desc(nulls_first=True), F('entry_type').asc(), F('entry_id').asc()]
+
+    def decode_cursor(self, encoded):
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+            date, kind, entry_id = payload['v']
+            if kind not in TIMELINE_SOURCES:
+                raise ValueError
+            date = None if date is None else datetime.date.fromisoformat(date)
+            return (date, kind, int(entry_id)), bool(payload['r'])
+        except (TypeError, ValueError, KeyError, binascii.Error):
+            raise NotFound('Invalid cursor')
+
+    def paginate(self, request, profile_id, kinds=None, years=None):
+        """One page of timeline rows (dicts) for the profile, in timeline order"""
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        encoded = request.query_params.get(self.cursor_query_param)
+        cursor, reverse = self.decode_cursor(encoded) if encoded else (None, False)
+
+        kinds = kinds or TIMELINE_TYPES
+        limit = None
+        if len(kinds) > 1 and connection.features.supports_slicing_ordering_in_compound:
+            limit = self.page_size + 1
+        branches = [self.branch(kind, profile_id, years, cursor, reverse, limit) for kind in kinds]
+        union = branches[0].union(*branches[1:], all=True) if len(branches) > 1 else branches[0]
+        rows = list(union.order_by(*self.order_by(reverse))[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if reverse:
+            rows.reverse()
+
+        self.next_cursor = None
+        self.previous_cursor = None
+        if rows:
+            if has_more or reverse:
+                self.next_cursor = self.encode_cursor(self.row_key(rows[-1]), False)
+            if (reverse and has_more) or (encoded and not reverse):
+                self.previous_cursor = self.encode_cursor(self.row_key(rows[0]), True)
+        return [self.render(row) for row in rows]
+
+    @staticmethod
+    def row_key(row):
+        return [row['entry_date'], row['entry_type'], row['entry_id']]
+
+    @staticmethod
+    def render(row):
+        return {
+            'type': row['entry_type'],
+            'id': row['entry_id'],
+            'date': row['entry_date'],
+            'end_date': row['entry_end_date'],
+            'title': row['entry_title'],
+            'subtitle': row['entry_subtitle'],
+        }
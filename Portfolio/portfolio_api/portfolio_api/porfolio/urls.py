@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from . import views
+from . import views, async_views
 
 # Create a router and register our viewsets
 router = DefaultRouter()
@@ -21,7 +21,15 @@ urlpatterns = [
     
     # Custom endpoints
     path('api/search/', views.search, name='search'),
+    path('api/autocomplete/', views.autocomplete, name='autocomplete'),
+    path('api/match/', views.match, name='match'),
+    path('api/timeline/', views.timeline, name='timeline'),
     path('api/stats/', views.stats, name='stats'),
+    path('api/cache-metrics/', views.cache_metrics, name='cache_metrics'),
+
+    # Async variants (concurrent per-source queries; serve via asgi.py)
+    path('api/search/async/', async_views.search, name='search_async'),
+    path('api/stats/async/', async_views.stats, name='stats_async'),
 ]
 
 # URL Patterns Documentation:
@@ -38,27 +46,43 @@ Available API Endpoints:
    PUT /api/profiles/{id}/ - Update profile
    DELETE /api/profiles/{id}/ - Delete profile
    GET /api/profiles/{id}/summary/ - Get profile summary with stats
-   GET /api/profiles/me/ - Get main profile
+   GET /api/profiles/me/ - Get the current profile (see "Profile selection" below)
+   GET /api/profiles/{id}/?expand=projects,skills - Profile fields plus only the listed collections
+   GET /api/profiles/{id}/?fields=name,email,projects.title - Only the listed fields
+       (?fields= and ?expand= also apply to the list and me endpoints)
 
 3. Skills:
    GET /api/skills/ - List all skills
    GET /api/skills/?category={category} - Filter by category
    GET /api/skills/?proficiency={level} - Filter by proficiency
-   GET /api/skills/top/ - Get top skills (advanced/expert)
-   GET /api/skills/categories/ - Get skills grouped by category
+   GET /api/skills/?min_proficiency={level}&max_proficiency={level} - Filter by a range of levels
+       (beginner < intermediate < advanced < expert)
+   GET /api/skills/?ordering=-proficiency - Best first (or ?ordering=proficiency)
+   GET /api/skills/top/ - Get the current profile's top skills (advanced/expert), best first
+   GET /api/skills/top/?limit=10 - 10 per page
+   GET /api/skills/top/?per_category=3 - The best 3 of each category
+       (?min_proficiency={level} lowers or raises the advanced threshold)
+   GET /api/skills/categories/ - Get the current profile's skills grouped by category
+       in one query (?limit=N keeps each category's N best skills, ?counts=true adds each category's total)
+   GET /api/skills/{id}/projects/ - Get the projects that use this skill
    POST /api/skills/ - Create new skill
    PUT /api/skills/{id}/ - Update skill
    DELETE /api/skills/{id}/ - Delete skill
+   POST /api/skills/bulk/ - Create or update many skills (keyed on profile + name)
 
 4. Projects:
    GET /api/projects/ - List all projects
-   GET /api/projects/?skill={technology} - Filter by technology
+   GET /api/projects/?skill={technology} - Filter by technology (case-insensitive substring)
+   GET /api/projects/?technology={name} - Filter by exact technology name (case-insensitive)
    GET /api/projects/?status={status} - Filter by status
-   GET /api/projects/featured/ - Get featured projects
-   GET /api/projects/technologies/ - Get technology usage stats
+   GET /api/projects/featured/ - Get the current profile's featured projects
+   GET /api/projects/technologies/ - Get the current profile's technology usage stats
+   (top, featured, technologies and skills/{id}/projects are paginated like the lists:
+   ?page=, ?pagination=cursor, and ?page_size= or its alias ?limit=, at most 100)
    POST /api/projects/ - Create new project
    PUT /api/projects/{id}/ - Update project
    DELETE /api/projects/{id}/ - Delete project
+   POST /api/projects/bulk/ - Create many projects (items with an id update it)
 
 5. Education:
    GET /api/education/ - List education records
@@ -78,6 +102,9 @@ Available API Endpoints:
    PUT /api/certifications/{id}/ - Update certification
    DELETE /api/certifications/{id}/ - Delete certification
 
+Education, work experience, certifications and achievements accept the same
+   POST /api/{collection}/bulk/ list payloads as projects.
+
 8. Achievements:
    GET /api/achievements/ - List achievements
    POST /api/achievements/ - Create achievement
@@ -85,13 +112,68 @@ Available API Endpoints:
    DELETE /api/achievements/{id}/ - Delete achievement
 
 9. Search & Analytics:
-   GET /api/search/?q={query} - Global search across all content
-   GET /api/stats/ - Get overall profile statistics
+   GET /api/search/?q={query} - Ranked full-text search across the current profile's content
+   GET /api/search/?q={query}&page={n}&page_size={size} - Paginate each result type
+   GET /api/autocomplete/?q={prefix} - Suggestions for a search box: skills, technologies,
+       project titles, companies and institutions starting with (a word starting with) the prefix;
+       ?limit= (default 10, at most 50), ?types=skill,technology,project,company,institution
+   POST /api/match/ {"description": "<job description>"} - How well the profile fits a job:
+       "score" (share of the description's weighted terms the profile covers), matched and
+       missing terms, and the best matching skills, projects and work experience
+       ("limit", default 5, at most 20 of each; needs numpy)
+   GET /api/timeline/ - Education, work experience, projects, certifications and achievements
+       in one feed, newest first (undated entries first), keyset paginated: follow 'next';
+       ?type=education,work,project,certification,achievement, ?year_from=2019&year_to=2022,
+       ?page_size= or ?limit= (at most 100)
+   GET /api/stats/ - Get the current profile's statistics
+   GET /api/cache-metrics/ - Response cache hit/miss counters (per worker)
+   GET /api/search/async/?q={query} - Search with all sources queried concurrently;
+       sources slower than the timeout are left out and the response has "partial": true
+   GET /api/stats/async/ - Statistics with counters and technologies fetched concurrently
+
+Profile selection:
+   profiles/me, skills/top, skills/categories, projects/featured,
+   projects/technologies, search, autocomplete, match, timeline and stats
+   (and their async variants) serve one profile: ?profile={slug} if given
+   (404 if unknown), else the profile whose host matches the request's Host
+   header, else the first profile.
+   Slugs are generated from the name on save; set host to serve a profile
+   from its own domain (it must also be in ALLOWED_HOSTS).
+
+Technologies:
+   Project.technologies stays the editable list; saving a project keeps its
+   Technology links and the per-profile counts behind projects/technologies
+   current. After bulk imports or upgrading an existing database, run
+   python manage.py rebuild_technologies.
+
+Exports:
+   GET /api/{skills,projects,education,work-experience,certifications,achievements}/export/
+       - Stream every row as NDJSON, or CSV with ?output=csv, with a profile id column
+       (accepts the same filters as the list, e.g. /api/projects/export/?status=completed)
+   Rows stream from a server-side cursor in id order, so memory stays flat for any size.
+
+Counters:
+   Profile keeps its stats counters and summary top skills in columns updated
+   from the child save/delete signals, so summary and stats run no aggregates.
+   python manage.py reconcile_counters fixes any drift (--dry-run only reports
+   it and exits non-zero); run it periodically and after raw SQL writes.
+
+Snapshots:
+   python manage.py export_snapshots renders profiles/me, profiles/{id}/,
+   profiles/{id}/summary/, skills/top, skills/categories, projects/featured,
+   projects/technologies and stats (for the default profile) to
+   STATIC_ROOT/snapshots/ (with .gz/.br).
+   Plain GETs of those paths are then served from the files (X-Snapshot: HIT)
+   until a write marks them stale; /static/snapshots/manifest.json lists the
+   content-hashed files, which are cached forever. SnapshotMiddleware serves
+   /static/snapshots/ itself (WhiteNoise only sees files present at startup).
 
 Example Queries:
 - /api/projects?skill=python
 - /api/skills/top
+- /api/stats/?profile=jane-doe
 - /api/search?q=AI
 - /api/projects/technologies
 - /api/skills?category=programming
+- /api/projects/?pagination=cursor&page_size=50 (keyset pagination; follow 'next')
 """
\ No newline at end of file
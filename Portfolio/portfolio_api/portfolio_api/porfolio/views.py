@@ -1,23 +1,83 @@
+from itertools import groupby
+from operator import itemgetter
 from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from django.db.models import Q, Count
 from django.http import JsonResponse
-from .models import Profile, Education, Skill, Project, WorkExperience, Certification, Achievement
+from django.views.decorators.http import require_GET
+from django.conf import settings
+from .models import (
+    Profile, Education, Skill, Project, WorkExperience, Certification, Achievement,
+    Technology, ProjectTechnology
+)
 from .serializers import (
     ProfileSerializer, ProfileSummarySerializer, EducationSerializer,
     SkillSerializer, ProjectSerializer, WorkExperienceSerializer,
     CertificationSerializer, AchievementSerializer
 )
+from .prefetch import build_prefetch_plan
+from .shaping import ResponseShape
+from .autocomplete import SUGGESTION_TYPES, autocomplete_index
+from .matching import match_index, np
+from .timeline import TIMELINE_TYPES, TimelinePagination
+from .aggregates import (
+    PROFILE_TECHNOLOGY_ORDERING, build_stats, profile_technologies, top_skills_per_category
+)
+from .search import get_search_backend
+from .cache import response_cache, cache_header
+from .resolver import profile_resolver
+from .conditional import ConditionalGetMixin, cache_version, conditional_response
+from .bulk import BulkUpsertMixin
+from .export import StreamingExportMixin
+from .instrumentation import ServerTimingMixin
+from .fast_serializers import ValuesListMixin, serialize_values, values_serializer
+from .pagination import PaginatedActionMixin
 
 @api_view(['GET'])
 def health_check(request):
     """Health check endpoint"""
     return Response({"status": "ok"}, status=status.HTTP_200_OK)
 
-class ProfileViewSet(viewsets.ModelViewSet):
+class ProfileViewSet(ServerTimingMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Profile.objects.all()
     serializer_class = ProfileSerializer
+    # Actions that render the full nested ProfileSerializer
+    prefetch_actions = ('list', 'retrieve', 'me', 'update', 'partial_update')
+
+    def get_shape(self):
+        """ResponseShape requested with ?fields= / ?expand= on reads, else None"""
+        if not hasattr(self, '_shape'):
+            self._shape = None
+            if self.request.method in ('GET', 'HEAD'):
+                self._shape = ResponseShape.from_request(self.request, ProfileSerializer)
+        return self._shape
+
+    def get_queryset(self):
+        queryset = Profile.objects.order_by('id')
+        if self.action in self.prefetch_actions:
+            # Only prefetch the collections the response will embed
+            shape = self.get_shape()
+            relations = shape.relations if shape is not None else None
+            queryset = queryset.prefetch_related(*build_prefetch_plan(ProfileSerializer, fields=relations))
+        return queryset
+
+    def get_serializer(self, *args, **kwargs):
+        if self.get_serializer_class() is ProfileSerializer:
+            kwargs.setdefault('shape', self.get_shape())
+        return super().get_serializer(*args, **kwargs)
+
+    def get_version(self, request, *args, **kwargs):
+        # Profile payloads embed every child collection, whose writes bump the profile's version
+        pk = kwargs.get('pk')
+        if pk is None:
+            if self.action == 'me':
+                return cache_version(profile_resolver.resolve(request))
+            return cache_version()
+        if not str(pk).isdigit():
+            return super().get_version(request, *args, **kwargs)
+        return cache_version(int(pk))
 
     @action(detail=True, methods=['get'])
     def summary(self, request, pk=None):
@@ -28,63 +88,193 @@ class ProfileViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def me(self, request):
-        """Get the main profile (assuming single user system)"""
+        """Get the profile addressed by ?profile=<slug> or the request host (default: the first profile)"""
+        shape = self.get_shape()
         try:
-            profile = Profile.objects.first()
-            if not profile:
+            profile_id = profile_resolver.resolve(request)
+            if profile_id is None:
+                return Response({"error": "Profile not found"}, status=404)
+
+            def build():
+                profile = self.get_queryset().filter(pk=profile_id).first()
+                return ProfileSerializer(profile, shape=shape).data if profile else None
+
+            params = shape.params if shape is not None else None
+            data, hit = response_cache.get_or_build('profile_me', build, profile_id=profile_id, params=params)
+            if data is None:
                 return Response({"error": "Profile not found"}, status=404)
-            serializer = ProfileSerializer(profile)
-            return Response(serializer.data)
+            return Response(data, headers=cache_header(hit))
         except Exception as e:
             return Response({"error": str(e)}, status=500)
 
-class SkillViewSet(viewsets.ModelViewSet):
+# Cap on ?limit= and ?per_category= in the skill actions
+MAX_LIMIT = 100
+
+def proficiency_rank_param(request, name):
+    """Skill.proficiency_rank of the level named by query parameter ``name``, or None if absent"""
+    level = request.query_params.get(name)
+    if not level:
+        return None
+    if level not in Skill.PROFICIENCY_RANKS:
+        raise ValidationError({name: [f"Unknown proficiency '{level}'; expected one of "
+                                      f"{', '.join(Skill.PROFICIENCY_RANKS)}"]})
+    return Skill.PROFICIENCY_RANKS[level]
+
+def positive_int_param(request, name, maximum):
+    """Integer query parameter ``name`` capped at ``maximum``, or None if absent; raises ValueError if invalid"""
+    raw = request.query_params.get(name)
+    if raw is None:
+        return None
+    value = int(raw)
+    if value < 1:
+        raise ValueError(name)
+    return min(value, maximum)
+
+class SkillViewSet(ServerTimingMixin, ValuesListMixin, BulkUpsertMixin, StreamingExportMixin, PaginatedActionMixin,
+                   ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Skill.objects.all()
     serializer_class = SkillSerializer
+    profile_actions = ('top', 'categories')
+    # ?ordering= values and the keys they sort by (the default is Meta.ordering)
+    orderings = {
+        'proficiency': ['proficiency_rank', 'category', 'name'],
+        '-proficiency': ['-proficiency_rank', 'category', 'name'],
+    }
+
+    @property
+    def keyset_ordering(self):
+        ordering = self.request.query_params.get('ordering')
+        if ordering and ordering not in self.orderings:
+            raise ValidationError({'ordering': [f"Unknown ordering '{ordering}'; expected one of "
+                                                f"{', '.join(self.orderings)}"]})
+        return self.orderings.get(ordering)
 
     def get_queryset(self):
         queryset = Skill.objects.all()
         category = self.request.query_params.get('category')
         proficiency = self.request.query_params.get('proficiency')
+        min_rank = proficiency_rank_param(self.request, 'min_proficiency')
+        max_rank = proficiency_rank_param(self.request, 'max_proficiency')
         
         if category:
             queryset = queryset.filter(category=category)
+        # Levels are matched on the indexed rank; unknown names match nothing
         if proficiency:
-            queryset = queryset.filter(proficiency=proficiency)
+            queryset = queryset.filter(proficiency_rank=Skill.PROFICIENCY_RANKS.get(proficiency, -1))
+        if min_rank is not None:
+            queryset = queryset.filter(proficiency_rank__gte=min_rank)
+        if max_rank is not None:
+            queryset = queryset.filter(proficiency_rank__lte=max_rank)
+        if self.keyset_ordering:
+            queryset = queryset.order_by(*self.keyset_ordering, 'id')
             
         return queryset
 
+    @action(detail=True, methods=['get'])
+    def projects(self, request, pk=None):
+        """Get the projects of the skill's profile that use this skill"""
+        skill = self.get_object()
+        projects = Project.objects.none()
+        if skill.technology_id is not None:
+            projects = Project.objects.filter(
+                technology_links__technology_id=skill.technology_id,
+                technology_links__profile_id=skill.profile_id,
+            )
+        serializer = values_serializer(ProjectSerializer)
+        return self.paginated_action('skill_projects', serializer.values(projects), Project._meta.ordering,
+                                     serializer.many, profile_id=skill.profile_id)
+
     @action(detail=False, methods=['get'])
     def top(self, request):
-        """Get top skills (advanced/expert level)"""
-        top_skills = Skill.objects.filter(proficiency__in=['advanced', 'expert'])
-        serializer = SkillSerializer(top_skills, many=True)
-        return Response(serializer.data)
+        """Get the profile's top skills (advanced and above), best first, a page at a time"""
+        profile_id = profile_resolver.resolve(request)
+        if profile_id is None:
+            return Response({"error": "Profile not found"}, status=404)
+        try:
+            per_category = positive_int_param(request, 'per_category', MAX_LIMIT)
+        except ValueError:
+            return Response({"error": "'per_category' must be a positive integer"}, status=400)
+        min_rank = proficiency_rank_param(request, 'min_proficiency')
+        if min_rank is None:
+            min_rank = Skill.PROFICIENCY_RANKS[Skill.TOP_PROFICIENCY]
+
+        # A range scan of the (profile, -proficiency_rank, ...) index, stopping at the page size
+        top_skills = Skill.objects.filter(profile_id=profile_id, proficiency_rank__gte=min_rank)
+        ordering = ['-proficiency_rank', 'category', 'name']
+        if per_category is not None:
+            # Windowed in a subquery, so page filters apply after the per-category cut
+            top_skills = Skill.objects.filter(pk__in=top_skills_per_category(top_skills, per_category).values('pk'))
+            ordering = ['category', '-proficiency_rank', 'name']
+        serializer = values_serializer(SkillSerializer)
+        return self.paginated_action('skills_top', serializer.values(top_skills), ordering, serializer.many,
+                                     profile_id=profile_id)
 
     @action(detail=False, methods=['get'])
     def categories(self, request):
-        """Get skills grouped by category"""
-        categories = {}
-        for choice in Skill.CATEGORY_CHOICES:
-            category_key, category_name = choice
-            skills = Skill.objects.filter(category=category_key)
-            categories[category_key] = {
-                'name': category_name,
-                'skills': SkillSerializer(skills, many=True).data
-            }
-        return Response(categories)
-
-class ProjectViewSet(viewsets.ModelViewSet):
+        """Get the profile's skills grouped by category, in one query"""
+        profile_id = profile_resolver.resolve(request)
+        if profile_id is None:
+            return Response({"error": "Profile not found"}, status=404)
+        try:
+            limit = positive_int_param(request, 'limit', MAX_LIMIT)
+        except ValueError:
+            return Response({"error": "'limit' must be a positive integer"}, status=400)
+        with_counts = request.query_params.get('counts', '').lower() in ('1', 'true', 'yes')
+
+        def build():
+            serializer = values_serializer(SkillSerializer)
+            columns = list(serializer.columns)
+            skills = Skill.objects.filter(profile_id=profile_id)
+            if limit is not None:
+                # Totals come from a COUNT() window in the same query, before the cut
+                skills = top_skills_per_category(skills, limit, with_totals=with_counts)
+                if with_counts:
+                    columns.append('category_total')
+            else:
+                skills = skills.order_by('category', 'name')
+
+            # One query, ordered by category, grouped in a single pass
+            steps = serializer.bound_steps()
+            grouped = {}
+            for category_key, rows in groupby(skills.values(*columns), key=itemgetter('category')):
+                rows = list(rows)
+                total = rows[0]['category_total'] if limit is not None and with_counts else len(rows)
+                grouped[category_key] = ([serializer.to_representation(row, steps) for row in rows], total)
+
+            categories = {}
+            for category_key, category_name in Skill.CATEGORY_CHOICES:
+                category_skills, total = grouped.get(category_key, ([], 0))
+                categories[category_key] = {
+                    'name': category_name,
+                    'skills': category_skills
+                }
+                if with_counts:
+                    categories[category_key]['count'] = total
+            return categories
+
+        params = {'limit': limit, 'counts': with_counts} if limit is not None or with_counts else None
+        data, hit = response_cache.get_or_build('skills_categories', build, profile_id=profile_id, params=params)
+        return Response(data, headers=cache_header(hit))
+
+class ProjectViewSet(ServerTimingMixin, ValuesListMixin, BulkUpsertMixin, StreamingExportMixin, PaginatedActionMixin,
+                     ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Project.objects.all()
     serializer_class = ProjectSerializer
+    profile_actions = ('featured', 'technologies')
 
     def get_queryset(self):
         queryset = Project.objects.all()
         skill = self.request.query_params.get('skill')
+        technology = self.request.query_params.get('technology')
         status_filter = self.request.query_params.get('status')
         
+        # Both match the small technology table, then follow the indexed links
         if skill:
-            queryset = queryset.filter(technologies__icontains=skill)
+            links = ProjectTechnology.objects.filter(technology__key__contains=Technology.canonical(skill))
+            queryset = queryset.filter(pk__in=links.values('project_id'))
+        if technology:
+            links = ProjectTechnology.objects.filter(technology__key=Technology.canonical(technology))
+            queryset = queryset.filter(pk__in=links.values('project_id'))
         if status_filter:
             queryset = queryset.filter(status=status_filter)
             
@@ -92,150 +282,244 @@ class ProjectViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def featured(self, request):
-        """Get featured projects (those with achievements)"""
-        featured = Project.objects.exclude(achievements='')
-        serializer = ProjectSerializer(featured, many=True)
-        return Response(serializer.data)
+        """Get the profile's featured projects (those with achievements)"""
+        profile_id = profile_resolver.resolve(request)
+        if profile_id is None:
+            return Response({"error": "Profile not found"}, status=404)
+        featured = Project.objects.filter(profile_id=profile_id).exclude(achievements='')
+        serializer = values_serializer(ProjectSerializer)
+        return self.paginated_action('project_featured', serializer.values(featured), Project._meta.ordering,
+                                     serializer.many, profile_id=profile_id)
 
     @action(detail=False, methods=['get'])
     def technologies(self, request):
-        """Get all technologies used across projects"""
-        projects = Project.objects.all()
-        all_technologies = []
-        for project in projects:
-            all_technologies.extend(project.technologies)
-        
-        # Count occurrences and return sorted list
-        tech_counts = {}
-        for tech in all_technologies:
-            tech_counts[tech] = tech_counts.get(tech, 0) + 1
-        
-        sorted_techs = sorted(tech_counts.items(), key=lambda x: x[1], reverse=True)
-        return Response([{"name": tech, "count": count} for tech, count in sorted_techs])
+        """Get all technologies used across the profile's projects"""
+        profile_id = profile_resolver.resolve(request)
+        if profile_id is None:
+            return Response({"error": "Profile not found"}, status=404)
+
+        technologies = profile_technologies(profile_id).values('technology__name', 'project_count')
+        return self.paginated_action(
+            'project_technologies', technologies, PROFILE_TECHNOLOGY_ORDERING,
+            lambda page: [{"name": row['technology__name'], "count": row['project_count']} for row in page],
+            profile_id=profile_id,
+        )
 
-class EducationViewSet(viewsets.ModelViewSet):
+class EducationViewSet(ServerTimingMixin, ValuesListMixin, BulkUpsertMixin, StreamingExportMixin, ConditionalGetMixin,
+                       viewsets.ModelViewSet):
     queryset = Education.objects.all()
     serializer_class = EducationSerializer
 
-class WorkExperienceViewSet(viewsets.ModelViewSet):
+class WorkExperienceViewSet(ServerTimingMixin, ValuesListMixin, BulkUpsertMixin, StreamingExportMixin, ConditionalGetMixin,
+                            viewsets.ModelViewSet):
     queryset = WorkExperience.objects.all()
     serializer_class = WorkExperienceSerializer
 
-class CertificationViewSet(viewsets.ModelViewSet):
+class CertificationViewSet(ServerTimingMixin, ValuesListMixin, BulkUpsertMixin, StreamingExportMixin, ConditionalGetMixin,
+                           viewsets.ModelViewSet):
     queryset = Certification.objects.all()
     serializer_class = CertificationSerializer
 
-class AchievementViewSet(viewsets.ModelViewSet):
+class AchievementViewSet(ServerTimingMixin, ValuesListMixin, BulkUpsertMixin, StreamingExportMixin, ConditionalGetMixin,
+                         viewsets.ModelViewSet):
     queryset = Achievement.objects.all()
     serializer_class = AchievementSerializer
 
+SEARCH_SERIALIZERS = {
+    'skills': SkillSerializer,
+    'projects': ProjectSerializer,
+    'education': EducationSerializer,
+    'work_experience': WorkExperienceSerializer,
+}
+MAX_SEARCH_PAGE_SIZE = 100
+
+def search_params(request):
+    """Return (page, page_size) for a search request; raises ValueError if they are not integers"""
+    page = max(int(request.GET.get('page', 1)), 1)
+    # ?limit= is accepted as an alias, as on the paginated actions
+    page_size = int(request.GET.get('page_size', request.GET.get('limit', settings.REST_FRAMEWORK['PAGE_SIZE'])))
+    return page, min(max(page_size, 1), MAX_SEARCH_PAGE_SIZE)
+
+def search_source(query, key, offset, page_size, profile_id=None):
+    """Rank and serialize one page of a single search source; returns (total, results)"""
+    total, hits = get_search_backend().search(query, key, offset, page_size, profile_id)
+    serialized = values_serializer(SEARCH_SERIALIZERS[key]).many([hit.instance for hit in hits])
+    for data, hit in zip(serialized, hits):
+        data['rank'] = hit.rank
+        data['highlight'] = hit.highlight
+    return total, serialized
+
 @api_view(['GET'])
 def search(request):
-    """Global search across skills, projects, and education"""
+    """Ranked full-text search across the profile's skills, projects, education and work experience"""
     query = request.GET.get('q', '').strip()
     
     if not query:
         return Response({"error": "Query parameter 'q' is required"}, status=400)
-    
-    # Search across multiple models
-    results = {
-        'skills': [],
-        'projects': [],
-        'education': [],
-        'work_experience': []
-    }
-    
-    # Search skills
-    skills = Skill.objects.filter(
-        Q(name__icontains=query) | 
-        Q(category__icontains=query)
-    )
-    results['skills'] = SkillSerializer(skills, many=True).data
-    
-    # Search projects
-    projects = Project.objects.filter(
-        Q(title__icontains=query) |
-        Q(description__icontains=query) |
-        Q(technologies__icontains=query)
-    )
-    results['projects'] = ProjectSerializer(projects, many=True).data
-    
-    # Search education
-    education = Education.objects.filter(
-        Q(institution__icontains=query) |
-        Q(degree__icontains=query) |
-        Q(field_of_study__icontains=query)
-    )
-    results['education'] = EducationSerializer(education, many=True).data
-    
-    # Search work experience
-    work = WorkExperience.objects.filter(
-        Q(company__icontains=query) |
-        Q(role__icontains=query) |
-        Q(description__icontains=query)
-    )
-    results['work_experience'] = WorkExperienceSerializer(work, many=True).data
-    
-    # Add metadata
-    total_results = sum(len(results[key]) for key in results.keys())
-    
-    return Response({
-        'query': query,
-        'total_results': total_results,
-        'results': results
-    })
+
+    try:
+        page, page_size = search_params(request)
+    except ValueError:
+        return Response({"error": "'page' and 'page_size' (or 'limit') must be integers"}, status=400)
+
+    profile_id = profile_resolver.resolve(request)
+    if profile_id is None:
+        return Response({"error": "Profile not found"}, status=404)
+
+    def build():
+        offset = (page - 1) * page_size
+        results = {}
+        counts = {}
+
+        # Each source is ranked and paginated independently
+        for key in SEARCH_SERIALIZERS:
+            counts[key], results[key] = search_source(query, key, offset, page_size, profile_id)
+
+        return Response({
+            'query': query,
+            'total_results': sum(counts.values()),
+            'page': page,
+            'page_size': page_size,
+            'counts': counts,
+            'results': results
+        })
+
+    return conditional_response(request, cache_version(profile_id), build)
 
 @api_view(['GET'])
 def stats(request):
-    """Get overall profile statistics"""
+    """Get statistics for the profile addressed by ?profile=<slug> or the request host"""
     try:
-        profile = Profile.objects.first()
-        if not profile:
+        profile_id = profile_resolver.resolve(request)
+        if profile_id is None:
             return Response({"error": "Profile not found"}, status=404)
-            
-        stats_data = {
-            'total_skills': profile.skills.count(),
-            'total_projects': profile.projects.count(),
-            'total_certifications': profile.certifications.count(),
-            'total_achievements': profile.achievements.count(),
-            'skills_by_category': {},
-            'projects_by_status': {},
-            'top_technologies': []
-        }
-        
-        # Skills by category
-        for choice in Skill.CATEGORY_CHOICES:
-            category_key, category_name = choice
-            count = profile.skills.filter(category=category_key).count()
-            if count > 0:
-                stats_data['skills_by_category'][category_key] = {
-                    'name': category_name,
-                    'count': count
-                }
-        
-        # Projects by status
-        for choice in Project.STATUS_CHOICES:
-            status_key, status_name = choice
-            count = profile.projects.filter(status=status_key).count()
-            if count > 0:
-                stats_data['projects_by_status'][status_key] = {
-                    'name': status_name,
-                    'count': count
-                }
-        
-        # Top technologies
-        projects = profile.projects.all()
-        tech_counts = {}
-        for project in projects:
-            for tech in project.technologies:
-                tech_counts[tech] = tech_counts.get(tech, 0) + 1
-        
-        sorted_techs = sorted(tech_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        stats_data['top_technologies'] = [
-            {"name": tech, "count": count} for tech, count in sorted_techs
-        ]
-        
-        return Response(stats_data)
+
+        def build():
+            profile = Profile.objects.filter(pk=profile_id).first()
+            return build_stats(profile) if profile else None
+
+        def respond():
+            stats_data, hit = response_cache.get_or_build('stats', build, profile_id=profile_id)
+            if stats_data is None:
+                return Response({"error": "Profile not found"}, status=404)
+            return Response(stats_data, headers=cache_header(hit))
+
+        return conditional_response(request, cache_version(profile_id), respond)
         
     except Exception as e:
-        return Response({"error": str(e)}, status=500)
\ No newline at end of file
+        return Response({"error": str(e)}, status=500)
+
+MAX_AUTOCOMPLETE_LIMIT = 50
+
+@require_GET
+def autocomplete(request):
+    """
+    Prefix suggestions from the profile's skills, technologies, project
+    titles, companies and institutions, served from an in-process index.
+
+    A plain Django view: DRF's negotiation and rendering would cost more
+    than the lookup itself, which never queries the database once warm.
+    """
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return JsonResponse({"error": "Query parameter 'q' is required"}, status=400)
+    try:
+        limit = min(max(int(request.GET.get('limit', 10)), 1), MAX_AUTOCOMPLETE_LIMIT)
+    except ValueError:
+        return JsonResponse({"error": "'limit' must be an integer"}, status=400)
+    kinds = None
+    if request.GET.get('types'):
+        kinds = set(request.GET['types'].split(','))
+        unknown = kinds - set(SUGGESTION_TYPES)
+        if unknown:
+            return JsonResponse({"error": f"Unknown types: {', '.join(sorted(unknown))}; "
+                                          f"expected {', '.join(SUGGESTION_TYPES)}"}, status=400)
+
+    profile_id = profile_resolver.resolve(request)
+    if profile_id is None:
+        return JsonResponse({"error": "Profile not found"}, status=404)
+    results = autocomplete_index.search(profile_id, query, limit, kinds)
+    return JsonResponse({'query': query, 'results': results})
+
+MAX_MATCH_LIMIT = 20
+MAX_MATCH_DESCRIPTION = 20000
+
+@api_view(['POST'])
+def match(request):
+    """
+    Score a job description against the profile's skills, projects and work
+    experience: {"description": "...", "limit": 5}.
+
+    Returns the share of the description's weighted terms the profile
+    covers, the matched and missing terms, and the best rows of each type
+    by TF-IDF cosine similarity (skills weighted by proficiency).
+    """
+    if np is None:
+        return Response({"error": "Job matching requires numpy"}, status=503)
+    description = request.data.get('description')
+    if not isinstance(description, str) or not description.strip():
+        return Response({"error": "'description' is required"}, status=400)
+    if len(description) > MAX_MATCH_DESCRIPTION:
+        return Response({"error": f"'description' must be at most {MAX_MATCH_DESCRIPTION} characters"}, status=400)
+    try:
+        limit = min(max(int(request.data.get('limit', 5)), 1), MAX_MATCH_LIMIT)
+    except (TypeError, ValueError):
+        return Response({"error": "'limit' must be an integer"}, status=400)
+
+    profile_id = profile_resolver.resolve(request)
+    if profile_id is None:
+        return Response({"error": "Profile not found"}, status=404)
+    return Response(match_index.match(profile_id, description, limit))
+
+def year_param(request, name):
+    """Year query parameter ``name``, or None if absent; raises ValueError if invalid"""
+    raw = request.query_params.get(name)
+    if raw is None:
+        return None
+    year = int(raw)
+    if not 1 <= year <= 9998:
+        raise ValueError(name)
+    return year
+
+@api_view(['GET'])
+def timeline(request):
+    """
+    Education, work experience, projects, certifications and achievements
+    merged newest first, one keyset page at a time from a single UNION ALL
+    query (?type=work,project, ?year_from=, ?year_to=, ?page_size=/?limit=).
+    """
+    kinds = None
+    if request.query_params.get('type'):
+        kinds = list(dict.fromkeys(request.query_params['type'].split(',')))
+        unknown = set(kinds) - set(TIMELINE_TYPES)
+        if unknown:
+            return Response({"error": f"Unknown types: {', '.join(sorted(unknown))}; "
+                                      f"expected {', '.join(TIMELINE_TYPES)}"}, status=400)
+    try:
+        years = (year_param(request, 'year_from'), year_param(request, 'year_to'))
+    except ValueError:
+        return Response({"error": "'year_from' and 'year_to' must be years"}, status=400)
+    if years == (None, None):
+        years = None
+
+    profile_id = profile_resolver.resolve(request)
+    if profile_id is None:
+        return Response({"error": "Profile not found"}, status=404)
+
+    def build():
+        paginator = TimelinePagination()
+        rows = paginator.paginate(request, profile_id, kinds, years)
+        return paginator.get_paginated_response(rows).data
+
+    def respond():
+        # The payload's next/previous links are absolute URLs of this request
+        params = {'url': request.build_absolute_uri()}
+        data, hit = response_cache.get_or_build('timeline', build, profile_id=profile_id, params=params)
+        return Response(data, headers=cache_header(hit))
+
+    return conditional_response(request, cache_version(profile_id), respond)
+
+@api_view(['GET'])
+def cache_metrics(request):
+    """Get response cache hit/miss counters for this worker process"""
+    return Response(response_cache.metrics())
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 import dj_database_url
 
@@ -20,12 +21,13 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'corsheaders',
-    'portfolio',  # Your main app
+    'portfolio.app.PortfolioConfig',  # Your main app
 ]
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'portfolio.snapshots.SnapshotMiddleware',  # Serves exported JSON snapshots; before WhiteNoise
     'whitenoise.middleware.WhiteNoiseMiddleware',  # For serving static files
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -33,6 +35,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'portfolio.instrumentation.InstrumentationMiddleware',  # Keep last (Server-Timing)
 ]
 
 ROOT_URLCONF = 'portfolio_api.urls'
@@ -90,6 +93,9 @@ USE_TZ = True
 STATIC_URL = '/static/'
 STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# Content-hashed collectstatic names are cached forever (SnapshotMiddleware does
+# the same for the JSON snapshots, which it serves itself)
+WHITENOISE_IMMUTABLE_FILE_TEST = r'^.+\.[0-9a-f]{12}\..+$'
 
 # Media files
 MEDIA_URL = '/media/'
@@ -100,10 +106,10 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 # REST Framework configuration
 REST_FRAMEWORK = {
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'portfolio.pagination.PortfolioPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'portfolio.renderers.FastJSONRenderer',
         'rest_framework.renderers.BrowsableAPIRenderer',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
@@ -111,6 +117,85 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Cache configuration. Response cache versions (and so ETags) live here, so
+# every worker and management command must share it: the default is a file
+# cache on this host; point CACHE_BACKEND/CACHE_LOCATION at Redis or
+# Memcached across hosts. A per-process backend (locmem) fails the system
+# checks outside DEBUG.
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.filebased.FileBasedCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', os.path.join(tempfile.gettempdir(), 'portfolio-api-cache')),
+    }
+}
+
+# Response cache for read-heavy endpoints (TTLs in seconds)
+PORTFOLIO_CACHE_ALIAS = 'default'
+PORTFOLIO_CACHE_TIMEOUTS = {
+    'profile_me': int(os.environ.get('CACHE_TTL_PROFILE', 300)),
+    'stats': int(os.environ.get('CACHE_TTL_STATS', 300)),
+    'skills_top': int(os.environ.get('CACHE_TTL_SKILLS', 300)),
+    'skills_categories': int(os.environ.get('CACHE_TTL_SKILLS', 300)),
+    'project_technologies': int(os.environ.get('CACHE_TTL_TECHNOLOGIES', 300)),
+}
+PORTFOLIO_CACHE_LOCK_TIMEOUT = 10
+# Seconds a "not found" result is cached, so waiters on the rebuild lock get it at once
+PORTFOLIO_CACHE_NEGATIVE_TIMEOUT = 10
+
+# How long (seconds) slug/host -> profile lookups stay cached; they are also
+# dropped whenever a profile is saved or deleted
+PORTFOLIO_RESOLVER_TIMEOUT = 3600
+
+# /api/autocomplete/ keeps in-process prefix indexes for this many profiles
+# per worker, reloading one at most this many seconds after it was built
+PORTFOLIO_AUTOCOMPLETE_PROFILES = 100
+PORTFOLIO_AUTOCOMPLETE_TTL = 300
+
+# /api/match/ keeps a TF-IDF matrix (needs numpy) of this many profiles per
+# worker, rebuilding one at most this many seconds after it was built
+PORTFOLIO_MATCH_PROFILES = 20
+PORTFOLIO_MATCH_TTL = 300
+
+# Full-text search backend for /api/search/ (defaults to PostgreSQL
+# SearchVector on postgres and an FTS5 virtual table on SQLite)
+PORTFOLIO_SEARCH_BACKEND = os.environ.get('PORTFOLIO_SEARCH_BACKEND') or None
+PORTFOLIO_SEARCH_CONFIG = 'english'
+
+# Pagination mode for list endpoints: 'page' (page numbers with counts) or
+# 'cursor' (keyset). Either can also be chosen per request with ?pagination=
+PORTFOLIO_PAGINATION_MODE = os.environ.get('PAGINATION_MODE', 'page')
+
+# Per-source time budget (seconds) for the async search/stats views; sources
+# that overrun or fail are dropped and the response is flagged "partial". On
+# PostgreSQL it is also each source query's statement_timeout (per statement)
+PORTFOLIO_ASYNC_SOURCE_TIMEOUT = float(os.environ.get('ASYNC_SOURCE_TIMEOUT', 2.0))
+
+# JSON snapshots (python manage.py export_snapshots, after collectstatic) are
+# written to STATIC_ROOT/<PORTFOLIO_SNAPSHOT_DIR> and served for plain GETs
+# until a write marks them stale; PORTFOLIO_SNAPSHOT_ON_WRITE re-exports in the
+# background PORTFOLIO_SNAPSHOT_DELAY seconds after a write
+PORTFOLIO_SNAPSHOT_DIR = 'snapshots'
+PORTFOLIO_SNAPSHOT_ON_WRITE = os.environ.get('SNAPSHOT_ON_WRITE', 'False').lower() == 'true'
+PORTFOLIO_SNAPSHOT_DELAY = int(os.environ.get('SNAPSHOT_DELAY', 5))
+
+# Request instrumentation: a sampled fraction of requests (0.0-1.0) gets a
+# Server-Timing header with SQL/serializer/render time; requests and queries
+# slower than the thresholds (ms) are logged to 'portfolio.performance'
+PORTFOLIO_TIMING_SAMPLE_RATE = float(os.environ.get('TIMING_SAMPLE_RATE', 1.0))
+PORTFOLIO_SLOW_REQUEST_MS = float(os.environ.get('SLOW_REQUEST_MS', 500))
+PORTFOLIO_SLOW_QUERY_MS = float(os.environ.get('SLOW_QUERY_MS', 100))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'portfolio.performance': {'handlers': ['console'], 'level': 'WARNING', 'propagate': False},
+    },
+}
+
 # CORS settings (for frontend integration)
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:3000",